@@ -0,0 +1,108 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /dev/benchmarks/ | Python 3.9.19
+
+"""
+GrowHub benchmark: import
+
+This script measures the cold-start import time of the firmware and API modules. Every sample
+imports one module in a fresh interpreter, as happens when the watchdog restarts the process.
+
+Reported metrics:
+    Import time (min/p50/max) of every measured module, in milliseconds.
+    With --importtime, the slowest imports of each module as reported by python -X importtime.
+
+Usage:
+    python dev/benchmarks/bench_import.py --repeat 20
+    python dev/benchmarks/bench_import.py --modules sensors acquisition --importtime
+    python dev/benchmarks/bench_import.py --json > bench_output.json
+"""
+
+
+# Standard library imports
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+# Third-party imports (venv)
+from typing import (
+    Dict,
+    List,
+    Tuple
+)
+
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+SOURCE_DIRS = [os.path.join(ROOT_DIR, 'src', 'firmware'), os.path.join(ROOT_DIR, 'src', 'api')]
+MODULES = ['exceptions', 'exceptions_api', 'api_client', 'i2c_bus', 'backends', 'cache', 'sensors', 'acquisition',
+           'timeseries', 'storage', 'metrics', 'scheduler', 'filters', 'readings_api', 'supervisor', 'breaker',
+           'uplink', 'collector_api']
+TIMER = "import time; start = time.perf_counter(); import {module}; print(time.perf_counter() - start)"
+
+
+def environment() -> Dict[str, str]:
+    """Returns the environment of the measured interpreters, with the source directories on the path."""
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join(SOURCE_DIRS + ([env['PYTHONPATH']] if env.get('PYTHONPATH') else []))
+    env.pop('PYTHONDONTWRITEBYTECODE', None)
+    return env
+
+
+def measure(module: str, repeat: int) -> List[float]:
+    """Imports a module in repeat fresh interpreters and returns the import times in seconds."""
+    samples = []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, '-c', TIMER.format(module=module)], env=environment(),
+                                capture_output=True, text=True, check=True)
+        samples.append(float(result.stdout.strip()))
+    return samples
+
+
+def slowest_imports(module: str, count: int) -> List[Tuple[str, int]]:
+    """Returns the slowest imports (name, cumulative microseconds) of a module, from python -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"], env=environment(),
+                            capture_output=True, text=True, check=True)
+    imports = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line[len('import time:'):].split('|')
+        imports.append((name.strip(), int(cumulative)))
+    return sorted(imports, key=lambda item: item[1], reverse=True)[:count]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the cold-start import time of the GrowHub modules.")
+    parser.add_argument('--modules', nargs='+', default=MODULES, help="Modules to measure (default: all)")
+    parser.add_argument('--repeat', type=int, default=10, help="Fresh interpreters per module (default: 10)")
+    parser.add_argument('--importtime', action='store_true', help="Also list the slowest imports of every module")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache, so the samples measure imports rather than compilation
+    for module in args.modules:
+        measure(module, 1)
+
+    results = {}
+    for module in args.modules:
+        samples = measure(module, args.repeat)
+        results[module] = {
+            'min_ms': min(samples) * 1000,
+            'p50_ms': statistics.median(samples) * 1000,
+            'max_ms': max(samples) * 1000
+        }
+        if args.importtime:
+            results[module]['slowest'] = slowest_imports(module, 5)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'module':<20}{'min ms':>10}{'p50 ms':>10}{'max ms':>10}")
+    for module, result in results.items():
+        print(f"{module:<20}{result['min_ms']:>10.2f}{result['p50_ms']:>10.2f}{result['max_ms']:>10.2f}")
+        for name, cumulative in result.get('slowest', []):
+            print(f"    {name:<32}{cumulative / 1000:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
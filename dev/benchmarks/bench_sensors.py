@@ -0,0 +1,208 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /dev/benchmarks/ | Python 3.9.19
+
+"""
+GrowHub benchmark: sensors
+
+This script measures the read throughput of the firmware sensor classes against the simulated
+I2C backend, so performance changes can be tracked on any Linux box without the hardware.
+
+Reported metrics:
+    Per-read latency (p50/p99) and reads per second of every read method of SensorAquatic,
+    SensorAtmospheric and SensorSoil, both from the bus (force_refresh) and through the read cache.
+    Latency of a filtered 5-sample read_burst() of every sensor.
+    Latency and temperature noise (standard deviation of unrounded samples) of every BME680 profile.
+    Sweep latency of a sequential full sweep versus an AcquisitionEngine sweep.
+    Engine sweep latency and multiplexer switches per sweep with 1, 2, 4 and 8 probe sets behind
+    the channels of a multiplexer.
+
+Usage:
+    python dev/benchmarks/bench_sensors.py --iterations 50 --scale 0.1 --jitter 0.002
+    python dev/benchmarks/bench_sensors.py --json > bench_output.json
+"""
+
+
+# Standard library imports
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+# Third-party imports (venv)
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Optional
+)
+# Codebase imports (firmware, API)
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+sys.path[:0] = [os.path.join(ROOT_DIR, 'src', 'firmware'), os.path.join(ROOT_DIR, 'src', 'api')]
+from acquisition import AcquisitionEngine  # noqa: E402
+from backends import FakeDevice, SimulatedBackend  # noqa: E402
+from sensors import ATMOSPHERIC_PROFILES, SensorAquatic, SensorAtmospheric, SensorSoil  # noqa: E402
+
+
+def percentile(samples: List[float], percent: float) -> float:
+    """Returns the nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = max(0, min(len(ordered) - 1, int(round(percent / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def summarize(samples: List[float], errors: int = 0) -> Dict[str, float]:
+    """Summarizes latency samples (in seconds) as milliseconds and operations per second."""
+    total = sum(samples)
+    return {
+        'count': len(samples),
+        'errors': errors,
+        'mean_ms': statistics.mean(samples) * 1000,
+        'p50_ms': percentile(samples, 50) * 1000,
+        'p99_ms': percentile(samples, 99) * 1000,
+        'ops_per_s': len(samples) / total if total else float('inf')
+    }
+
+
+def measure(function: Callable[[], object], iterations: int) -> Dict[str, float]:
+    """Calls a function repeatedly and summarizes its latency; exceptions are counted, not raised."""
+    samples, errors = [], 0
+    for _ in range(iterations):
+        start = time.perf_counter()
+        try:
+            function()
+        except Exception:  # Failed reads still count towards latency
+            errors += 1
+        samples.append(time.perf_counter() - start)
+    return summarize(samples, errors)
+
+
+def build_sensors(args: argparse.Namespace, backend: Optional[SimulatedBackend] = None, prefix: str = '') -> List:
+    """
+    Creates and connects the sensor set on a simulated backend, with all delays scaled by args.scale.
+
+    Args:
+        args (argparse.Namespace): The parsed arguments.
+        backend (SimulatedBackend): The backend of the sensors; a new one if None.
+        prefix (str): Prefix of the sensor names, to tell apart the sets of several backends.
+    """
+    if backend is None:
+        backend = SimulatedBackend(seed=args.seed, jitter=args.jitter * args.scale, failure_rate=args.failure_rate,
+                                   noise=args.noise)
+    sensors = [SensorAquatic(backend, name=f"{prefix}aquatic"), SensorAtmospheric(backend, name=f"{prefix}atmospheric"),
+               SensorSoil(backend, name=f"{prefix}soil")]
+    for sensor in sensors:
+        sensor.connect()
+        sensor.setup()
+        if isinstance(getattr(type(sensor), 'conversion_delay', None), dict):  # The BME680 delay follows its profile
+            sensor.conversion_delay = {key: value * args.scale for key, value in sensor.conversion_delay.items()}
+    device: FakeDevice
+    for device in backend.devices.values():
+        device.conversion_delay *= args.scale
+        device.transaction_delay *= args.scale
+    for mux in backend.muxes.values():
+        mux.transaction_delay = device.transaction_delay
+    return sensors
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """Runs every benchmark and returns the results keyed by benchmark name."""
+    sensors = build_sensors(args)
+    results = {}
+    for sensor in sensors:
+        for data_type in sensor.decimal_precision:
+            read = getattr(sensor, f"read_{data_type}")
+            results[f"{sensor.name}.read_{data_type}"] = measure(lambda: read(force_refresh=True), args.iterations)
+            results[f"{sensor.name}.read_{data_type}.cached"] = measure(read, args.iterations)
+        results[f"{sensor.name}.read_all"] = measure(sensor.read_all, args.iterations)
+        results[f"{sensor.name}.read_burst"] = measure(sensor.read_burst, args.iterations)
+
+    def sequential_sweep() -> None:
+        for sensor_ in sensors:
+            for data_type_ in sensor_.decimal_precision:
+                try:
+                    getattr(sensor_, f"read_{data_type_}")(force_refresh=True)
+                except Exception:  # A failed read does not abort the sweep
+                    pass
+
+    results['sweep.sequential'] = measure(sequential_sweep, args.iterations)
+    engine = AcquisitionEngine(sensors)
+    results['sweep.engine'] = measure(engine.sweep, args.iterations)
+    engine.close()
+    results.update(run_scaling(args))
+    results.update(run_profiles(args))
+    return results
+
+
+def run_scaling(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """Measures engine sweeps over 1, 2, 4 and 8 sensor sets, each behind a channel of one multiplexer."""
+    results = {}
+    for count in (1, 2, 4, 8):
+        root = SimulatedBackend(seed=args.seed, jitter=args.jitter * args.scale, failure_rate=args.failure_rate,
+                                noise=args.noise)
+        sensors = []
+        for channel in range(count):
+            sensors += build_sensors(args, root.channel(0x70, channel), prefix=f"ch{channel}.")
+        engine = AcquisitionEngine(sensors)
+        switches = root.muxes[0x70].switches
+        results[f"sweep.mux.{count}"] = result = measure(engine.sweep, args.iterations)
+        result['mux_switches'] = (root.muxes[0x70].switches - switches) / args.iterations
+        engine.close()
+    return results
+
+
+def run_profiles(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the read latency and temperature noise of every BME680 measurement profile.
+
+    The profile durations are computed from the sensor settings, so these runs use unscaled delays.
+    """
+    results = {}
+    for name, profile in ATMOSPHERIC_PROFILES.items():
+        backend = SimulatedBackend(seed=args.seed, noise=args.profile_noise)
+        sensor = SensorAtmospheric(backend, profile=name)
+        sensor.connect()
+        sensor.setup()
+        results[f"atmospheric.profile.{name}"] = result = measure(sensor.read_all, args.iterations)
+        burst = sensor.read_burst(samples=max(args.iterations, 2), method='mean', data_types=['temperature'],
+                                  mad_threshold=0)
+        result['duration_ms'] = profile.duration * 1000
+        result['temperature_stdev'] = burst['temperature'].variance ** 0.5
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the GrowHub sensor classes on the simulated backend.")
+    parser.add_argument('--iterations', type=int, default=20, help="Calls per benchmark (default: 20)")
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help="Factor applied to the simulated delays, e.g. 0.1 for a quick run; the BME680 "
+                             "measurement time follows its profile and is not scaled (default: 1.0)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="Maximum jitter in seconds (default: 0)")
+    parser.add_argument('--failure-rate', type=float, default=0.0, help="Bus transaction failure rate (default: 0)")
+    parser.add_argument('--noise', type=float, default=0.0, help="Noise on simulated values (default: 0)")
+    parser.add_argument('--profile-noise', type=float, default=0.1,
+                        help="Noise on simulated BME680 values at 1x oversampling, for the profile runs (default: 0.1)")
+    parser.add_argument('--seed', type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument('--json', action='store_true', help="Print the results as JSON")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'benchmark':<36}{'p50 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'errors':>8}")
+    for name, result in results.items():
+        print(f"{name:<36}{result['p50_ms']:>10.2f}{result['p99_ms']:>10.2f}{result['ops_per_s']:>10.1f}"
+              f"{result['errors']:>8}")
+    print(f"\n{'profile':<36}{'meas. ms':>10}{'p50 ms':>10}{'temp. sd':>10}")
+    for name, result in results.items():
+        if 'duration_ms' in result:
+            print(f"{name:<36}{result['duration_ms']:>10.1f}{result['p50_ms']:>10.2f}"
+                  f"{result['temperature_stdev']:>10.4f}")
+    print(f"\n{'multiplexer':<36}{'p50 ms':>10}{'switches':>10}")
+    for name, result in results.items():
+        if 'mux_switches' in result:
+            print(f"{name:<36}{result['p50_ms']:>10.2f}{result['mux_switches']:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
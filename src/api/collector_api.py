@@ -0,0 +1,305 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/api/ | Python 3.9.19
+
+"""
+GrowHub API endpoint: collector_api
+
+This module provides the reference fleet collector: an asyncio HTTP server ingesting the frames
+posted by the uplink queues (see uplink) of any number of GrowHub devices concurrently. Every
+connection is served by the event loop; frames are decompressed, parsed and handed to the sink on
+a thread pool, so a slow sink or a large frame of one device does not stall the others.
+
+A frame is acknowledged (200) only after the sink accepted its readings, so a collector crash
+between the two makes the device send the frame again. The collector keeps the highest sequence
+number acknowledged per device queue and acknowledges a frame at or below it without passing it
+to the sink again, which discards the duplicates of lost acknowledgements. The acknowledged
+sequence numbers are kept in memory: after a collector restart, delivery is at-least-once.
+The collector process writes the readings to the reading log of the device before acknowledging them.
+
+Endpoints:
+    POST /ingest    Ingests one frame (zlib-compressed JSON with Content-Encoding: deflate, or plain JSON).
+    GET /nodes      Status of every device seen: frames, readings, duplicates, last sequence and last seen time.
+
+Errors are returned as structured JSON like those of readings_api. Malformed frames are answered with
+400, which makes the device set the frame aside; sink errors with 500, which makes it retry.
+
+Classes:
+    NodeStatus: Ingest counters of a device.
+    CollectorServer: Asyncio fleet collector running on a background thread.
+
+Functions:
+    main: Runs the collector process, storing the readings of every device in its own reading log.
+
+Usage:
+    python src/api/collector_api.py --directory /var/lib/growhub/fleet --port 8090
+
+    from collector_api import CollectorServer
+
+    server = CollectorServer(lambda node, timestamp, readings: print(node, timestamp, readings), port=8090)
+    server.start()
+    ...
+    server.stop()
+"""
+
+
+# Standard library imports
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple
+)
+# Codebase imports
+from exceptions_api import get_exception
+from readings_api import REASONS, error_status, error_to_dict, read_request
+CommandArgumentError = get_exception('CommandArgumentError')
+CommandDoesNotExistError = get_exception('CommandDoesNotExistError')
+
+
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+# Device names double as directory names of the collector process
+NODE_NAME = re.compile(r'[A-Za-z0-9_-][A-Za-z0-9_.-]{0,63}')
+
+
+class NodeStatus(NamedTuple):
+    """Ingest counters of a device: accepted frames and readings, duplicate frames, last sequence and seen time."""
+
+    frames: int
+    readings: int
+    duplicates: int
+    sequence: int
+    last_seen: float
+
+
+class CollectorServer:
+    """
+    Asyncio fleet collector, running its event loop on a background thread.
+
+    The sink is called as sink(node, timestamp, readings), once per timestamp of a frame.
+
+    Args:
+        sink (callable): Receives the readings of the ingested frames.
+        host (str): The interface to bind; all interfaces by default.
+        port (int): The TCP port to listen on; 0 picks a free port.
+        workers (int): Threads decoding frames and running the sink.
+        max_frame_bytes (int): Largest accepted request body in bytes.
+    """
+
+    def __init__(self, sink: Callable[[str, float, Dict[str, float]], None], host: str = '0.0.0.0',
+                 port: int = 8090, workers: int = 4, max_frame_bytes: int = MAX_FRAME_BYTES) -> None:
+        self.sink: Callable[[str, float, Dict[str, float]], None] = sink
+        self.host: str = host
+        self.port: int = port
+        self.workers: int = workers
+        self.max_frame_bytes: int = max_frame_bytes
+        # Highest acknowledged sequence number by (node, queue id)
+        self._acknowledged: Dict[Tuple[str, str], int] = {}
+        self._nodes: Dict[str, NodeStatus] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock: threading.Lock = threading.Lock()
+
+    def status(self) -> Dict[str, NodeStatus]:
+        """Returns the ingest counters of every device seen, keyed by device name."""
+        with self._lock:
+            return dict(self._nodes)
+
+    def start(self) -> None:
+        """Starts serving on a background thread; returns once the server is listening."""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._executor = ThreadPoolExecutor(self.workers, thread_name_prefix="collector")
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(started,), name="collector-api", daemon=True)
+        self._thread.start()
+        started.wait()
+
+    def stop(self) -> None:
+        """Stops serving; frames in flight are not acknowledged, so their devices send them again."""
+        if self._thread is None:
+            return
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._executor.shutdown()
+        self._thread = self._loop = self._server = self._executor = None
+
+    # Protected methods
+    def _run(self, started: threading.Event) -> None:
+        """Helper method running the event loop of the server thread."""
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        self.port = self._server.sockets[0].getsockname()[1]
+        started.set()
+        self._loop.run_forever()
+        self._server.close()
+        self._loop.run_until_complete(self._server.wait_closed())
+        pending = [task for task in asyncio.all_tasks(self._loop) if not task.done()]
+        for task in pending:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Helper method serving the requests of one connection (HTTP/1.1 keep-alive)."""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except CommandArgumentError as e:
+                    await self._send(writer, 400, self._error_body(e), True)
+                    break
+                if request is None:
+                    break
+                method, target, headers = request
+                status, body, close = await self._route(method, urlsplit(target).path.rstrip('/'), headers, reader)
+                await self._send(writer, status, body, close)
+                if close or headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Device gone, or connection closed by stop()
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, method: str, path: str, headers: Mapping[str, str],
+                     reader: asyncio.StreamReader) -> Tuple[int, bytes, bool]:
+        """Helper method to answer a request: (status, body, whether to close the connection)."""
+        try:
+            if path == '/ingest':
+                if method != 'POST':
+                    return 405, self._error_body(CommandArgumentError(
+                        f"Method {method} is not allowed.", parameter="method", value=method)), False
+                length = headers.get('content-length', '')
+                length = int(length) if length.isdigit() else -1
+                if not 0 <= length <= self.max_frame_bytes:
+                    # The body is not read, so the connection cannot be reused
+                    return 413, self._error_body(CommandArgumentError(
+                        f"Frame must have a Content-Length of at most {self.max_frame_bytes} bytes.",
+                        parameter="content-length", value=length)), True
+                body = await reader.readexactly(length)
+                result = await self._loop.run_in_executor(self._executor, self._ingest, body,
+                                                          headers.get('content-encoding', 'identity'))
+                return 200, json.dumps(result).encode(), False
+            if path == '/nodes':
+                return 200, json.dumps({node: status._asdict() for node, status in sorted(self.status().items())}) \
+                    .encode(), False
+            raise CommandDoesNotExistError(f"Unknown endpoint {path}.", command_name=path)
+        except (asyncio.IncompleteReadError, asyncio.CancelledError):
+            raise
+        except Exception as e:
+            return error_status(e), self._error_body(e), False
+
+    def _ingest(self, body: bytes, encoding: str) -> Dict[str, Any]:
+        """Helper method to decode a frame and pass its new readings to the sink (runs on the thread pool)."""
+        node, queue_id, sequence, readings = self._decode(body, encoding)
+        key = (node, queue_id)
+        with self._lock:
+            duplicate = sequence <= self._acknowledged.get(key, -1)
+        if not duplicate:
+            grouped: Dict[float, Dict[str, float]] = {}
+            for timestamp, channel, value in readings:
+                grouped.setdefault(timestamp, {})[channel] = value
+            for timestamp, values in grouped.items():
+                self.sink(node, timestamp, values)
+        with self._lock:
+            previous = self._nodes.get(node, NodeStatus(0, 0, 0, -1, 0.0))
+            if duplicate:
+                self._nodes[node] = previous._replace(duplicates=previous.duplicates + 1, last_seen=time.time())
+            else:
+                self._acknowledged[key] = max(sequence, self._acknowledged.get(key, -1))
+                self._nodes[node] = NodeStatus(previous.frames + 1, previous.readings + len(readings),
+                                               previous.duplicates, sequence, time.time())
+        return {'node': node, 'sequence': sequence, 'duplicate': duplicate}
+
+    @staticmethod
+    def _decode(body: bytes, encoding: str) -> Tuple[str, str, int, List[Tuple[float, str, float]]]:
+        """Helper method to decode and validate a frame: (node, queue id, sequence, readings)."""
+        try:
+            if encoding == 'deflate':
+                body = zlib.decompress(body)
+            elif encoding != 'identity':
+                raise ValueError(f"unsupported Content-Encoding {encoding}")
+            frame = json.loads(body)
+            node, queue_id, sequence = str(frame['node']), str(frame['queue']), int(frame['sequence'])
+            channels = [str(channel) for channel in frame['channels']]
+            readings = [(float(timestamp), channels[int(channel)], float(value))
+                        for timestamp, channel, value in frame['readings']]
+        except (ValueError, TypeError, KeyError, IndexError, zlib.error) as e:
+            raise CommandArgumentError(f"Malformed frame: {e}.", parameter="frame") from e
+        if not NODE_NAME.fullmatch(node):
+            raise CommandArgumentError("Invalid node name.", parameter="node", value=node)
+        return node, queue_id, sequence, readings
+
+    @staticmethod
+    def _error_body(error: BaseException) -> bytes:
+        """Helper method to build a structured error body."""
+        return json.dumps({'error': error_to_dict(error)}).encode()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: int, body: bytes, close: bool) -> None:
+        """Helper method to send a complete response."""
+        head = f"HTTP/1.1 {status} {REASONS.get(status, 'Payload Too Large' if status == 413 else '')}\r\n" \
+               f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n" \
+               f"{'Connection: close' if close else 'Connection: keep-alive'}\r\n\r\n"
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+def main() -> None:
+    """Runs the collector process, storing the readings of every device in a reading log under --directory."""
+    # Codebase imports (firmware)
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'firmware'))
+    from storage import ReadingLog
+
+    parser = argparse.ArgumentParser(description="Collect the readings of a fleet of GrowHub devices.")
+    parser.add_argument('--directory', required=True, help="Directory of the reading logs, one per device")
+    parser.add_argument('--host', default='0.0.0.0', help="Interface to bind (default: 0.0.0.0)")
+    parser.add_argument('--port', type=int, default=8090, help="TCP port (default: 8090)")
+    parser.add_argument('--workers', type=int, default=4, help="Ingest threads (default: 4)")
+    args = parser.parse_args()
+
+    logs: Dict[str, Any] = {}
+    logs_lock = threading.Lock()
+
+    def sink(node: str, timestamp: float, readings: Dict[str, float]) -> None:
+        with logs_lock:
+            log = logs.get(node)
+            if log is None:
+                log = logs[node] = ReadingLog(os.path.join(args.directory, node))
+        log.append(timestamp, readings)
+        # The frame is acknowledged when the sink returns, so its readings must be on disk by then
+        log.flush()
+
+    server = CollectorServer(sink, args.host, args.port, args.workers)
+    server.start()
+    print(f"Collecting on {args.host}:{server.port} into {args.directory}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+        for log in logs.values():
+            log.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -52,6 +52,22 @@ class ExceptionDoesNotExistError(Exception):
     pass
 
 
+# Exception registry, built once at import time
+EXCEPTIONS = {
+    exception_class.__name__: exception_class
+    for exception_class in (
+        CommandError,
+        CommandArgumentError,
+        CommandDoesNotExistError,
+        SensorError,
+        SensorCalibrationError,
+        SensorConfigurationError,
+        SensorConnectionError,
+        SensorReadError
+    )
+}
+
+
 def get_exception(exception_name: str) -> Type[Exception]:
     """
     Retrieves an exception class by its name.
@@ -63,18 +79,7 @@ def get_exception(exception_name: str) -> Type[Exception]:
         SensorError = get_exception('SensorError')
     """
 
-    exceptions = {
-        'CommandError': CommandError,
-        'CommandArgumentError': CommandArgumentError,
-        'CommandDoesNotExistError': CommandDoesNotExistError,
-        'SensorError': SensorError,
-        'SensorCalibrationError': SensorCalibrationError,
-        'SensorConfigurationError': SensorConfigurationError,
-        'SensorConnectionError': SensorConnectionError,
-        'SensorReadError': SensorReadError
-    }
-
-    exception_class = exceptions.get(exception_name)
+    exception_class = EXCEPTIONS.get(exception_name)
     if exception_class is None:
         raise ExceptionDoesNotExistError(f"Unknown exception name: {exception_name}")
 
@@ -0,0 +1,444 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/api/ | Python 3.9.19
+
+"""
+GrowHub API endpoint: readings_api
+
+This module provides the local HTTP API serving the sensor readings from memory. The acquisition
+loop (the only reader of the I2C bus) pushes every snapshot into a ReadingStore; the asyncio server
+answers any number of clients from that store, so API traffic never reaches the sensors.
+
+Endpoints (GET):
+    /readings                   Latest value, timestamp and error of every channel.
+    /readings/<channel>         Latest value of one channel, e.g. /readings/aquatic.ph.
+    /history/<channel>          Summary over a window (?window=1h), or rollup (?span=1d&resolution=5m).
+    /events                     Server-Sent Events push channel: one 'snapshot' event per update.
+
+/readings responses carry an ETag (the store sequence number) and answer If-None-Match with
+304 Not Modified. Errors, including the SensorError stored for a failed channel, are returned as
+structured JSON: {"error": {"type": "SensorReadError", "message": ..., "sensor_type": ..., ...}}.
+
+Classes:
+    ReadingStore: Thread-safe latest readings and errors, with update notifications.
+    ReadingsServer: Asyncio HTTP/SSE server of a ReadingStore, running on a background thread.
+
+Functions:
+    error_to_dict: Translates an exception of the GrowHub hierarchy into a JSON-serializable dict.
+    error_status: Returns the HTTP status code of an exception of the GrowHub hierarchy.
+    read_request: Reads the request line and headers of an HTTP/1.1 request.
+
+Usage:
+    from acquisition import AcquisitionEngine
+    from readings_api import ReadingStore, ReadingsServer
+    from timeseries import TimeSeriesBuffer
+
+    store, history = ReadingStore(), TimeSeriesBuffer()
+    server = ReadingsServer(store, history, port=8080)
+    server.start()
+    while True:
+        snapshot = engine.sweep()
+        history.append_snapshot(snapshot)
+        store.update(snapshot)
+"""
+
+
+# Standard library imports
+import asyncio
+import json
+import threading
+from urllib.parse import parse_qs, unquote, urlsplit
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union
+)
+# Codebase imports
+from exceptions_api import get_exception
+CommandArgumentError = get_exception('CommandArgumentError')
+CommandDoesNotExistError = get_exception('CommandDoesNotExistError')
+
+
+# HTTP status codes of the exception hierarchy; the most specific class of an exception wins
+ERROR_STATUS = {
+    'CommandArgumentError': 400,
+    'CommandDoesNotExistError': 404,
+    'CommandError': 400,
+    'SensorConnectionError': 503,
+    'SensorReadError': 502,
+    'SensorError': 500
+}
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+           500: 'Internal Server Error', 502: 'Bad Gateway', 503: 'Service Unavailable'}
+SSE_KEEPALIVE = 15.0
+
+
+def error_to_dict(error: BaseException) -> Dict[str, Any]:
+    """
+    Translates an exception of the GrowHub hierarchy into a JSON-serializable dict.
+
+    The dict holds the exception class name and every context attribute of the exception
+    (message, sensor_type, data_type, calibration_point, parameter, value, ...).
+
+    Args:
+        error (exception): The exception to translate.
+    """
+    details = {'type': type(error).__name__, 'message': getattr(error, 'message', str(error))}
+    for name, value in vars(error).items():
+        if value is not None and name not in details:
+            details[name] = value if isinstance(value, (str, int, float, bool)) else str(value)
+    return details
+
+
+def error_status(error: BaseException) -> int:
+    """Returns the HTTP status code of an exception, from its most specific class listed in ERROR_STATUS."""
+    for exception_class in type(error).__mro__:
+        status = ERROR_STATUS.get(exception_class.__name__)
+        if status is not None:
+            return status
+    return 500
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Tuple[str, str, Dict[str, str]]]:
+    """
+    Reads the request line and headers of an HTTP/1.1 request; returns None when the client closed the connection.
+
+    Raises CommandArgumentError for a malformed or oversized request line or header, which servers answer with 400.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+    """
+    line = await _read_line(reader, 'request')
+    if not line.strip():
+        return None
+    request_line = line.decode('latin-1').strip()
+    parts = request_line.split()
+    if len(parts) != 3 or not parts[2].startswith('HTTP/'):
+        raise CommandArgumentError("Malformed HTTP request line.", parameter="request", value=request_line[:80])
+    headers = {}
+    while True:
+        line = await _read_line(reader, 'header')
+        if line in (b'\r\n', b'\n', b''):
+            break
+        header = line.decode('latin-1').strip()
+        name, separator, value = header.partition(':')
+        if not separator or not name.strip():
+            raise CommandArgumentError("Malformed HTTP header.", parameter="header", value=header[:80])
+        headers[name.strip().lower()] = value.strip()
+    return parts[0], parts[1], headers
+
+
+async def _read_line(reader: asyncio.StreamReader, parameter: str) -> bytes:
+    """
+    Helper function to read one line of a request, raising CommandArgumentError if it exceeds the stream limit.
+
+    Args:
+        reader (asyncio.StreamReader): The connection.
+        parameter (str): The part of the request being read ('request' or 'header').
+    """
+    try:
+        return await reader.readline()
+    except ValueError:
+        # The line stays in the buffer, so the connection cannot be used further
+        raise CommandArgumentError(f"HTTP {parameter} line too long.", parameter=parameter)
+
+
+class ReadingStore:
+    """
+    Thread-safe latest readings and errors of every channel, with update notifications.
+
+    The sequence number of the updates is the ETag of /readings and the event id of the push channel.
+    """
+
+    def __init__(self) -> None:
+        self._readings: Dict[str, Tuple[float, float]] = {}
+        self._errors: Dict[str, Tuple[BaseException, Dict[str, Any]]] = {}
+        self._sequence: int = 0
+        self._body: Tuple[int, bytes] = (-1, b"")
+        self._watchers: List[Callable[[], None]] = []
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def sequence(self) -> int:
+        """Number of updates received so far."""
+        return self._sequence
+
+    def update(self, snapshot) -> None:
+        """Stores the readings and errors of an acquisition SensorSnapshot."""
+        self._store(snapshot.timestamp, snapshot.readings, snapshot.errors)
+
+    def append(self, timestamp: float, readings: Mapping[str, float]) -> None:
+        """
+        Stores readings, clearing the errors of their channels.
+
+        Args:
+            timestamp (float): UNIX timestamp of the readings.
+            readings (dict): Reading values keyed by channel name, e.g. {'aquatic.ph': 6.2}.
+        """
+        self._store(timestamp, readings, {})
+
+    def channel(self, name: str) -> Tuple[Optional[Tuple[float, float]], Optional[BaseException]]:
+        """Returns the latest (timestamp, value) and the last error of a channel; either may be None."""
+        with self._lock:
+            error = self._errors.get(name)
+            return self._readings.get(name), error[0] if error else None
+
+    def channel_error(self, name: str) -> Optional[Dict[str, Any]]:
+        """Returns the last error of a channel as a dict (see error_to_dict), or None."""
+        with self._lock:
+            error = self._errors.get(name)
+            return error[1] if error else None
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the latest state of every channel as a JSON-serializable dict."""
+        with self._lock:
+            return self._snapshot()
+
+    def body(self) -> Tuple[int, bytes]:
+        """Returns the sequence number and the JSON body of /readings, serialized once per update."""
+        with self._lock:
+            if self._body[0] != self._sequence:
+                self._body = (self._sequence, json.dumps(self._snapshot()).encode())
+            return self._body
+
+    def add_watcher(self, watcher: Callable[[], None]) -> None:
+        """Registers a callable invoked (from the updating thread) after every update."""
+        with self._lock:
+            self._watchers.append(watcher)
+
+    def remove_watcher(self, watcher: Callable[[], None]) -> None:
+        """Unregisters a watcher added with add_watcher()."""
+        with self._lock:
+            self._watchers.remove(watcher)
+
+    # Protected methods
+    def _store(self, timestamp: float, readings: Mapping[str, float], errors: Mapping[str, BaseException]) -> None:
+        """Helper method to merge readings and errors and notify the watchers."""
+        with self._lock:
+            for channel, value in readings.items():
+                self._readings[channel] = (timestamp, value)
+                self._errors.pop(channel, None)
+            for channel, error in errors.items():
+                self._errors[channel] = (error, {**error_to_dict(error), 'timestamp': timestamp})
+            self._sequence += 1
+            watchers = list(self._watchers)
+        for watcher in watchers:
+            watcher()
+
+    def _snapshot(self) -> Dict[str, Any]:
+        """Helper method to build the /readings document; callers hold the lock."""
+        return {
+            'sequence': self._sequence,
+            'readings': {channel: {'value': value, 'timestamp': timestamp}
+                         for channel, (timestamp, value) in sorted(self._readings.items())},
+            'errors': {channel: details for channel, (_, details) in sorted(self._errors.items())}
+        }
+
+
+class ReadingsServer:
+    """
+    Asyncio HTTP/SSE server of a ReadingStore, running its event loop on a background thread.
+
+    Args:
+        store (ReadingStore): The readings to serve.
+        history (TimeSeriesBuffer, optional): The history served by /history; the endpoint is disabled if omitted.
+        host (str): The interface to bind; loopback by default.
+        port (int): The TCP port to listen on; 0 picks a free port.
+    """
+
+    def __init__(self, store: ReadingStore, history: Optional[Any] = None, host: str = '127.0.0.1',
+                 port: int = 8080) -> None:
+        self.store: ReadingStore = store
+        self.history: Optional[Any] = history
+        self.host: str = host
+        self.port: int = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._clients: List[asyncio.Event] = []
+        self._stopping: bool = False
+
+    @property
+    def clients(self) -> int:
+        """Number of connected push channel clients."""
+        return len(self._clients)
+
+    def start(self) -> None:
+        """Starts serving on a background thread; returns once the server is listening."""
+        if self._thread is not None:
+            return
+        self._stopping = False
+        self._loop = asyncio.new_event_loop()
+        started = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(started,), name="readings-api", daemon=True)
+        self._thread.start()
+        started.wait()
+        self.store.add_watcher(self._on_update)
+
+    def stop(self) -> None:
+        """Closes the push channels and stops serving."""
+        if self._thread is None:
+            return
+        self.store.remove_watcher(self._on_update)
+        self._loop.call_soon_threadsafe(self._shutdown)
+        self._thread.join()
+        self._loop.close()
+        self._thread = self._loop = self._server = None
+
+    # Protected methods
+    def _run(self, started: threading.Event) -> None:
+        """Helper method running the event loop of the server thread."""
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(asyncio.start_server(self._handle, self.host, self.port))
+        self.port = self._server.sockets[0].getsockname()[1]
+        started.set()
+        self._loop.run_forever()
+        self._server.close()
+        self._loop.run_until_complete(self._server.wait_closed())
+        # Close the remaining connections (idle keep-alive connections and push channels)
+        pending = [task for task in asyncio.all_tasks(self._loop) if not task.done()]
+        for task in pending:
+            task.cancel()
+        self._loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+
+    def _shutdown(self) -> None:
+        """Helper method to stop the event loop (runs on the loop)."""
+        self._stopping = True
+        self._loop.stop()
+
+    def _on_update(self) -> None:
+        """Helper method called by the store from the updating thread."""
+        self._loop.call_soon_threadsafe(self._wake)
+
+    def _wake(self) -> None:
+        """Helper method to wake every push channel client (runs on the loop)."""
+        for event in self._clients:
+            event.set()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Helper method serving the requests of one connection (HTTP/1.1 keep-alive)."""
+        try:
+            while not self._stopping:
+                try:
+                    request = await read_request(reader)
+                except CommandArgumentError as e:
+                    await self._send(writer, 400, self._error_body(e), {'Connection': 'close'})
+                    break
+                if request is None:
+                    break
+                method, target, headers = request
+                path = urlsplit(target).path
+                if method != 'GET':
+                    await self._send(writer, 405, self._error_body(CommandArgumentError(
+                        f"Method {method} is not allowed.", parameter="method", value=method)))
+                elif path == '/events':
+                    await self._stream_events(writer)
+                    break
+                else:
+                    status, body, extra_headers = self._route(target, headers)
+                    await self._send(writer, status, body, extra_headers)
+                if headers.get('connection', '').lower() == 'close':
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            # Client gone, or connection closed by stop()
+            pass
+        finally:
+            writer.close()
+
+    def _route(self, target: str, headers: Mapping[str, str]) -> Tuple[int, bytes, Dict[str, str]]:
+        """Helper method to answer a GET request other than /events: (status, body, extra headers)."""
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip('/')
+        try:
+            if path == '/readings':
+                sequence, body = self.store.body()
+                etag = f'"{sequence}"'
+                if etag in (tag.strip() for tag in headers.get('if-none-match', '').split(',')):
+                    return 304, b"", {'ETag': etag}
+                return 200, body, {'ETag': etag}
+            if path.startswith('/readings/'):
+                return 200, self._channel_body(path[len('/readings/'):]), {}
+            if path.startswith('/history/'):
+                return 200, self._history_body(path[len('/history/'):], parse_qs(url.query)), {}
+            raise CommandDoesNotExistError(f"Unknown endpoint {path}.", command_name=path)
+        except Exception as e:
+            return error_status(e), self._error_body(e), {}
+
+    def _channel_body(self, channel: str) -> bytes:
+        """Helper method to build the /readings/<channel> body, raising the stored error of a never read channel."""
+        reading, error = self.store.channel(channel)
+        if reading is None:
+            raise error or CommandDoesNotExistError(f"Unknown channel {channel}.", command_name=channel)
+        timestamp, value = reading
+        return json.dumps({'channel': channel, 'value': value, 'timestamp': timestamp,
+                           'error': self.store.channel_error(channel)}).encode()
+
+    def _history_body(self, channel: str, query: Mapping[str, List[str]]) -> bytes:
+        """Helper method to build the /history/<channel> body: a summary (?window=) or a rollup (?span=&resolution=)."""
+        if self.history is None:
+            raise CommandDoesNotExistError("History is not enabled on this device.", command_name="history")
+        if channel not in self.history.channels:
+            raise CommandDoesNotExistError(f"Unknown channel {channel}.", command_name=channel)
+        if 'span' in query or 'resolution' in query:
+            rollup = self.history.rollup(channel, self._span(query, 'span', '1d'),
+                                         self._span(query, 'resolution', '5m'))
+            return json.dumps({'channel': channel, **{field: values.tolist()
+                                                      for field, values in rollup._asdict().items()}}).encode()
+        summary = self.history.summary(channel, self._span(query, 'window', '1h'))
+        # NaN statistics of an empty window are returned as null
+        return json.dumps({'channel': channel, **{field: None if value != value else value
+                                                  for field, value in summary._asdict().items()}}).encode()
+
+    @staticmethod
+    def _span(query: Mapping[str, List[str]], name: str, default: str) -> Union[float, str]:
+        """Helper method to parse a window length query parameter (seconds or a named window)."""
+        value = query.get(name, [default])[0]
+        try:
+            return float(value)
+        except ValueError:
+            return value
+
+    @staticmethod
+    def _error_body(error: BaseException) -> bytes:
+        """Helper method to build a structured error body."""
+        return json.dumps({'error': error_to_dict(error)}).encode()
+
+    @staticmethod
+    async def _send(writer: asyncio.StreamWriter, status: int, body: bytes,
+                    extra_headers: Optional[Mapping[str, str]] = None) -> None:
+        """Helper method to send a complete response."""
+        headers = {'Content-Type': 'application/json', 'Content-Length': str(len(body)),
+                   'Cache-Control': 'no-cache', **(extra_headers or {})}
+        head = f"HTTP/1.1 {status} {REASONS.get(status, '')}\r\n" + ''.join(
+            f"{name}: {value}\r\n" for name, value in headers.items()) + "\r\n"
+        writer.write(head.encode('latin-1') + (body if status != 304 else b""))
+        await writer.drain()
+
+    async def _stream_events(self, writer: asyncio.StreamWriter) -> None:
+        """Helper method serving the push channel: the current snapshot, then one event per update."""
+        writer.write(b"HTTP/1.1 200 OK\r\nContent-Type: text/event-stream\r\nCache-Control: no-cache\r\n"
+                     b"Connection: keep-alive\r\n\r\n")
+        event = asyncio.Event()
+        self._clients.append(event)
+        try:
+            sent = -1
+            while not self._stopping:
+                sequence, body = self.store.body()
+                if sequence != sent:
+                    # Slow clients skip intermediate updates and always receive the latest snapshot
+                    writer.write(b"id: %d\nevent: snapshot\ndata: %s\n\n" % (sequence, body))
+                    sent = sequence
+                else:
+                    writer.write(b": keep-alive\n\n")
+                await writer.drain()
+                try:
+                    await asyncio.wait_for(event.wait(), SSE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    pass
+                event.clear()
+        finally:
+            self._clients.remove(event)
@@ -0,0 +1,181 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: acquisition
+
+This module provides a concurrent acquisition engine that reads the whole GrowHub sensor set
+in a single sweep. The Atlas Scientific EZO circuits need close to a second to convert a reading
+and the BME680 tens of milliseconds, so the engine starts the conversion of every such probe first,
+reads the remaining sensors while the conversions run, waits once for the longest outstanding
+conversion and then collects all results. Adding probes adds their bus transactions to a sweep,
+but not their conversion times.
+
+Reads are ordered by bus location (bus, multiplexer, channel), so that each multiplexer channel
+is selected once per phase of the sweep instead of once per read.
+
+Classes:
+    SensorSnapshot: Timestamped readings of one sweep, with per-channel errors.
+    AcquisitionEngine: Reads all configured sensors concurrently and returns a SensorSnapshot.
+
+Usage:
+    from acquisition import AcquisitionEngine
+    from backends import HardwareBackend
+    from sensors import SensorAquatic, SensorAtmospheric, SensorSoil
+
+    engine = AcquisitionEngine([SensorAquatic(), SensorAtmospheric(), SensorSoil()])
+    engine.connect()
+    snapshot = engine.sweep()
+    ph = snapshot.readings.get('aquatic.ph')
+
+    backend = HardwareBackend()
+    engine = AcquisitionEngine([SensorSoil(backend=backend.channel(0x70, channel), name=f"soil{channel}")
+                                for channel in range(8)])
+"""
+
+
+# Standard library imports
+import time
+from concurrent.futures import ThreadPoolExecutor
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Dict,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple
+)
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+SensorError = APIClient.get_exception('SensorError')
+
+
+class SensorSnapshot(NamedTuple):
+    """Timestamped readings of one acquisition sweep."""
+
+    timestamp: float
+    readings: Dict[str, float]
+    errors: Dict[str, Exception]
+
+    @property
+    def ok(self) -> bool:
+        """True if every channel of the sweep was read successfully."""
+        return not self.errors
+
+
+class AcquisitionEngine:
+    """
+    Reads all configured sensors concurrently and returns one timestamped snapshot per sweep.
+
+    Split reads (start_read/finish_read) share one conversion wait; errors are stored in the snapshot.
+
+    Args:
+        sensors (sequence): The sensor instances; probes of one type need distinct names.
+        max_workers (int, optional): Size of the thread pool; one worker per sensor if omitted.
+    """
+
+    def __init__(self, sensors: Sequence, max_workers: Optional[int] = None) -> None:
+        self.sensors: List = list(sensors)
+        self.max_workers: int = max_workers or max(len(self.sensors), 1)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        channels = [sensor.channel(data_type) for sensor in self.sensors
+                    for data_type in sensor.decimal_precision]
+        duplicates = sorted({channel for channel in channels if channels.count(channel) > 1})
+        if duplicates:
+            raise CommandArgumentError(f"Duplicate channels: {', '.join(duplicates)}."
+                                       f"\nGive the probes of one sensor type distinct names.",
+                                       parameter="sensors", value=duplicates)
+
+    def connect(self) -> Dict[str, Exception]:
+        """
+        Connects and configures every sensor. Returns the errors of sensors that failed, keyed by sensor name.
+        """
+        errors = {}
+        for sensor in self.sensors:
+            try:
+                sensor.connect()
+                sensor.setup()
+            except SensorError as e:
+                errors[sensor.name] = e
+        return errors
+
+    def close(self) -> None:
+        """Shuts down the worker threads of the engine."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def sweep(self) -> SensorSnapshot:
+        """Reads every channel of every sensor once and returns the results as a SensorSnapshot."""
+        readings: Dict[str, float] = {}
+        errors: Dict[str, Exception] = {}
+        timestamp = time.time()
+
+        # Start every conversion before touching the other sensors
+        pending: List[Tuple[object, str]] = []
+        deadline = time.monotonic()
+        for sensor in self._deferred_sensors():
+            for data_type in sensor.decimal_precision:
+                try:
+                    sensor.start_read(data_type)
+                except SensorError as e:
+                    errors[sensor.channel(data_type)] = e
+                else:
+                    pending.append((sensor, data_type))
+                    if not getattr(sensor, 'streaming', False):
+                        deadline = max(deadline, time.monotonic() + sensor.conversion_delay[data_type])
+
+        # Read the remaining sensors while the conversions run, one read_all() transaction per sensor
+        futures = [self._get_executor().submit(self._read_group, group) for group in self._immediate_groups()]
+        for future in futures:
+            for sensor, reading in future.result():
+                if isinstance(reading, SensorError):
+                    errors.update({sensor.channel(data_type): reading for data_type in sensor.decimal_precision})
+                else:
+                    readings.update({sensor.channel(data_type): value
+                                     for data_type, value in reading._asdict().items()})
+
+        # Wait once for the longest outstanding conversion, then collect all results
+        remaining = deadline - time.monotonic()
+        if pending and remaining > 0:
+            time.sleep(remaining)
+        for sensor, data_type in pending:
+            try:
+                readings[sensor.channel(data_type)] = sensor.finish_read(data_type)
+            except SensorError as e:
+                errors[sensor.channel(data_type)] = e
+
+        return SensorSnapshot(timestamp=timestamp, readings=readings, errors=errors)
+
+    # Protected methods
+    def _deferred_sensors(self) -> List:
+        """Helper method to list the sensors that support split start_read()/finish_read() reads, by location."""
+        return sorted((sensor for sensor in self.sensors if hasattr(sensor, 'start_read')),
+                      key=lambda sensor: sensor.location)
+
+    def _immediate_groups(self) -> List[List]:
+        """Helper method to group the sensors read with a single blocking call by bus, each group by location."""
+        groups: Dict[int, List] = {}
+        for sensor in sorted((sensor for sensor in self.sensors if not hasattr(sensor, 'start_read')),
+                             key=lambda sensor: sensor.location):
+            groups.setdefault(sensor.location.bus, []).append(sensor)
+        return list(groups.values())
+
+    @staticmethod
+    def _read_group(sensors: List) -> List[Tuple[Any, Any]]:
+        """Helper method to read a group of sensors in order; returns (sensor, reading or SensorError) pairs."""
+        results = []
+        for sensor in sensors:
+            try:
+                results.append((sensor, sensor.read_all()))
+            except SensorError as e:
+                results.append((sensor, e))
+        return results
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Helper method to lazily create the worker thread pool."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="acquisition")
+        return self._executor
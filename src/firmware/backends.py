@@ -0,0 +1,597 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: backends
+
+This module provides the device backends used by the sensor classes to open their I2C devices.
+The hardware backend opens the real drivers, while the simulated backend hands out fake devices
+that mimic the driver interfaces, so the firmware can be exercised and benchmarked on any Linux box.
+Backends also supply the EZO commands and BME680 constants of the sensor classes, so only the
+hardware backend imports the driver packages.
+
+A backend is bound to one location: a bus, or one downstream channel of a TCA9548A-style I2C
+multiplexer on that bus (see channel()). Several probes of one sensor type are connected at
+different addresses, or at the same address behind different multiplexer channels.
+
+Classes:
+    BusLocation: Location of the devices of a backend: bus, multiplexer address and channel.
+    HardwareBackend: Opens the real sensor drivers (atlas_i2c, bme680, adafruit_seesaw) on the shared I2C buses.
+    SimulatedBackend: Opens fake devices with configurable conversion delays, jitter and failure injection.
+    FakeEZOCommands: Built-in equivalents of the atlas_i2c commands used by the sensor classes.
+    FakeBME680Constants: Built-in equivalents of the bme680 register constants used by the sensor classes.
+    FakeMux: Fake TCA9548A I2C multiplexer, switching the simulated bus to one channel at a time.
+    FakeDevice: Base class for the fake devices.
+    ├── FakeEZO: Fake Atlas Scientific EZO circuit (pH or EC), mimicking atlas_i2c.AtlasI2C.
+    ├── FakeBME680: Fake Bosch BME680, mimicking bme680.BME680.
+    └── FakeSeesaw: Fake Adafruit Seesaw soil sensor, mimicking adafruit_seesaw.seesaw.Seesaw.
+
+Usage:
+    from backends import SimulatedBackend
+    from sensors import SensorAquatic
+
+    backend = SimulatedBackend(jitter=0.01, failure_rate=0.05, seed=42)
+    sensor_aquatic = SensorAquatic(backend=backend)
+    sensor_aquatic.connect()
+    ph = sensor_aquatic.read_ph()
+    soil_probes = [SensorSoil(backend=backend.channel(0x70, channel), name=f"soil{channel}") for channel in range(8)]
+"""
+
+
+# Standard library imports
+import random
+import threading
+import time
+import weakref
+from importlib import import_module
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type
+)
+# Codebase imports (firmware)
+from metrics import metrics
+
+
+# Simulated backends of the process, exported as the I2C transactions of bus "simulated" (see metrics)
+_simulated: 'weakref.WeakSet[SimulatedBackend]' = weakref.WeakSet()
+metrics.register_collector('growhub_i2c_transactions_total', "I2C transactions by bus.", ('bus',),
+                           lambda: {('simulated',): sum(device.transactions for backend in list(_simulated)
+                                                        for device in list(backend.devices.values()))
+                                    + sum(mux.switches for backend in list(_simulated) if backend.location.mux < 0
+                                          for mux in backend.muxes.values())},
+                           source='simulated')
+metrics.register_collector('growhub_i2c_mux_switches_total', "I2C multiplexer channel switches by bus and address.",
+                           ('bus', 'mux'),
+                           lambda: {('simulated', f"0x{address:02x}"): mux.switches for backend in list(_simulated)
+                                    if backend.location.mux < 0 for address, mux in backend.muxes.items()},
+                           source='simulated')
+
+
+class BusLocation(NamedTuple):
+    """Location of the devices of a backend; mux and channel are -1 for devices on the bus itself."""
+
+    bus: int
+    mux: int = -1
+    channel: int = -1
+
+
+class HardwareBackend:
+    """
+    Opens the real sensor drivers on the shared I2C buses of the process (see i2c_bus).
+
+    Driver modules are imported when a device is opened.
+
+    Args:
+        bus_manager (I2CBusManager, optional): The bus manager; defaults to the shared manager of the process.
+        bus_number (int): The I2C bus the sensors are connected to.
+        mux (tuple, optional): (multiplexer address, channel) of the devices behind a multiplexer.
+    """
+
+    def __init__(self, bus_manager: Optional[Any] = None, bus_number: int = 1,
+                 mux: Optional[Tuple[int, int]] = None) -> None:
+        if bus_manager is None:
+            from i2c_bus import bus_manager
+        self.bus_manager = bus_manager
+        self.bus_number: int = bus_number
+        self.mux: Optional[Tuple[int, int]] = mux
+        self.location: BusLocation = BusLocation(bus_number, *mux) if mux else BusLocation(bus_number)
+
+    def channel(self, mux_address: int, channel: int) -> 'HardwareBackend':
+        """Returns the backend of the devices behind a channel (0-7) of a multiplexer on the same bus."""
+        return HardwareBackend(self.bus_manager, self.bus_number, (mux_address, channel))
+
+    @staticmethod
+    def ezo_commands() -> Any:
+        """Returns the EZO command classes (atlas_i2c.commands)."""
+        return import_module('atlas_i2c.commands')
+
+    @staticmethod
+    def bme680_constants() -> Any:
+        """Returns the BME680 register constants (bme680 module)."""
+        return import_module('bme680')
+
+    def open_ezo(self, address: int) -> Any:
+        """Opens an Atlas Scientific EZO circuit."""
+        return self.bus_manager.open_ezo(address, self.bus_number, self.mux)
+
+    def open_bme680(self, address: int) -> Any:
+        """Opens a Bosch BME680 sensor."""
+        return self.bus_manager.open_bme680(address, self.bus_number, self.mux)
+
+    def open_seesaw(self, address: int) -> Any:
+        """Opens an Adafruit Seesaw soil sensor."""
+        return self.bus_manager.open_seesaw(address, self.bus_number, self.mux)
+
+
+class SimulatedBackend:
+    """
+    Opens fake devices in place of the real sensor drivers, serialized by one shared bus lock.
+
+    Devices are kept per address in the devices dict; keyword arguments are passed on to every device.
+
+    Args:
+        seed (int, optional): Seed of the random generators, for reproducible runs.
+        bus_number (int): The number of the simulated bus, used to group the reads of a bus (see BusLocation).
+        **device_options: Options of FakeDevice.
+    """
+
+    def __init__(self, seed: Optional[int] = None, bus_number: int = 1, **device_options: Any) -> None:
+        self.devices: Dict[int, FakeDevice] = {}
+        self.device_options: Dict[str, Any] = device_options
+        self.bus_lock: threading.RLock = threading.RLock()
+        self.location: BusLocation = BusLocation(bus_number)
+        self.muxes: Dict[int, FakeMux] = {}
+        self.channels: Dict[Tuple[int, int], SimulatedBackend] = {}
+        self._select: Optional[Callable[[], None]] = None
+        self._rng: random.Random = random.Random(seed)
+        _simulated.add(self)
+
+    def channel(self, mux_address: int, channel: int) -> 'SimulatedBackend':
+        """Returns the backend of the devices behind a channel (0-7) of a fake multiplexer on the same bus."""
+        backend = self.channels.get((mux_address, channel))
+        if backend is None:
+            mux = self.muxes.get(mux_address)
+            if mux is None:
+                mux = self.muxes[mux_address] = FakeMux(mux_address, self.device_options.get('transaction_delay',
+                                                                                           0.0005))
+            backend = SimulatedBackend(self._rng.randrange(2 ** 32), self.location.bus, **self.device_options)
+            backend.bus_lock, backend.muxes = self.bus_lock, self.muxes
+            backend.location = BusLocation(self.location.bus, mux_address, channel)
+            backend._select = lambda: mux.select(channel)
+            self.channels[(mux_address, channel)] = backend
+        return backend
+
+    def add_device(self, device: 'FakeDevice') -> 'FakeDevice':
+        """Registers a preconfigured fake device at its address."""
+        self.devices[device.address] = device
+        return device
+
+    @staticmethod
+    def ezo_commands() -> Type['FakeEZOCommands']:
+        """Returns the built-in EZO command classes."""
+        return FakeEZOCommands
+
+    @staticmethod
+    def bme680_constants() -> Type['FakeBME680Constants']:
+        """Returns the built-in BME680 register constants."""
+        return FakeBME680Constants
+
+    def open_ezo(self, address: int) -> 'FakeEZO':
+        """Opens a fake Atlas Scientific EZO circuit."""
+        return self._open(FakeEZO, address)
+
+    def open_bme680(self, address: int) -> 'FakeBME680':
+        """Opens a fake Bosch BME680 sensor."""
+        return self._open(FakeBME680, address)
+
+    def open_seesaw(self, address: int) -> 'FakeSeesaw':
+        """Opens a fake Adafruit Seesaw soil sensor."""
+        return self._open(FakeSeesaw, address)
+
+    # Protected methods
+    def _open(self, device_class: type, address: int) -> 'FakeDevice':
+        """Helper method to return the registered device at an address, creating it if needed."""
+        device = self.devices.get(address)
+        if device is None:
+            device = device_class(address, seed=self._rng.randrange(2 ** 32), bus_lock=self.bus_lock,
+                                  bus_select=self._select, **self.device_options)
+            self.devices[address] = device
+        elif not isinstance(device, device_class):
+            raise OSError(f"Device at address 0x{address:02x} is not a {device_class.__name__}")
+        if device.offline:
+            raise OSError(f"[Errno 121] Remote I/O error (simulated, address 0x{address:02x})")
+        return device
+
+
+class FakeEZOCommands:
+    """Built-in equivalents of the atlas_i2c commands used by the sensor classes."""
+
+    class Read:
+        """Take a reading."""
+
+        name: str = 'R'
+        processing_delay: int = 1500
+
+        @classmethod
+        def format_command(cls) -> str:
+            return cls.name
+
+    class CalibratePh:
+        """Calibrate the pH sensor."""
+
+        arguments: Tuple[str, ...] = ('mid', 'low', 'high', 'clear', '?')
+        name: str = 'Cal'
+        processing_delay: int = 900
+        calibration_points: Dict[str, float] = {'mid': 7.00, 'low': 4.00, 'high': 10.00}
+
+        @classmethod
+        def format_command(cls, arg: str = '?') -> str:
+            if arg not in cls.arguments:
+                raise ValueError(f"{arg} must be one of {cls.arguments}")
+            if arg in cls.calibration_points:
+                return f"{cls.name},{arg},{cls.calibration_points[arg]}"
+            return f"{cls.name},{arg}"
+
+
+class FakeBME680Constants:
+    """Built-in equivalents of the bme680 register constants used by the sensor classes."""
+
+    OS_NONE, OS_1X, OS_2X, OS_4X, OS_8X, OS_16X = range(6)
+    FILTER_SIZE_0, FILTER_SIZE_1, FILTER_SIZE_3, FILTER_SIZE_7 = range(4)
+    FILTER_SIZE_15, FILTER_SIZE_31, FILTER_SIZE_63, FILTER_SIZE_127 = range(4, 8)
+    DISABLE_GAS_MEAS = 0
+    ENABLE_GAS_MEAS = -1
+
+
+class FakeMux:
+    """
+    Fake TCA9548A I2C multiplexer. Selecting another channel than the current one costs one transaction.
+
+    Args:
+        address (int): The I2C address of the multiplexer (0x70-0x77).
+        transaction_delay (float): Time in seconds taken by the channel switch transaction.
+    """
+
+    def __init__(self, address: int, transaction_delay: float = 0.0005) -> None:
+        self.address: int = address
+        self.transaction_delay: float = transaction_delay
+        self.selected: Optional[int] = None
+        self.switches: int = 0
+
+    def select(self, channel: int) -> None:
+        """Switches the multiplexer to a channel; called with the bus lock held."""
+        if channel != self.selected:
+            time.sleep(self.transaction_delay)
+            self.selected = channel
+            self.switches += 1
+
+
+class FakeDevice:
+    """
+    Base class for the fake devices.
+
+    Args:
+        address (int): The I2C address of the device.
+        transaction_delay (float): Time in seconds taken by each bus transaction.
+        conversion_delay (float, optional): Time in seconds taken by a measurement; defaults per device.
+        jitter (float): Maximum random time in seconds added to every delay.
+        failure_rate (float): Probability of a bus transaction failing with an OSError.
+        hang_rate (float): Probability of a bus transaction hanging for hang_time seconds (stuck bus).
+        hang_time (float): Time in seconds a hung transaction blocks, holding the bus lock.
+        noise (float): Standard deviation of the gaussian noise added to the simulated values.
+        seed (int, optional): Seed of the random generator, for reproducible runs.
+        bus_lock (RLock, optional): Lock shared by the devices of one simulated bus.
+        bus_select (callable, optional): Called with the bus lock held before every transaction, e.g. to
+            switch a multiplexer to the channel of the device.
+    """
+
+    default_conversion_delay: float = 0.0
+
+    def __init__(self, address: int, transaction_delay: float = 0.0005, conversion_delay: Optional[float] = None,
+                 jitter: float = 0.0, failure_rate: float = 0.0, noise: float = 0.0, hang_rate: float = 0.0,
+                 hang_time: float = 3600.0, seed: Optional[int] = None, bus_lock: Optional[threading.RLock] = None,
+                 bus_select: Optional[Callable[[], None]] = None) -> None:
+        self.address: int = address
+        self.transaction_delay: float = transaction_delay
+        self.conversion_delay: float = self.default_conversion_delay if conversion_delay is None \
+            else conversion_delay
+        self.jitter: float = jitter
+        self.failure_rate: float = failure_rate
+        self.hang_rate: float = hang_rate
+        self.hang_time: float = hang_time
+        self.noise: float = noise
+        self.offline: bool = False
+        self.transactions: int = 0
+        self.bus_lock: threading.RLock = bus_lock or threading.RLock()
+        self.bus_select: Optional[Callable[[], None]] = bus_select
+        self._rng: random.Random = random.Random(seed)
+        self._lock: threading.Lock = threading.Lock()
+
+    # Protected methods
+    def _transaction(self) -> None:
+        """Helper method to simulate one bus transaction, including injected failures."""
+        with self._lock:
+            self.transactions += 1
+            failed = self.offline or self._rng.random() < self.failure_rate
+            delay = self._delay(self.transaction_delay)
+            if self.hang_rate and self._rng.random() < self.hang_rate:
+                delay += self.hang_time
+        with self.bus_lock:
+            if self.bus_select is not None:
+                self.bus_select()
+            time.sleep(delay)
+        if failed:
+            raise OSError(f"[Errno 121] Remote I/O error (simulated, address 0x{self.address:02x})")
+
+    def _delay(self, delay: float) -> float:
+        """Helper method to add jitter to a delay."""
+        return delay + (self._rng.uniform(0.0, self.jitter) if self.jitter else 0.0)
+
+    def _sample(self, value: float) -> float:
+        """Helper method to add noise to a simulated value."""
+        with self._lock:
+            return value + (self._rng.gauss(0.0, self.noise) if self.noise else 0.0)
+
+
+class FakeCommandResponse:
+    """Fake atlas_i2c.CommandResponse."""
+
+    def __init__(self, sensor_address: int, original_cmd: str, status_code: int, data: bytes) -> None:
+        self.sensor_address: int = sensor_address
+        self.original_cmd: str = original_cmd
+        self.status_code: int = status_code
+        self.data: bytes = data
+
+
+class FakeEZO(FakeDevice):
+    """
+    Fake Atlas Scientific EZO circuit, mimicking atlas_i2c.AtlasI2C.
+
+    Responses read before conversion_delay has elapsed return the 'still processing' code (254).
+
+    Args:
+        address (int): The I2C address of the device.
+        value (float): The simulated reading; defaults to a typical value for the pH or EC address.
+        **kwargs: Options of FakeDevice.
+    """
+
+    STATUS_SUCCESS = 1
+    STATUS_SYNTAX_ERROR = 2
+    STATUS_PROCESSING = 254
+    STATUS_NO_DATA = 255
+    default_conversion_delays: Dict[int, float] = {0x63: 0.9, 0x64: 0.6}
+    default_values: Dict[int, float] = {0x63: 6.2, 0x64: 1200.0}
+
+    def __init__(self, address: int, value: Optional[float] = None, **kwargs: Any) -> None:
+        if kwargs.get('conversion_delay') is None:
+            kwargs['conversion_delay'] = self.default_conversion_delays.get(address, 0.9)
+        super().__init__(address, **kwargs)
+        self.value: float = self.default_values.get(address, 0.0) if value is None else value
+        self.calibration_points: Dict[str, float] = {}
+        self.temperature: float = 25.0
+        self._command: Optional[str] = None
+        self._ready_at: float = 0.0
+
+    def write(self, cmd: str) -> None:
+        """Sends a command to the fake circuit."""
+        self._transaction()
+        self._command = cmd
+        delay = self.conversion_delay if cmd.upper() == 'R' or cmd.upper().startswith('RT,') or cmd.startswith('Cal') \
+            else 0.3
+        self._ready_at = time.monotonic() + self._delay(delay)
+
+    def read(self, original_cmd: str, num_of_bytes: int = 31) -> FakeCommandResponse:
+        """Reads the response to the last command sent to the fake circuit."""
+        self._transaction()
+        if self._command is None:
+            return FakeCommandResponse(self.address, original_cmd, self.STATUS_NO_DATA, b"")
+        if time.monotonic() < self._ready_at:
+            return FakeCommandResponse(self.address, original_cmd, self.STATUS_PROCESSING, b"")
+        command, self._command = self._command, None
+        status_code, data = self._execute(command)
+        return FakeCommandResponse(self.address, original_cmd, status_code, data[:num_of_bytes - 1])
+
+    def query(self, command: str, processing_delay: Optional[int] = None) -> FakeCommandResponse:
+        """Sends a command and reads the response, waiting processing_delay milliseconds in between."""
+        self.write(command)
+        if processing_delay:
+            time.sleep(processing_delay / 1000)
+        return self.read(original_cmd=command)
+
+    def close(self) -> None:
+        """Closes the fake circuit."""
+        pass
+
+    # Protected methods
+    def _execute(self, command: str) -> Tuple[int, bytes]:
+        """Helper method to build the response to a command."""
+        name, _, argument = command.partition(',')
+        if name.upper() == 'RT':
+            # Set the compensation temperature, then read like 'R'
+            try:
+                self.temperature = float(argument)
+            except ValueError:
+                return self.STATUS_SYNTAX_ERROR, b""
+            name = 'R'
+        if name.upper() == 'R':
+            return self.STATUS_SUCCESS, f"{self._sample(self.value):.3f}".encode()
+        if name == 'Cal':
+            point, _, value = argument.partition(',')
+            if point in ('low', 'mid', 'high'):
+                self.calibration_points[point] = float(value)
+            elif point == 'clear':
+                self.calibration_points.clear()
+            else:
+                return self.STATUS_SYNTAX_ERROR, b""
+            return self.STATUS_SUCCESS, b""
+        if name == 'Status':
+            return self.STATUS_SUCCESS, b"?STATUS,P,5.038"
+        return self.STATUS_SUCCESS, b""
+
+
+class FakeBME680Data:
+    """Fake bme680 FieldData."""
+
+    def __init__(self) -> None:
+        self.status: int = 0
+        self.heat_stable: bool = False
+        self.temperature: float = 0.0
+        self.humidity: float = 0.0
+        self.pressure: float = 0.0
+        self.gas_resistance: float = 0.0
+
+
+class FakeBME680(FakeDevice):
+    """
+    Fake Bosch BME680, mimicking bme680.BME680.
+
+    Measurement time and noise follow the oversampling and IIR filter settings.
+
+    Args:
+        address (int): The I2C address of the device.
+        temperature (float): The simulated temperature in degrees Celsius.
+        humidity (float): The simulated relative humidity in percent.
+        pressure (float): The simulated pressure in hPa.
+        **kwargs: Options of FakeDevice.
+    """
+
+    default_conversion_delay: float = 0.033
+    # Oversampling counts and IIR filter coefficients, indexed by the driver register values (OS_*, FILTER_SIZE_*)
+    OVERSAMPLING_COUNTS = (0, 1, 2, 4, 8, 16)
+    FILTER_COEFFICIENTS = (0, 1, 3, 7, 15, 31, 63, 127)
+    POLL_PERIOD = 0.01
+    fields = {'temperature': 'temperature_oversample', 'humidity': 'humidity_oversample',
+              'pressure': 'pressure_oversample'}
+
+    def __init__(self, address: int, temperature: float = 23.5, humidity: float = 55.0, pressure: float = 1013.25,
+                 **kwargs: Any) -> None:
+        super().__init__(address, **kwargs)
+        self.temperature: float = temperature
+        self.humidity: float = humidity
+        self.pressure: float = pressure
+        self.data: FakeBME680Data = FakeBME680Data()
+        # Settings applied by the bme680.BME680 constructor
+        self.settings: Dict[str, int] = {'temperature_oversample': 4, 'humidity_oversample': 2,
+                                         'pressure_oversample': 3, 'filter': 2, 'gas': 1}
+        self._filtered: Dict[str, float] = {}
+        self._ready_at: float = 0.0
+
+    @property
+    def measurement_duration(self) -> float:
+        """Duration in seconds of a forced measurement with the current settings."""
+        return self.conversion_delay * self._profile_duration(self.settings) / self._profile_duration(
+            {'temperature_oversample': 4, 'humidity_oversample': 2, 'pressure_oversample': 3})
+
+    def set_temperature_oversample(self, value: int) -> None:
+        """Sets the temperature oversampling."""
+        self._set('temperature_oversample', value)
+
+    def set_humidity_oversample(self, value: int) -> None:
+        """Sets the humidity oversampling."""
+        self._set('humidity_oversample', value)
+
+    def set_pressure_oversample(self, value: int) -> None:
+        """Sets the pressure oversampling."""
+        self._set('pressure_oversample', value)
+
+    def set_filter(self, value: int) -> None:
+        """Sets the IIR filter size."""
+        self._set('filter', value)
+        self._filtered.clear()
+
+    def set_gas_status(self, value: int) -> None:
+        """Enables or disables the gas measurement."""
+        self._set('gas', value)
+
+    def get_sensor_data(self) -> bool:
+        """Triggers a forced-mode measurement, polls until it completes and stores the results in data."""
+        self._transaction()
+        return self._collect(time.monotonic() + self._delay(self.measurement_duration), 0.0)
+
+    def get_sensor_data_timed(self, duration: float) -> bool:
+        """Triggers a forced-mode measurement, sleeps duration seconds, then fetches the results (see i2c_bus)."""
+        self.start_measurement()
+        return self._collect(self._ready_at, duration)
+
+    def start_measurement(self) -> None:
+        """Triggers a forced-mode measurement without waiting for it (see i2c_bus)."""
+        self._transaction()
+        self._ready_at = time.monotonic() + self._delay(self.measurement_duration)
+
+    def fetch_measurement(self) -> bool:
+        """Fetches the results of the measurement triggered by start_measurement(), polling if it is not complete."""
+        return self._collect(self._ready_at, 0.0)
+
+    # Protected methods
+    def _set(self, setting: str, value: int) -> None:
+        """Helper method to store a configuration setting."""
+        self._transaction()
+        self.settings[setting] = value
+
+    def _profile_duration(self, settings: Dict[str, int]) -> int:
+        """Helper method to compute the Bosch measurement duration in milliseconds of oversampling settings."""
+        cycles = sum(self.OVERSAMPLING_COUNTS[settings[setting]] for setting in self.fields.values())
+        return (cycles * 1963 + 477 * 9 + 500) // 1000 + 1
+
+    def _collect(self, ready_at: float, duration: float) -> bool:
+        """Helper method to wait for a measurement like the driver (10 polls, 10 ms apart) and store its results."""
+        time.sleep(duration)
+        for attempt in range(10):
+            self._transaction()
+            if time.monotonic() >= ready_at:
+                break
+            time.sleep(self.POLL_PERIOD)
+        else:
+            return False
+        self.data.status = 0x80
+        coefficient = self.FILTER_COEFFICIENTS[self.settings['filter']]
+        for field, setting in self.fields.items():
+            count = self.OVERSAMPLING_COUNTS[self.settings[setting]]
+            if not count:
+                continue
+            with self._lock:
+                value = getattr(self, field) + (self._rng.gauss(0.0, self.noise / count ** 0.5) if self.noise else 0.0)
+            previous = self._filtered.get(field)
+            if coefficient and previous is not None:
+                value = (previous * coefficient + value) / (coefficient + 1)
+            self._filtered[field] = value
+            setattr(self.data, field, value)
+        return True
+
+
+class FakeSeesaw(FakeDevice):
+    """
+    Fake Adafruit Seesaw soil sensor, mimicking adafruit_seesaw.seesaw.Seesaw.
+
+    Args:
+        address (int): The I2C address of the device.
+        moisture (float): The simulated capacitive moisture reading (200-2000).
+        temperature (float): The simulated temperature in degrees Celsius.
+        **kwargs: Options of FakeDevice.
+    """
+
+    default_conversion_delay: float = 0.005
+
+    def __init__(self, address: int, moisture: float = 650.0, temperature: float = 21.0, **kwargs: Any) -> None:
+        super().__init__(address, **kwargs)
+        self.moisture: float = moisture
+        self.temperature: float = temperature
+
+    def moisture_read(self) -> int:
+        """Reads the capacitive moisture value."""
+        self._transaction()
+        # The Seesaw driver keeps the bus locked while it waits for the conversion
+        with self.bus_lock:
+            time.sleep(self._delay(self.conversion_delay))
+        return int(self._sample(self.moisture))
+
+    def get_temp(self) -> float:
+        """Reads the temperature in degrees Celsius."""
+        self._transaction()
+        return self._sample(self.temperature)
+
@@ -0,0 +1,182 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: breaker
+
+This module provides the circuit breakers of the sensor classes, one per I2C device address.
+An unplugged probe makes every read wait for the bus error; without a breaker, a polling loop keeps
+hammering the dead device and delays the reads of the healthy ones. A breaker has three states:
+    closed      Calls go through; failure_threshold consecutive failures open the breaker.
+    open        Calls fail fast with SensorConnectionError, without touching the bus, until the
+                backoff has elapsed.
+    half-open   A single call goes through as a reconnect probe (connect(), setup(), then the read);
+                success closes the breaker, failure opens it again with twice the backoff
+                (up to max_backoff). Other calls keep failing fast meanwhile.
+
+Breaker states are exported as the growhub_breaker_state gauge (0 closed, 1 open, 2 half-open), with
+the growhub_breaker_trips_total and growhub_breaker_rejected_total counters (see metrics).
+
+Classes:
+    BreakerStatus: State and counters of a circuit breaker.
+    CircuitBreaker: Closed/open/half-open circuit breaker with exponential backoff.
+
+Usage:
+    from sensors import SensorAquatic
+
+    sensor_aquatic = SensorAquatic()
+    sensor_aquatic.connect()
+    ph = sensor_aquatic.read_ph()
+    for name, status in sensor_aquatic.breaker_status().items():
+        print(name, status.state, status.retry_in)     # e.g. aquatic@0x63 open 3.2
+"""
+
+
+# Standard library imports
+import threading
+import time
+import weakref
+# Third-party imports (venv)
+from typing import (
+    Dict,
+    NamedTuple,
+    Optional,
+    Tuple
+)
+# Codebase imports (firmware)
+from metrics import metrics
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+BREAKER_STATES = (CLOSED, OPEN, HALF_OPEN)
+
+# Circuit breakers of the process, exported by the collectors registered below
+_breakers: 'weakref.WeakSet[CircuitBreaker]' = weakref.WeakSet()
+
+
+class BreakerStatus(NamedTuple):
+    """
+    State and counters of a circuit breaker: consecutive failures, trips (closed to open), rejected
+    (failed fast) calls, current backoff and seconds until the next reconnect probe (0 unless open).
+    """
+
+    state: str
+    failures: int
+    trips: int
+    rejected: int
+    backoff: float
+    retry_in: float
+    last_error: Optional[str]
+
+
+class CircuitBreaker:
+    """
+    Closed/open/half-open circuit breaker with exponential backoff.
+
+    The caller asks allow() before a call and reports its outcome with record_success() or record_failure().
+
+    Args:
+        name (str): The breaker name, e.g. 'aquatic@0x63'.
+        failure_threshold (int): Consecutive failures that open the breaker.
+        backoff (float): Seconds before the first reconnect probe.
+        max_backoff (float): Upper bound in seconds of the doubling backoff.
+    """
+
+    def __init__(self, name: str, failure_threshold: int = 3, backoff: float = 2.0,
+                 max_backoff: float = 300.0) -> None:
+        self.name: str = name
+        self.failure_threshold: int = failure_threshold
+        self.base_backoff: float = backoff
+        self.max_backoff: float = max_backoff
+        self.state: str = CLOSED
+        self.failures: int = 0
+        self.trips: int = 0
+        self.rejected: int = 0
+        self.backoff: float = backoff
+        self.last_error: Optional[str] = None
+        self._retry_at: float = 0.0
+        self._lock: threading.Lock = threading.Lock()
+        _breakers.add(self)
+
+    def allow(self) -> bool:
+        """Returns whether a call may go through; moves an open breaker to half-open once its backoff has elapsed."""
+        with self._lock:
+            if self.state == OPEN and time.monotonic() >= self._retry_at:
+                self.state = HALF_OPEN
+                return True
+            if self.state == CLOSED:
+                return True
+            self.rejected += 1
+            return False
+
+    def record_success(self) -> None:
+        """Reports a successful call: closes the breaker and resets the backoff."""
+        with self._lock:
+            self.state, self.failures, self.backoff = CLOSED, 0, self.base_backoff
+
+    def record_failure(self, error: BaseException) -> None:
+        """
+        Reports a failed call: opens the breaker after failure_threshold consecutive failures,
+        or again with a doubled backoff if the call was the reconnect probe.
+
+        Args:
+            error (exception): The raised exception.
+        """
+        with self._lock:
+            self.failures += 1
+            self.last_error = str(error)
+            if self.state == HALF_OPEN:
+                self.backoff = min(2 * self.backoff, self.max_backoff)
+            elif self.state == CLOSED and self.failures >= self.failure_threshold:
+                self.trips += 1
+            else:
+                return
+            self.state, self._retry_at = OPEN, time.monotonic() + self.backoff
+
+    def release(self) -> None:
+        """Reports a call that did not reach the device (e.g. invalid arguments); a pending probe is retried."""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self.state, self._retry_at = OPEN, time.monotonic()
+
+    def reset(self) -> None:
+        """Closes the breaker and clears its counters."""
+        with self._lock:
+            self.state, self.failures, self.trips, self.rejected = CLOSED, 0, 0, 0
+            self.backoff, self.last_error = self.base_backoff, None
+
+    def status(self) -> BreakerStatus:
+        """Returns the state and counters of the breaker."""
+        with self._lock:
+            retry_in = max(self._retry_at - time.monotonic(), 0.0) if self.state == OPEN else 0.0
+            return BreakerStatus(self.state, self.failures, self.trips, self.rejected, self.backoff, retry_in,
+                                 self.last_error)
+
+
+def _collect(field: str) -> Dict[Tuple[str, ...], float]:
+    """
+    Helper function to export a field of the breakers of the process, keyed by breaker name.
+
+    Breakers sharing a name (several instances of a sensor class) are merged: the most severe state
+    and the sum of the counters.
+
+    Args:
+        field (str): 'state', 'trips' or 'rejected'.
+    """
+    values: Dict[Tuple[str, ...], float] = {}
+    for breaker in list(_breakers):
+        key = (breaker.name,)
+        if field == 'state':
+            values[key] = max(values.get(key, 0), BREAKER_STATES.index(breaker.state))
+        else:
+            values[key] = values.get(key, 0) + getattr(breaker, field)
+    return values
+
+
+metrics.register_collector('growhub_breaker_state', "Circuit breaker state by device (0 closed, 1 open, 2 half-open).",
+                           ('breaker',), lambda: _collect('state'), metric_type='gauge')
+metrics.register_collector('growhub_breaker_trips_total', "Circuit breaker trips by device.", ('breaker',),
+                           lambda: _collect('trips'))
+metrics.register_collector('growhub_breaker_rejected_total', "Calls failed fast by an open circuit breaker by device.",
+                           ('breaker',), lambda: _collect('rejected'))
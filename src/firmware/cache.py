@@ -0,0 +1,151 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: cache
+
+This module provides the freshness-aware read cache used by the sensor classes. A reading
+younger than the max-age of its channel is served from memory instead of the I2C bus, and
+concurrent requests for the same device are coalesced so only one query is in flight per device.
+
+Classes:
+    CacheStats: Hit/miss counters of a cached channel.
+    ReadCache: Per-channel read cache with max-age, request coalescing and hit/miss counters.
+
+Usage:
+    from sensors import SensorAquatic
+
+    sensor_aquatic = SensorAquatic(max_age={'ph': 5.0})
+    sensor_aquatic.connect()
+    ph = sensor_aquatic.read_ph()                       # Bus read
+    ph = sensor_aquatic.read_ph()                       # Served from the cache
+    ph = sensor_aquatic.read_ph(force_refresh=True)     # Bus read
+    print(sensor_aquatic.cache.stats())
+"""
+
+
+# Standard library imports
+import threading
+import time
+# Third-party imports (venv)
+from typing import (
+    Callable,
+    Dict,
+    Hashable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple
+)
+
+
+class CacheStats(NamedTuple):
+    """Hit/miss counters of a cached channel. Coalesced requests waited for another caller's bus read."""
+
+    hits: int
+    misses: int
+    coalesced: int
+
+
+class ReadCache:
+    """
+    Per-channel read cache with max-age, request coalescing and hit/miss counters.
+
+    Args:
+        max_age (dict, optional): Maximum age in seconds of a cached reading, keyed by channel name.
+        default_max_age (float): Maximum age of channels missing from max_age; 0 disables caching.
+    """
+
+    def __init__(self, max_age: Optional[Mapping[str, float]] = None, default_max_age: float = 0.0) -> None:
+        self.max_age: Dict[str, float] = dict(max_age or {})
+        self.default_max_age: float = default_max_age
+        self._entries: Dict[str, Tuple[float, float]] = {}
+        self._counters: Dict[str, list] = {}
+        self._device_locks: Dict[Hashable, threading.Lock] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, channel: str, device: Hashable, loader: Callable[[], float], force_refresh: bool = False) -> float:
+        """
+        Returns a fresh reading of a channel, calling loader() only if the cached reading is too old.
+
+        Args:
+            channel (str): The channel name, e.g. 'aquatic.ph'.
+            device (hashable): Key of the device serving the channel; one loader runs per device at a time.
+            loader (callable): Reads the channel from the bus.
+            force_refresh (bool): Bypass the cached reading and always call the loader.
+        """
+        max_age = self.max_age.get(channel, self.default_max_age)
+        if not force_refresh:
+            value = self._lookup(channel, max_age)
+            if value is not None:
+                self._count(channel, 0)
+                return value
+        with self._device_lock(device):
+            if not force_refresh:
+                # Another caller may have refreshed the channel while this one waited for the device
+                value = self._lookup(channel, max_age)
+                if value is not None:
+                    self._count(channel, 2)
+                    return value
+            self._count(channel, 1)
+            value = loader()
+            self.append(time.time(), {channel: value})
+            return value
+
+    def append(self, timestamp: float, readings: Mapping[str, float]) -> None:
+        """
+        Stores readings in the cache.
+
+        Args:
+            timestamp (float): UNIX timestamp of the readings.
+            readings (dict): Reading values keyed by channel name, e.g. {'aquatic.ph': 6.2}.
+        """
+        with self._lock:
+            for channel, value in readings.items():
+                entry = self._entries.get(channel)
+                if entry is None or entry[0] <= timestamp:
+                    self._entries[channel] = (timestamp, value)
+
+    def invalidate(self, channel: Optional[str] = None) -> None:
+        """Drops the cached reading of a channel, or of all channels if omitted."""
+        with self._lock:
+            if channel is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(channel, None)
+
+    def latest(self, channel: str) -> Optional[Tuple[float, float]]:
+        """Returns the cached (timestamp, value) of a channel regardless of its age, or None."""
+        with self._lock:
+            return self._entries.get(channel)
+
+    def stats(self) -> Dict[str, CacheStats]:
+        """Returns the hit/miss counters, keyed by channel name."""
+        with self._lock:
+            return {channel: CacheStats(*counters) for channel, counters in self._counters.items()}
+
+    # Protected methods
+    def _lookup(self, channel: str, max_age: float) -> Optional[float]:
+        """Helper method to return the cached value of a channel if it is younger than max_age."""
+        if max_age <= 0:
+            return None
+        with self._lock:
+            entry = self._entries.get(channel)
+        if entry is None or time.time() - entry[0] > max_age:
+            return None
+        return entry[1]
+
+    def _count(self, channel: str, counter: int) -> None:
+        """Helper method to increment a counter (0: hits, 1: misses, 2: coalesced) of a channel."""
+        with self._lock:
+            counters = self._counters.get(channel)
+            if counters is None:
+                counters = self._counters[channel] = [0, 0, 0]
+            counters[counter] += 1
+
+    def _device_lock(self, device: Hashable) -> threading.Lock:
+        """Helper method to return the in-flight lock of a device."""
+        with self._lock:
+            lock = self._device_locks.get(device)
+            if lock is None:
+                lock = self._device_locks[device] = threading.Lock()
+            return lock
@@ -0,0 +1,143 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: filters
+
+This module provides the burst filtering stage of the sensor classes. A burst is N raw samples
+of one or more channels taken back to back; all channels of a burst are filtered in one batch
+with vectorized NumPy operations:
+    1. Outlier rejection: samples whose modified z-score (based on the median absolute deviation,
+       MAD) exceeds the threshold are dropped.
+    2. Estimation: median, mean or exponential moving average (EMA) of the remaining samples.
+    3. Quality: variance of the remaining samples and the number of rejected samples.
+
+Values are returned unrounded; the sensor classes round them to their decimal precision last.
+
+Classes:
+    FilteredReading: Filtered value of one channel with its variance and rejection count.
+
+Functions:
+    filter_bursts: Filters a (channels, samples) array of raw samples in one batch.
+    filter_burst: Filters the raw samples of a single channel.
+    check_filter_arguments: Validates the estimator and its settings.
+
+Usage:
+    from sensors import SensorSoil
+
+    sensor_soil = SensorSoil()
+    sensor_soil.connect()
+    bursts = sensor_soil.read_burst(samples=8, method='median')
+    moisture, quality = bursts['moisture'].value, bursts['moisture'].quality
+"""
+
+
+# Standard library imports
+import warnings
+# Third-party imports (venv)
+import numpy as np
+from typing import (
+    NamedTuple,
+    Sequence,
+    Tuple
+)
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+FILTER_METHODS = ('median', 'mean', 'ema')
+# Modified z-score constants (Iglewicz and Hoaglin): MAD and mean absolute deviation to standard deviation
+_MAD_SCALE = 0.6745
+_MEAN_AD_SCALE = 0.7979
+
+
+class FilteredReading(NamedTuple):
+    """Filtered value of one channel, with the variance of the kept samples and the number of rejected samples."""
+
+    value: float
+    variance: float
+    samples: int
+    rejected: int
+
+    @property
+    def quality(self) -> float:
+        """Fraction of the burst samples kept after outlier rejection (0 to 1)."""
+        return (self.samples - self.rejected) / self.samples if self.samples else 0.0
+
+
+def filter_bursts(samples: np.ndarray, method: str = 'median', mad_threshold: float = 3.5,
+                  ema_alpha: float = 0.3) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Filters a (channels, samples) array of raw samples in one batch.
+
+    Returns the filtered values, the variances of the kept samples and the numbers of rejected
+    samples, one entry per channel. NaN samples (failed reads) count as rejected.
+
+    Args:
+        samples (ndarray): Raw samples, one row per channel in acquisition order.
+        method (str): The estimator: 'median', 'mean' or 'ema' (most recent samples weigh most).
+        mad_threshold (float): Modified z-score above which a sample is rejected; 0 disables rejection.
+        ema_alpha (float): Smoothing factor of the EMA, in (0, 1].
+    """
+    check_filter_arguments(method, mad_threshold, ema_alpha)
+    data = np.atleast_2d(np.asarray(samples, dtype=np.float64))
+    with warnings.catch_warnings():
+        # All-NaN rows (every read failed) produce NaN results, not warnings
+        warnings.simplefilter('ignore', RuntimeWarning)
+        kept = ~np.isnan(data)
+        if mad_threshold:
+            median = np.nanmedian(data, axis=1, keepdims=True)
+            deviation = np.abs(data - median)
+            mad = np.nanmedian(deviation, axis=1, keepdims=True)
+            # Quantized channels often have MAD = 0; fall back to the mean absolute deviation
+            scale = np.where(mad > 0, mad / _MAD_SCALE, np.nanmean(deviation, axis=1, keepdims=True) / _MEAN_AD_SCALE)
+            kept &= ~(deviation > mad_threshold * np.where(scale > 0, scale, np.inf))
+        filtered = np.where(kept, data, np.nan)
+        counts = kept.sum(axis=1)
+
+        if method == 'median':
+            values = np.nanmedian(filtered, axis=1)
+        elif method == 'mean':
+            values = np.nanmean(filtered, axis=1)
+        else:
+            weights = ema_alpha * (1 - ema_alpha) ** np.arange(data.shape[1] - 1, -1, -1, dtype=np.float64)
+            weights = np.where(kept, weights, 0.0)
+            totals = weights.sum(axis=1)
+            values = np.where(totals > 0, (weights * np.nan_to_num(data)).sum(axis=1) / np.where(totals > 0, totals, 1),
+                              np.nan)
+        variances = np.where(counts > 1, np.nanvar(filtered, axis=1, ddof=1), np.where(counts == 1, 0.0, np.nan))
+    return values, variances, data.shape[1] - counts
+
+
+def filter_burst(samples: Sequence[float], method: str = 'median', mad_threshold: float = 3.5,
+                 ema_alpha: float = 0.3) -> FilteredReading:
+    """
+    Filters the raw samples of a single channel (see filter_bursts).
+
+    Args:
+        samples (sequence): Raw samples in acquisition order.
+        method (str): The estimator: 'median', 'mean' or 'ema'.
+        mad_threshold (float): Modified z-score above which a sample is rejected; 0 disables rejection.
+        ema_alpha (float): Smoothing factor of the EMA, in (0, 1].
+    """
+    values, variances, rejected = filter_bursts(np.asarray(samples, dtype=np.float64)[np.newaxis, :], method,
+                                                mad_threshold, ema_alpha)
+    return FilteredReading(float(values[0]), float(variances[0]), len(samples), int(rejected[0]))
+
+
+def check_filter_arguments(method: str, mad_threshold: float, ema_alpha: float) -> None:
+    """
+    Validates the estimator and its settings, raising CommandArgumentError if one is invalid.
+
+    Args:
+        method (str): The estimator: 'median', 'mean' or 'ema'.
+        mad_threshold (float): Modified z-score above which a sample is rejected; must not be negative.
+        ema_alpha (float): Smoothing factor of the EMA, in (0, 1].
+    """
+    if method not in FILTER_METHODS:
+        raise CommandArgumentError(f"Invalid burst filter method.\nChoose one of {', '.join(FILTER_METHODS)}.",
+                                   parameter="method", value=method)
+    if not 0 < ema_alpha <= 1 or mad_threshold < 0:
+        raise CommandArgumentError("Burst filter requires 0 < ema_alpha <= 1 and mad_threshold >= 0.",
+                                   parameter="ema_alpha" if not 0 < ema_alpha <= 1 else "mad_threshold",
+                                   value=ema_alpha if not 0 < ema_alpha <= 1 else mad_threshold)
@@ -0,0 +1,379 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: i2c_bus
+
+This module provides the shared I2C bus manager of the GrowHub device. The manager owns a single
+smbus2 handle per physical bus and hands out per-address device views. Every transaction holds the
+bus lock, so concurrent readers (acquisition threads, API, scheduler) can never interleave their
+messages, and handles are reused across sensor reconnects instead of being reopened.
+
+Devices behind a TCA9548A-style multiplexer are opened on a multiplexer channel, which has the
+interface of a bus: every transaction first switches the multiplexer to the channel, unless it is
+already selected. The selected channel is tracked per process, so a multiplexer must not be shared
+between processes (e.g. SupervisedSensor workers, see supervisor).
+
+The views are adapted to the interfaces expected by the sensor drivers:
+    EZO circuits: atlas_i2c.AtlasI2C on top of a device file backed by the shared handle.
+    BME680: the shared handle, wrapped in a locking SMBus proxy (bme680.BME680 i2c_device); the driver
+        gains get_sensor_data_timed(), which sleeps the computed measurement time instead of polling, and
+        start_measurement()/fetch_measurement() to overlap the measurement with other bus traffic.
+    Seesaw: a busio.I2C compatible adapter (adafruit_seesaw.seesaw.Seesaw i2c_bus).
+
+Classes:
+    I2CBus: One physical I2C bus: shared handle, transaction lock and transaction counter.
+    I2CMux: TCA9548A-style multiplexer on a shared bus, with the selected channel and switch counter.
+    I2CMuxChannel: One downstream channel of a multiplexer, with the interface of I2CBus.
+    I2CDeviceView: Raw read/write access to one address on a shared bus.
+    I2CBusManager: Registry of the shared buses, opening the sensor drivers on top of them.
+
+Usage:
+    from i2c_bus import bus_manager
+
+    ezo_ph = bus_manager.open_ezo(0x63)
+    bme680_sensor = bus_manager.open_bme680(0x76)
+    soil_sensor = bus_manager.open_seesaw(0x36, mux=(0x70, 3))
+    print(bus_manager.stats())
+"""
+
+
+# Standard library imports
+import threading
+import time
+from functools import lru_cache
+from importlib import import_module
+from types import ModuleType
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Union
+)
+# Codebase imports (firmware)
+from metrics import metrics
+
+
+DEFAULT_BUS = 1
+
+
+class I2CBus:
+    """
+    One physical I2C bus: shared smbus2 handle, transaction lock and transaction counter.
+
+    The handle is opened on first use and kept open until close().
+
+    Args:
+        bus_number (int): The number of the bus, i.e. /dev/i2c-<bus_number>.
+    """
+
+    def __init__(self, bus_number: int = DEFAULT_BUS) -> None:
+        self.bus_number: int = bus_number
+        self.lock: threading.RLock = threading.RLock()
+        self.transactions: int = 0
+        self._handle: Any = None
+
+    @property
+    def handle(self) -> Any:
+        """The shared smbus2.SMBus handle of the bus."""
+        if self._handle is None:
+            with self.lock:
+                if self._handle is None:
+                    self._handle = import_module('smbus2').SMBus(self.bus_number)
+        return self._handle
+
+    def transaction(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Runs one bus transaction (a call on the shared handle) while holding the bus lock."""
+        with self.lock:
+            self.transactions += 1
+            return function(*args)
+
+    def rdwr(self, *messages: Any) -> None:
+        """Runs combined read/write messages (smbus2.i2c_msg) as one transaction."""
+        self.transaction(self.handle.i2c_rdwr, *messages)
+
+    def close(self) -> None:
+        """Closes the shared handle; it is reopened on the next transaction."""
+        with self.lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+
+
+class I2CMux:
+    """
+    TCA9548A-style I2C multiplexer on a shared bus: one downstream channel is connected at a time.
+
+    Args:
+        bus (I2CBus): The shared bus.
+        address (int): The I2C address of the multiplexer (0x70-0x77).
+    """
+
+    def __init__(self, bus: I2CBus, address: int) -> None:
+        self.bus: I2CBus = bus
+        self.address: int = address
+        self.selected: Optional[int] = None
+        self.switches: int = 0
+        self._channels: Dict[int, I2CMuxChannel] = {}
+
+    def channel(self, channel: int) -> 'I2CMuxChannel':
+        """Returns a downstream channel (0-7) of the multiplexer."""
+        if not 0 <= channel < 8:
+            raise ValueError(f"Invalid multiplexer channel {channel}, expected 0-7")
+        with self.bus.lock:
+            view = self._channels.get(channel)
+            if view is None:
+                view = self._channels[channel] = I2CMuxChannel(self, channel)
+            return view
+
+    def select(self, channel: int) -> None:
+        """Connects a downstream channel, unless it is already selected. Called with the bus lock held."""
+        if channel != self.selected:
+            # Invalidated first: if the write fails, the next transaction selects again
+            self.selected = None
+            self.bus.transaction(self.bus.handle.write_byte, self.address, 1 << channel)
+            self.selected = channel
+            self.switches += 1
+
+
+class I2CMuxChannel:
+    """
+    One downstream channel of a multiplexer, with the interface of I2CBus (lock, handle, transaction, rdwr).
+
+    Every transaction switches the multiplexer to the channel first, under the bus lock.
+
+    Args:
+        mux (I2CMux): The multiplexer.
+        channel (int): The channel number (0-7).
+    """
+
+    def __init__(self, mux: I2CMux, channel: int) -> None:
+        self.mux: I2CMux = mux
+        self.channel: int = channel
+        self.bus_number: int = mux.bus.bus_number
+        self.lock: threading.RLock = mux.bus.lock
+
+    @property
+    def handle(self) -> Any:
+        """The shared smbus2.SMBus handle of the bus."""
+        return self.mux.bus.handle
+
+    def transaction(self, function: Callable[..., Any], *args: Any) -> Any:
+        """Runs one bus transaction on the channel, switching the multiplexer first if needed."""
+        with self.lock:
+            self.mux.select(self.channel)
+            return self.mux.bus.transaction(function, *args)
+
+    def rdwr(self, *messages: Any) -> None:
+        """Runs combined read/write messages (smbus2.i2c_msg) as one transaction on the channel."""
+        self.transaction(self.handle.i2c_rdwr, *messages)
+
+    def close(self) -> None:
+        """Does nothing: the handle is owned by the bus."""
+        pass
+
+
+class I2CDeviceView:
+    """
+    Raw read/write access to one address on a shared bus or multiplexer channel.
+
+    Args:
+        bus (I2CBus or I2CMuxChannel): The shared bus or multiplexer channel.
+        address (int): The I2C address of the device.
+    """
+
+    def __init__(self, bus: Union[I2CBus, I2CMuxChannel], address: int) -> None:
+        self.bus: Union[I2CBus, I2CMuxChannel] = bus
+        self.address: int = address
+        self._messages: Any = import_module('smbus2').i2c_msg
+
+    def write(self, data: bytes) -> None:
+        """Writes raw bytes to the device."""
+        self.bus.rdwr(self._messages.write(self.address, data))
+
+    def read(self, length: int) -> bytes:
+        """Reads raw bytes from the device."""
+        message = self._messages.read(self.address, length)
+        self.bus.rdwr(message)
+        return bytes(message)
+
+    def write_then_read(self, data: bytes, length: int) -> bytes:
+        """Writes raw bytes, then reads the response with a repeated start, as one transaction."""
+        message = self._messages.read(self.address, length)
+        self.bus.rdwr(self._messages.write(self.address, data), message)
+        return bytes(message)
+
+
+class _DeviceFile:
+    """File-like wrapper of a device view, used as the device_file of atlas_i2c.AtlasI2C."""
+
+    def __init__(self, view: I2CDeviceView) -> None:
+        self.view: I2CDeviceView = view
+
+    def write(self, data: bytes) -> int:
+        self.view.write(data)
+        return len(data)
+
+    def read(self, length: int) -> bytes:
+        return self.view.read(length)
+
+    def close(self) -> None:
+        # The shared handle is owned by the bus
+        pass
+
+
+class _LockedSMBus:
+    """SMBus proxy running every call on the shared handle as one locked transaction (bme680 i2c_device)."""
+
+    def __init__(self, bus: Union[I2CBus, I2CMuxChannel]) -> None:
+        self.bus: Union[I2CBus, I2CMuxChannel] = bus
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        function = getattr(self.bus.handle, name)
+        return lambda *args, **kwargs: self.bus.transaction(lambda: function(*args, **kwargs))
+
+
+class _BusioI2C:
+    """busio.I2C compatible adapter of a shared bus (adafruit_seesaw i2c_bus)."""
+
+    def __init__(self, bus: Union[I2CBus, I2CMuxChannel]) -> None:
+        self.bus: Union[I2CBus, I2CMuxChannel] = bus
+        self._messages: Any = import_module('smbus2').i2c_msg
+
+    def try_lock(self) -> bool:
+        return self.bus.lock.acquire(blocking=False)
+
+    def unlock(self) -> None:
+        self.bus.lock.release()
+
+    def writeto(self, address: int, buffer: bytes, *, start: int = 0, end: Optional[int] = None) -> None:
+        self.bus.rdwr(self._messages.write(address, bytes(buffer[start:end])))
+
+    def readfrom_into(self, address: int, buffer: bytearray, *, start: int = 0, end: Optional[int] = None) -> None:
+        end = len(buffer) if end is None else end
+        message = self._messages.read(address, end - start)
+        self.bus.rdwr(message)
+        buffer[start:end] = bytes(message)
+
+    def writeto_then_readfrom(self, address: int, buffer_out: bytes, buffer_in: bytearray, *, out_start: int = 0,
+                              out_end: Optional[int] = None, in_start: int = 0, in_end: Optional[int] = None) -> None:
+        in_end = len(buffer_in) if in_end is None else in_end
+        message = self._messages.read(address, in_end - in_start)
+        self.bus.rdwr(self._messages.write(address, bytes(buffer_out[out_start:out_end])), message)
+        buffer_in[in_start:in_end] = bytes(message)
+
+
+@lru_cache(maxsize=None)
+def _timed_bme680(driver: ModuleType) -> type:
+    """Returns a subclass of bme680.BME680 adding get_sensor_data_timed() and split measurements."""
+
+    class TimedBME680(driver.BME680):
+        def get_sensor_data_timed(self, duration: float) -> bool:
+            """Triggers a forced measurement, sleeps duration seconds, then fetches the results into data."""
+            self.start_measurement()
+            time.sleep(duration)
+            return self.fetch_measurement()
+
+        def start_measurement(self) -> None:
+            """Triggers a forced measurement without waiting for it."""
+            self.set_power_mode(driver.FORCED_MODE, blocking=False)
+
+        def fetch_measurement(self) -> bool:
+            """Fetches the results of the measurement triggered by start_measurement() into data."""
+            # get_sensor_data() would trigger another measurement: fetch this one with the driver parser only.
+            # If it is not complete yet, the driver polls its status as usual.
+            self.set_power_mode = lambda value, blocking=True: None
+            try:
+                return self.get_sensor_data()
+            finally:
+                del self.set_power_mode
+
+    return TimedBME680
+
+
+class I2CBusManager:
+    """
+    Registry of the shared I2C buses, opening the sensor drivers on top of them.
+
+    Reconnecting a sensor creates a new driver object (so the device is probed again) on the
+    existing bus handle. The open_* methods match the device backend interface (see backends).
+    """
+
+    def __init__(self) -> None:
+        self._buses: Dict[int, I2CBus] = {}
+        self._muxes: Dict[Tuple[int, int], I2CMux] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def bus(self, bus_number: int = DEFAULT_BUS) -> I2CBus:
+        """Returns the shared bus with the given number."""
+        with self._lock:
+            bus = self._buses.get(bus_number)
+            if bus is None:
+                bus = self._buses[bus_number] = I2CBus(bus_number)
+            return bus
+
+    def mux(self, address: int, bus_number: int = DEFAULT_BUS) -> I2CMux:
+        """Returns the multiplexer at an address of a shared bus."""
+        bus = self.bus(bus_number)
+        with self._lock:
+            mux = self._muxes.get((bus_number, address))
+            if mux is None:
+                mux = self._muxes[(bus_number, address)] = I2CMux(bus, address)
+            return mux
+
+    def view(self, address: int, bus_number: int = DEFAULT_BUS, mux: Optional[Tuple[int, int]] = None) \
+            -> I2CDeviceView:
+        """Returns a raw device view of an address on a shared bus or multiplexer channel."""
+        return I2CDeviceView(self._target(bus_number, mux), address)
+
+    def open_ezo(self, address: int, bus_number: int = DEFAULT_BUS, mux: Optional[Tuple[int, int]] = None) -> Any:
+        """Opens an Atlas Scientific EZO circuit (atlas_i2c.AtlasI2C) on a shared bus or multiplexer channel."""
+        ezo = import_module('atlas_i2c.atlas_i2c').AtlasI2C(
+            bus=bus_number, device_file=_DeviceFile(self.view(address, bus_number, mux)))
+        # The view addresses every message, so the driver's I2C_SLAVE ioctl is not needed
+        ezo.address = address
+        return ezo
+
+    def open_bme680(self, address: int, bus_number: int = DEFAULT_BUS, mux: Optional[Tuple[int, int]] = None) -> Any:
+        """Opens a Bosch BME680 sensor (bme680.BME680) on a shared bus or multiplexer channel."""
+        return _timed_bme680(import_module('bme680'))(address, i2c_device=_LockedSMBus(self._target(bus_number, mux)))
+
+    def open_seesaw(self, address: int, bus_number: int = DEFAULT_BUS, mux: Optional[Tuple[int, int]] = None) -> Any:
+        """Opens an Adafruit Seesaw soil sensor (adafruit_seesaw.seesaw.Seesaw) on a bus or multiplexer channel."""
+        return import_module('adafruit_seesaw.seesaw').Seesaw(_BusioI2C(self._target(bus_number, mux)), addr=address)
+
+    def stats(self) -> Dict[int, int]:
+        """Returns the transaction counts (including multiplexer switches), keyed by bus number."""
+        with self._lock:
+            return {bus_number: bus.transactions for bus_number, bus in self._buses.items()}
+
+    def mux_stats(self) -> Dict[Tuple[int, int], int]:
+        """Returns the multiplexer channel switch counts, keyed by (bus number, multiplexer address)."""
+        with self._lock:
+            return {key: mux.switches for key, mux in self._muxes.items()}
+
+    def close(self) -> None:
+        """Closes every bus handle; handles are reopened on the next transaction."""
+        with self._lock:
+            buses = list(self._buses.values())
+        for bus in buses:
+            bus.close()
+
+    # Protected methods
+    def _target(self, bus_number: int, mux: Optional[Tuple[int, int]]) -> Union[I2CBus, I2CMuxChannel]:
+        """Helper method to return a shared bus, or a channel of a multiplexer given as (address, channel)."""
+        return self.bus(bus_number) if mux is None else self.mux(mux[0], bus_number).channel(mux[1])
+
+
+# Shared bus manager of the process
+bus_manager = I2CBusManager()
+metrics.register_collector('growhub_i2c_transactions_total', "I2C transactions by bus.", ('bus',),
+                           lambda: {(str(bus_number),): count for bus_number, count in bus_manager.stats().items()},
+                           source='i2c_bus')
+metrics.register_collector('growhub_i2c_mux_switches_total', "I2C multiplexer channel switches by bus and address.",
+                           ('bus', 'mux'),
+                           lambda: {(str(bus_number), f"0x{address:02x}"): count
+                                    for (bus_number, address), count in bus_manager.mux_stats().items()},
+                           source='i2c_bus')
@@ -0,0 +1,300 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: metrics
+
+This module provides the hot-path instrumentation of the sensor classes: read latency histograms
+per sensor and channel, error counters by exception class, last-success timestamps and I2C bus
+transaction counts. Recording a read costs two clock reads, a bisect and a few integer increments
+under a lock (a few microseconds), well under 1% of the fastest sensor read, so it stays enabled
+in production.
+
+Metrics are exported in Prometheus text format and as JSON, either from a local HTTP endpoint
+or as files (e.g. for the node_exporter textfile collector).
+
+Classes:
+    Histogram: Fixed-bucket latency histogram.
+    Metrics: Registry of the sensor metrics, with Prometheus and JSON export.
+    MetricsServer: Local HTTP endpoint serving /metrics (Prometheus) and /metrics.json.
+
+Usage:
+    from metrics import MetricsServer, metrics
+
+    server = MetricsServer(metrics, port=9101)
+    server.start()
+    ...
+    metrics.write_files('/var/lib/node_exporter/textfile')
+"""
+
+
+# Standard library imports
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple
+)
+
+
+# Latency bucket upper bounds in seconds, covering Seesaw reads (~ms) to EZO conversions (~1 s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 0.75, 1.0, 1.5, 2.5, 5.0)
+
+
+class Histogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Args:
+        buckets (sequence): Sorted bucket upper bounds in seconds; an implicit +Inf bucket is added.
+    """
+
+    __slots__ = ('buckets', 'counts', 'count', 'sum')
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        self.buckets: Tuple[float, ...] = tuple(buckets)
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        """Records one observation. Not thread-safe; callers hold the registry lock."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """Returns the cumulative (upper bound, count) pairs, Prometheus style."""
+        pairs, total = [], 0
+        for bound, count in zip([repr(bound) for bound in self.buckets] + ['+Inf'], self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+    def quantile(self, quantile: float) -> float:
+        """Returns an upper bound estimate of a quantile (the bound of the bucket holding it)."""
+        if not self.count:
+            return float('nan')
+        rank, total = quantile * self.count, 0
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            if total >= rank:
+                return bound
+        return float('inf')
+
+
+class Metrics:
+    """
+    Registry of the sensor metrics, with Prometheus and JSON export.
+
+    Collectors are evaluated at export time only; collectors of several sources under one name are summed.
+    """
+
+    def __init__(self) -> None:
+        self._histograms: Dict[Tuple[str, str], Histogram] = {}
+        self._errors: Dict[Tuple[str, str, str], int] = {}
+        self._last_success: Dict[Tuple[str, str], float] = {}
+        self._collectors: Dict[str, Tuple[str, Tuple[str, ...], Dict[str, Callable[[], Dict[Tuple[str, ...], float]]],
+                                          str]] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def record_read(self, sensor: str, channel: str, seconds: float) -> None:
+        """
+        Records a successful read.
+
+        Args:
+            sensor (str): The sensor type, e.g. 'aquatic'.
+            channel (str): The measured parameter, e.g. 'ph', or 'all' for read_all().
+            seconds (float): The duration of the read.
+        """
+        key = (sensor, channel)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+            histogram.observe(seconds)
+            self._last_success[key] = time.time()
+
+    def record_error(self, sensor: str, channel: str, error: BaseException) -> None:
+        """
+        Records a failed read or connection attempt.
+
+        Args:
+            sensor (str): The sensor type, e.g. 'aquatic'.
+            channel (str): The measured parameter, e.g. 'ph', or 'all' for read_all().
+            error (exception): The raised exception; counted by class name.
+        """
+        key = (sensor, channel, type(error).__name__)
+        with self._lock:
+            self._errors[key] = self._errors.get(key, 0) + 1
+
+    def register_collector(self, name: str, help_text: str, labels: Tuple[str, ...],
+                           collector: Callable[[], Dict[Tuple[str, ...], float]], metric_type: str = 'counter',
+                           source: str = '') -> None:
+        """
+        Registers (or replaces) the collector of a source for a counter or gauge evaluated at export time.
+
+        Args:
+            name (str): The metric name, e.g. 'growhub_i2c_transactions_total'.
+            help_text (str): The metric description.
+            labels (tuple): The label names.
+            collector (callable): Returns the metric values keyed by label value tuples.
+            metric_type (str): The Prometheus metric type, 'counter' or 'gauge'.
+            source (str): The registering component; the values of every source of a metric are summed.
+        """
+        with self._lock:
+            sources = dict(self._collectors[name][2]) if name in self._collectors else {}
+            sources[source] = collector
+            self._collectors[name] = (help_text, labels, sources, metric_type)
+
+    def reset(self) -> None:
+        """Discards all recorded metrics; registered collectors are kept."""
+        with self._lock:
+            self._histograms.clear()
+            self._errors.clear()
+            self._last_success.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns all metrics as a JSON-serializable dict."""
+        with self._lock:
+            histograms = {key: (histogram.cumulative(), histogram.count, histogram.sum, histogram.quantile(0.5),
+                                histogram.quantile(0.99)) for key, histogram in self._histograms.items()}
+            errors = dict(self._errors)
+            last_success = dict(self._last_success)
+            collectors = dict(self._collectors)
+        return {
+            'reads': [{'sensor': sensor, 'channel': channel, 'count': count, 'sum_seconds': total,
+                       'p50_seconds': p50, 'p99_seconds': p99, 'buckets': dict(buckets),
+                       'last_success': last_success.get((sensor, channel))}
+                      for (sensor, channel), (buckets, count, total, p50, p99) in sorted(histograms.items())],
+            'errors': [{'sensor': sensor, 'channel': channel, 'exception': exception, 'count': count}
+                       for (sensor, channel, exception), count in sorted(errors.items())],
+            'collectors': {name: [{**dict(zip(labels, key)), 'value': value}
+                                  for key, value in sorted(self._collect(sources).items())]
+                           for name, (_, labels, sources, _) in sorted(collectors.items())}
+        }
+
+    def to_json(self) -> str:
+        """Returns all metrics as JSON."""
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self) -> str:
+        """Returns all metrics in Prometheus text exposition format."""
+        data = self.snapshot()
+        lines = ['# HELP growhub_sensor_read_seconds Duration of successful sensor reads.',
+                 '# TYPE growhub_sensor_read_seconds histogram']
+        for read in data['reads']:
+            labels = f'sensor="{read["sensor"]}",channel="{read["channel"]}"'
+            lines += [f'growhub_sensor_read_seconds_bucket{{{labels},le="{bound}"}} {count}'
+                      for bound, count in read['buckets'].items()]
+            lines += [f'growhub_sensor_read_seconds_sum{{{labels}}} {read["sum_seconds"]!r}',
+                      f'growhub_sensor_read_seconds_count{{{labels}}} {read["count"]}']
+        lines += ['# HELP growhub_sensor_last_success_timestamp_seconds UNIX time of the last successful read.',
+                  '# TYPE growhub_sensor_last_success_timestamp_seconds gauge']
+        lines += [f'growhub_sensor_last_success_timestamp_seconds{{sensor="{read["sensor"]}",'
+                  f'channel="{read["channel"]}"}} {read["last_success"]!r}' for read in data['reads']]
+        lines += ['# HELP growhub_sensor_errors_total Sensor errors by exception class.',
+                  '# TYPE growhub_sensor_errors_total counter']
+        lines += [f'growhub_sensor_errors_total{{sensor="{error["sensor"]}",channel="{error["channel"]}",'
+                  f'exception="{error["exception"]}"}} {error["count"]}' for error in data['errors']]
+        with self._lock:
+            collectors = dict(self._collectors)
+        for name, samples in data['collectors'].items():
+            lines += [f'# HELP {name} {collectors[name][0]}', f'# TYPE {name} {collectors[name][3]}']
+            for sample in samples:
+                labels = ','.join(f'{label}="{value}"' for label, value in sample.items() if label != 'value')
+                lines.append(f'{name}{{{labels}}} {sample["value"]}')
+        return '\n'.join(lines) + '\n'
+
+    def write_files(self, directory: str, basename: str = 'growhub') -> None:
+        """
+        Writes <basename>.prom and <basename>.json to a directory, replacing them atomically.
+
+        Args:
+            directory (str): The target directory, e.g. the node_exporter textfile directory.
+            basename (str): The file name without extension.
+        """
+        for extension, content in (('prom', self.to_prometheus()), ('json', self.to_json())):
+            path = os.path.join(directory, f"{basename}.{extension}")
+            with open(f"{path}.tmp", 'w') as file:
+                file.write(content)
+            os.replace(f"{path}.tmp", path)
+
+    # Protected methods
+    @staticmethod
+    def _collect(sources: Dict[str, Callable[[], Dict[Tuple[str, ...], float]]]) -> Dict[Tuple[str, ...], float]:
+        """Helper method to sum the values of the collectors of every source of a metric, per label values."""
+        values: Dict[Tuple[str, ...], float] = {}
+        for collector in sources.values():
+            for key, value in collector().items():
+                values[key] = values.get(key, 0) + value
+        return values
+
+
+class MetricsServer:
+    """
+    Local HTTP endpoint serving /metrics (Prometheus text format) and /metrics.json.
+
+    Args:
+        registry (Metrics): The metrics to serve.
+        host (str): The interface to bind; loopback by default.
+        port (int): The TCP port to listen on.
+    """
+
+    def __init__(self, registry: 'Metrics', host: str = '127.0.0.1', port: int = 9101) -> None:
+        self.registry: Metrics = registry
+        self.host: str = host
+        self.port: int = port
+        self._server: Optional[Any] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Starts serving on a background thread."""
+        # Imported here: http.server is the bulk of the import time of this module and most processes never serve
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path == '/metrics':
+                    body, content_type = registry.to_prometheus(), 'text/plain; version=0.0.4'
+                elif self.path == '/metrics.json':
+                    body, content_type = registry.to_json(), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                payload = body.encode()
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args: Any) -> None:
+                # Keep scrapes out of stderr
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="metrics-server", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = self._thread = None
+
+
+# Shared metrics registry of the process
+metrics = Metrics()
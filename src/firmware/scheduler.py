@@ -0,0 +1,275 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: scheduler
+
+This module provides the adaptive sampling scheduler of the GrowHub device. Instead of polling
+every channel at a fixed rate, each channel is sampled at an interval adapted to its observed
+rate of change: a channel is read again roughly when it is expected to have moved by its deadband,
+within [min_interval, max_interval]. Soil moisture and pH settle to minutes between reads on a
+stable grow, while air temperature is followed closely when it moves.
+
+Readings are forwarded to the scheduler listeners (history, storage, uplink) only when they move
+beyond the channel deadband since the last forwarded value (send-on-delta), or when no value was
+forwarded for heartbeat seconds, so a stable channel still proves it is alive.
+
+Default policy of a channel:
+    deadband        One step of the channel decimal precision (e.g. 0.1 pH, 1 uS/cm EC).
+    min_interval    5 seconds.
+    max_interval    300 seconds.
+    heartbeat       900 seconds.
+
+Classes:
+    ChannelPolicy: Deadband, interval bounds and heartbeat of a channel.
+    ChannelStats: Sampling counters and current interval of a channel.
+    AdaptiveScheduler: Samples the sensors at adaptive intervals and forwards significant readings.
+
+Usage:
+    from scheduler import AdaptiveScheduler
+    from sensors import SensorAquatic, SensorAtmospheric, SensorSoil
+    from storage import ReadingLog
+
+    scheduler = AdaptiveScheduler([SensorAquatic(), SensorAtmospheric(), SensorSoil()],
+                                  policies={'atmospheric.temperature': {'deadband': 0.2, 'max_interval': 60}})
+    scheduler.add_listener(log.append)
+    scheduler.connect()
+    scheduler.start()
+    ...
+    print(scheduler.stats())
+    scheduler.stop()
+"""
+
+
+# Standard library imports
+import threading
+import time
+# Third-party imports (venv)
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple
+)
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+SensorError = APIClient.get_exception('SensorError')
+
+
+# Default policy values in seconds, see ChannelPolicy
+DEFAULT_MIN_INTERVAL = 5.0
+DEFAULT_MAX_INTERVAL = 300.0
+DEFAULT_HEARTBEAT = 900.0
+# Tolerance of the deadband comparison, so that a change of exactly one rounding step is not forwarded
+_EPSILON = 1e-9
+
+
+class ChannelPolicy(NamedTuple):
+    """Deadband, sampling interval bounds (seconds) and heartbeat interval (seconds) of a channel."""
+
+    deadband: float
+    min_interval: float
+    max_interval: float
+    heartbeat: float
+
+
+class ChannelStats(NamedTuple):
+    """Sampling counters of a channel: bus samples, forwarded readings, read errors and the current interval."""
+
+    samples: int
+    forwarded: int
+    errors: int
+    interval: float
+
+
+class _ChannelState:
+    """Sampling state of one channel."""
+
+    __slots__ = ('sensor', 'data_type', 'channel', 'policy', 'interval', 'next_due', 'rate', 'last_sample',
+                 'last_sample_time', 'last_forwarded', 'last_forwarded_time', 'samples', 'forwarded', 'errors')
+
+    def __init__(self, sensor, data_type: str, policy: ChannelPolicy) -> None:
+        self.sensor = sensor
+        self.data_type: str = data_type
+        self.channel: str = sensor.channel(data_type)
+        self.policy: ChannelPolicy = policy
+        self.interval: float = policy.min_interval
+        self.next_due: float = 0.0
+        self.rate: Optional[float] = None
+        self.last_sample: Optional[float] = None
+        self.last_sample_time: float = 0.0
+        self.last_forwarded: Optional[float] = None
+        self.last_forwarded_time: float = 0.0
+        self.samples: int = 0
+        self.forwarded: int = 0
+        self.errors: int = 0
+
+
+class AdaptiveScheduler:
+    """
+    Samples the sensors at adaptive per-channel intervals and forwards significant readings.
+
+    The next sample of a channel is due after deadband / rate of change seconds, at most doubling per sample.
+
+    Args:
+        sensors (sequence): The sensor instances (SensorAquatic, SensorAtmospheric, SensorSoil).
+        policies (dict, optional): Policy overrides keyed by channel name, e.g.
+            {'aquatic.ph': {'deadband': 0.05, 'max_interval': 600}}; missing fields use the defaults.
+    """
+
+    def __init__(self, sensors: Sequence, policies: Optional[Mapping[str, Mapping[str, float]]] = None) -> None:
+        self.sensors: List = list(sensors)
+        self.listeners: List[Callable[[float, Dict[str, float]], None]] = []
+        self._states: List[_ChannelState] = []
+        policies = policies or {}
+        for sensor in self.sensors:
+            for data_type, precision in sensor.decimal_precision.items():
+                policy = self._policy(10.0 ** -precision, policies.get(sensor.channel(data_type), {}))
+                self._states.append(_ChannelState(sensor, data_type, policy))
+        self._lock: threading.Lock = threading.Lock()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def policies(self) -> Dict[str, ChannelPolicy]:
+        """The resolved policies, keyed by channel name."""
+        return {state.channel: state.policy for state in self._states}
+
+    def add_listener(self, listener: Callable[[float, Dict[str, float]], None]) -> None:
+        """Registers a listener (see SensorBase.add_listener) receiving every forwarded reading."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[float, Dict[str, float]], None]) -> None:
+        """Unregisters a reading listener."""
+        self.listeners.remove(listener)
+
+    def connect(self) -> Dict[str, Exception]:
+        """
+        Connects and configures every sensor. Returns the errors of sensors that failed, keyed by sensor name.
+        """
+        errors = {}
+        for sensor in self.sensors:
+            try:
+                sensor.connect()
+                sensor.setup()
+            except SensorError as e:
+                errors[sensor.name] = e
+        return errors
+
+    def start(self) -> None:
+        """Starts sampling on a background thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="adaptive-scheduler", daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the background sampling thread."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._thread.join()
+            self._thread = None
+
+    def poll(self, now: Optional[float] = None) -> Dict[str, float]:
+        """
+        Samples every due channel once and returns the forwarded readings, keyed by channel name.
+
+        Args:
+            now (float, optional): The current time.monotonic() value; read from the clock if omitted.
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due: Dict[int, List[_ChannelState]] = {}
+            for state in self._states:
+                if state.next_due <= now:
+                    due.setdefault(id(state.sensor), []).append(state)
+            timestamp = time.time()
+            forwarded: Dict[str, float] = {}
+            for states in due.values():
+                for state, value in self._read(states):
+                    if value is None:
+                        state.errors += 1
+                        state.next_due = now + state.policy.min_interval
+                    elif self._sample(state, value, now):
+                        forwarded[state.channel] = value
+        if forwarded:
+            for listener in self.listeners:
+                listener(timestamp, forwarded)
+        return forwarded
+
+    def next_due(self) -> float:
+        """Returns the time.monotonic() value at which the next channel is due."""
+        with self._lock:
+            return min((state.next_due for state in self._states), default=float('inf'))
+
+    def stats(self) -> Dict[str, ChannelStats]:
+        """Returns the sampling counters and current interval, keyed by channel name."""
+        with self._lock:
+            return {state.channel: ChannelStats(state.samples, state.forwarded, state.errors, state.interval)
+                    for state in self._states}
+
+    # Protected methods
+    @staticmethod
+    def _policy(deadband: float, overrides: Mapping[str, float]) -> ChannelPolicy:
+        """Helper method to resolve and validate the policy of a channel."""
+        unknown = set(overrides) - set(ChannelPolicy._fields)
+        if unknown:
+            raise CommandArgumentError(f"Unknown scheduler policy field(s): {', '.join(sorted(unknown))}.",
+                                       parameter="policies", value=sorted(unknown))
+        policy = ChannelPolicy(**{'deadband': deadband, 'min_interval': DEFAULT_MIN_INTERVAL,
+                                  'max_interval': DEFAULT_MAX_INTERVAL, 'heartbeat': DEFAULT_HEARTBEAT,
+                                  **{field: float(value) for field, value in overrides.items()}})
+        if policy.deadband < 0 or not 0 < policy.min_interval <= policy.max_interval or policy.heartbeat <= 0:
+            raise CommandArgumentError("Scheduler policy requires deadband >= 0, "
+                                       "0 < min_interval <= max_interval and heartbeat > 0.",
+                                       parameter="policies", value=policy._asdict())
+        return policy
+
+    def _read(self, states: List[_ChannelState]) -> List[Tuple[_ChannelState, Optional[float]]]:
+        """Helper method to read the due channels of one sensor; failed channels are returned with None."""
+        sensor = states[0].sensor
+        if len(states) == len(sensor.decimal_precision):
+            try:
+                reading = sensor.read_all()._asdict()
+            except SensorError:
+                return [(state, None) for state in states]
+            return [(state, reading[state.data_type]) for state in states]
+        results = []
+        for state in states:
+            try:
+                results.append((state, getattr(sensor, f"read_{state.data_type}")()))
+            except SensorError:
+                results.append((state, None))
+        return results
+
+    @staticmethod
+    def _sample(state: _ChannelState, value: float, now: float) -> bool:
+        """Helper method to update the rate, interval and next due time of a channel; returns whether to forward."""
+        state.samples += 1
+        if state.last_sample is not None and now > state.last_sample_time:
+            rate = abs(value - state.last_sample) / (now - state.last_sample_time)
+            state.rate = rate if state.rate is None else 0.5 * rate + 0.5 * state.rate
+        state.last_sample, state.last_sample_time = value, now
+
+        policy = state.policy
+        target = policy.deadband / state.rate if state.rate else policy.max_interval
+        state.interval = min(max(min(target, 2 * state.interval), policy.min_interval), policy.max_interval)
+
+        forward = (state.last_forwarded is None
+                   or abs(value - state.last_forwarded) - policy.deadband > _EPSILON
+                   or now - state.last_forwarded_time >= policy.heartbeat)
+        if forward:
+            state.forwarded += 1
+            state.last_forwarded, state.last_forwarded_time = value, now
+        state.next_due = min(now + state.interval, state.last_forwarded_time + policy.heartbeat)
+        return forward
+
+    def _run(self) -> None:
+        """Helper method running the background sampling loop."""
+        while not self._stopped.is_set():
+            self.poll()
+            self._stopped.wait(max(self.next_due() - time.monotonic(), 0.0))
@@ -13,6 +13,11 @@ Supported sensors:
     Adafruit STEMMA Soil Sensor: soil sensor (moisture, temperature).
 
 Classes:
+    SensorBase: Base class of the sensor classes (device backend, reading listeners).
+    AquaticReading: Single snapshot of the aquatic sensor parameters (pH, EC).
+    AtmosphericReading: Single snapshot of the atmospheric sensor parameters (temperature, humidity, pressure).
+    SoilReading: Single snapshot of the soil sensor parameters (moisture, temperature).
+    AtmosphericProfile: BME680 oversampling and filter settings, with the computed measurement duration.
     SensorAquatic: Manages interfacing with the aquatic sensors: Atlas Scientific EZO pH and Conductivity sensors.
     SensorAtmospheric: Manages interfacing with the atmospheric sensor: Pimoroni BME680 Breakout.
     SensorSoil: Manages interfacing with the soil sensor: Adafruit STEMMA Soil Sensor.
@@ -24,55 +29,430 @@ Usage:
     sensor_atmospheric.connect()
     sensor_atmospheric.setup()
     atmospheric_temperature = sensor_atmospheric.read_temperature()
+    atmospheric_temperature = sensor_atmospheric.read_temperature(force_refresh=True)
+    atmospheric_reading = sensor_atmospheric.read_all()
+    sensor_atmospheric.set_profile('fast')
+    atmospheric_bursts = sensor_atmospheric.read_burst(samples=5, method='median')
+    atmospheric_breakers = sensor_atmospheric.breaker_status()
+
+    # Temperature-compensated pH and EC, fed by the atmospheric reads
+    sensor_aquatic = SensorAquatic()
+    sensor_aquatic.connect()
+    sensor_aquatic.set_temperature_source(sensor_atmospheric)
+    aquatic_reading = sensor_aquatic.read_all()
+
+    # Several probes of one type: different addresses, or the same address behind multiplexer channels
+    backend = HardwareBackend()
+    soil_probes = [SensorSoil(backend=backend.channel(0x70, channel), name=f"soil{channel}") for channel in range(4)]
 """
 
 
+# Standard library imports
+import threading
+import time
+from abc import ABC, abstractmethod
 # Third-party imports (venv)
-import bme680
-import board
-from atlas_i2c import AtlasI2C
-from atlas_i2c.commands import (
-    CalibratePh,
-    Read,
-    Status
-)
-from adafruit_seesaw.seesaw import Seesaw
+# Sensor drivers (atlas_i2c, bme680, adafruit_seesaw) are imported by the hardware backend, see backends
 from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
     Literal,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
     Union
 )
+# Codebase imports (firmware)
+from backends import BusLocation, HardwareBackend
+from breaker import HALF_OPEN, BreakerStatus, CircuitBreaker
+from cache import ReadCache
+from metrics import metrics
 # Codebase imports (API)
 from api_client import APIClient
 CommandArgumentError = APIClient.get_exception('CommandArgumentError')
 SensorCalibrationError = APIClient.get_exception('SensorCalibrationError')
 SensorConfigurationError = APIClient.get_exception('SensorConfigurationError')
 SensorConnectionError = APIClient.get_exception('SensorConnectionError')
+SensorError = APIClient.get_exception('SensorError')
 SensorReadError = APIClient.get_exception('SensorReadError')
 
 
-class SensorAquatic:
+class AquaticReading(NamedTuple):
+    """Single snapshot of all aquatic sensor parameters."""
+
+    ph: float
+    ec: float
+
+
+class AtmosphericReading(NamedTuple):
+    """Single snapshot of all atmospheric sensor parameters, taken from one forced-mode measurement."""
+
+    temperature: float
+    humidity: float
+    pressure: float
+
+
+class SoilReading(NamedTuple):
+    """Single snapshot of all soil sensor parameters."""
+
+    moisture: float
+    temperature: float
+
+
+Reading = TypeVar('Reading', AquaticReading, AtmosphericReading, SoilReading)
+
+
+class AtmosphericProfile(NamedTuple):
+    """
+    BME680 measurement settings, as names of the bme680 driver constants (OS_* and FILTER_SIZE_*).
+
+    Oversampling lowers the noise of a field at the cost of measurement time; the IIR filter smooths
+    consecutive measurements (less noise, slower response to steps) and does not add measurement time.
+    """
+
+    temperature_oversample: str
+    humidity_oversample: str
+    pressure_oversample: str
+    filter_size: str
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds of a forced-mode measurement with these settings (Bosch BME680 API timing)."""
+        cycles = sum(_OVERSAMPLING_CYCLES[setting] for setting in self[:3])
+        # 1963 us per cycle, 477 us per field switch (4) and gas stage (5), 500 us wake-up; rounded up to 1 ms
+        return ((cycles * 1963 + 477 * 9 + 500) // 1000 + 1) / 1000
+
+
+_OVERSAMPLING_CYCLES = {'OS_NONE': 0, 'OS_1X': 1, 'OS_2X': 2, 'OS_4X': 4, 'OS_8X': 8, 'OS_16X': 16}
+
+# Named BME680 measurement profiles: fast for control loops, precise for logging
+ATMOSPHERIC_PROFILES = {
+    'fast': AtmosphericProfile('OS_1X', 'OS_1X', 'OS_1X', 'FILTER_SIZE_0'),            # 11 ms
+    'balanced': AtmosphericProfile('OS_8X', 'OS_2X', 'OS_4X', 'FILTER_SIZE_3'),        # 33 ms
+    'precise': AtmosphericProfile('OS_16X', 'OS_16X', 'OS_16X', 'FILTER_SIZE_7')       # 100 ms
+}
+
+
+def _round_reading(reading_type: Type[Reading], values: Mapping[str, object],
+                   decimal_precision: Mapping[str, int]) -> Reading:
+    """
+    Helper function to build a reading record, rounding every field to its decimal precision in one pass.
+
+    Args:
+        reading_type (type): The NamedTuple reading record to build.
+        values (dict): The raw values, keyed by field name.
+        decimal_precision (dict): The number of decimals to keep, keyed by field name.
+    """
+    return reading_type._make(round(float(values[field]), decimal_precision[field])
+                              for field in reading_type._fields)
+
+
+class SensorBase(ABC):
+    """
+    Base class of the sensor classes: device backend, read cache, circuit breakers and reading listeners.
+
+    Reads are served from the cache while younger than max_age[data_type] seconds and go through a circuit
+    breaker per device address (see cache, breaker). Channels are prefixed by the probe name, e.g. 'soil2.moisture'.
+
+    Args:
+        backend (optional): The device backend; a HardwareBackend on bus 1 if omitted.
+        max_age (dict, optional): Maximum age in seconds of a cached reading, keyed by data type.
+        name (str, optional): The name of the probe; the lowercase sensor type if omitted.
+    """
+
+    sensor_type = ''
+    decimal_precision: Dict[str, int] = {}
+    max_age: Dict[str, float] = {}
+    # Circuit breaker settings of every device of the sensor, see breaker.CircuitBreaker
+    breaker_policy: Dict[str, float] = {'failure_threshold': 3, 'backoff': 2.0, 'max_backoff': 300.0}
+
+    def __init__(self, backend: Union[Any, None] = None, max_age: Union[Mapping[str, float], None] = None,
+                 name: Optional[str] = None):
+        self.backend = backend or HardwareBackend()
+        self.name: str = name or self.sensor_type.lower()
+        self.max_age = {**self.max_age, **(max_age or {})}
+        self.cache = ReadCache({self.channel(data_type): age for data_type, age in self.max_age.items()})
+        self.listeners: List[Callable[[float, Dict[str, float]], None]] = [self.cache.append]
+        self.metrics = metrics
+        self.breakers: Dict[int, CircuitBreaker] = {
+            address: CircuitBreaker(f"{self.name}@0x{address:02x}", **self.breaker_policy)
+            for address in dict.fromkeys(self._device_address(data_type) for data_type in self.decimal_precision)}
+
+    def add_listener(self, listener: Callable[[float, Dict[str, float]], None]) -> None:
+        """
+        Registers a callable receiving (timestamp, readings) after every successful read.
+
+        Readings are keyed by channel name, e.g. {'aquatic.ph': 6.2}. Listeners run on the reading thread,
+        so they only store the readings; the append() methods of ReadCache, TimeSeriesBuffer, ReadingLog,
+        UplinkQueue and ReadingStore are listeners.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[float, Dict[str, float]], None]) -> None:
+        """Unregisters a listener added with add_listener()."""
+        self.listeners.remove(listener)
+
+    @property
+    def location(self) -> BusLocation:
+        """The bus location of the devices of the sensor (bus, multiplexer and channel), used to order reads."""
+        return getattr(self.backend, 'location', BusLocation(-1))
+
+    def channel(self, data_type: str) -> str:
+        """Returns the channel name of a measured parameter, e.g. 'aquatic.ph'."""
+        return f"{self.name}.{data_type}"
+
+    def breaker_status(self) -> Dict[str, BreakerStatus]:
+        """Returns the state of the circuit breaker of every device, keyed by breaker name, e.g. 'aquatic@0x63'."""
+        return {breaker.name: breaker.status() for breaker in self.breakers.values()}
+
+    @abstractmethod
+    def connect(self) -> None:
+        """Establishes I2C connection with the devices of the sensor; also run by the reconnect probes."""
+
+    @abstractmethod
+    def setup(self) -> None:
+        """Configures the devices of the sensor after connect()."""
+
+    def read_burst(self, samples: int = 5, method: str = 'median', data_types: Optional[Sequence[str]] = None,
+                   interval: float = 0.0, mad_threshold: float = 3.5, ema_alpha: float = 0.3) -> Dict[str, Any]:
+        """
+        Reads a burst of raw samples per parameter and returns the filtered readings (filters.FilteredReading).
+
+        The samples of all parameters are filtered in one batch; the filtered values are rounded to the
+        decimal precision of the sensor and passed to the listeners like any other reading.
+
+        Args:
+            samples (int): The number of raw samples per parameter.
+            method (str): The estimator: 'median', 'mean' or 'ema'.
+            data_types (sequence, optional): The parameters to read; all parameters of the sensor if omitted.
+            interval (float): Pause in seconds between two samples, e.g. to decorrelate slow drifts.
+            mad_threshold (float): Modified z-score above which a sample is rejected; 0 disables rejection.
+            ema_alpha (float): Smoothing factor of the EMA, in (0, 1].
+        """
+        data_types = list(self.decimal_precision if data_types is None else data_types)
+        invalid = [data_type for data_type in data_types if data_type not in self.decimal_precision]
+        if samples < 1 or interval < 0 or invalid or not data_types:
+            raise CommandArgumentError(f"Invalid burst read of the {self.sensor_type.lower()} sensor."
+                                       f"\nUse samples >= 1, interval >= 0 and data types among "
+                                       f"{', '.join(self.decimal_precision)}.",
+                                       parameter="data_types" if invalid or not data_types else "samples",
+                                       value=invalid or samples)
+        # Imported on first use, so that importing the sensor classes does not load NumPy
+        from filters import check_filter_arguments
+        check_filter_arguments(method, mad_threshold, ema_alpha)
+        return self._timed('burst', lambda: self._read_burst(samples, method, data_types, interval, mad_threshold,
+                                                             ema_alpha))
+
+    # Protected methods
+    def _cached_read(self, data_type: str, force_refresh: bool = False) -> float:
+        """
+        Helper method to read sensor data through the read cache.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+            force_refresh (bool): Bypass the cached reading and always read from the bus.
+        """
+        return self.cache.get(self.channel(data_type), self._device_key(data_type),
+                              lambda: self._timed(data_type, lambda: self._read_sensor_data(data_type)),
+                              force_refresh)
+
+    def _timed(self, data_type: str, function: Callable[[], Any]) -> Any:
+        """
+        Helper method to call a bus read through the circuit breakers, recording its duration or its failure
+        in the metrics registry.
+
+        Args:
+            data_type (str): The name of the measured parameter, or 'all' for read_all().
+            function (callable): The bus read.
+        """
+        start = time.perf_counter()
+        try:
+            result = self._guarded(data_type, function)
+        except Exception as e:
+            self._record_error(data_type, e)
+            raise
+        self.metrics.record_read(self.name, data_type, time.perf_counter() - start)
+        return result
+
+    def _record_error(self, data_type: str, error: Exception) -> None:
+        """
+        Helper method to count a failure in the metrics registry.
+
+        Args:
+            data_type (str): The name of the measured parameter, 'all' for read_all() or 'connect'.
+            error (exception): The raised exception.
+        """
+        self.metrics.record_error(self.name, data_type, error)
+
+    def _guarded(self, data_type: str, function: Callable[[], Any]) -> Any:
+        """
+        Helper method to call the bus through the circuit breakers of the devices serving a data type.
+
+        Fails fast while a breaker is open; sensor errors count against the device of their data type, or all.
+
+        Args:
+            data_type (str): The name of the measured parameter, or 'all', 'burst' or 'stream' for all devices.
+            function (callable): The bus call.
+        """
+        breakers = [self.breakers[address] for address in dict.fromkeys(
+            self._device_address(name) for name in ([data_type] if data_type in self.decimal_precision
+                                                     else self.decimal_precision))]
+        self._admit(breakers)
+        try:
+            result = function()
+        except SensorError as e:
+            failed = getattr(e, 'data_type', None)
+            failed = self.breakers[self._device_address(failed)] if failed in self.decimal_precision else None
+            for breaker in breakers:
+                if failed is None or breaker is failed:
+                    breaker.record_failure(e)
+                else:
+                    breaker.release()
+            raise
+        except Exception:
+            for breaker in breakers:
+                breaker.release()
+            raise
+        for breaker in breakers:
+            breaker.record_success()
+        return result
+
+    def _admit(self, breakers: List[CircuitBreaker]) -> None:
+        """Helper method to pass the circuit breakers of a call, running the reconnect probe of half-open ones."""
+        probes = []
+        for breaker in breakers:
+            if not breaker.allow():
+                for probe in probes:
+                    probe.release()
+                status = breaker.status()
+                raise SensorConnectionError(f"{self.sensor_type} sensor device {breaker.name} unavailable after "
+                                            f"{status.failures} consecutive failures (circuit open).\nNext reconnect "
+                                            f"attempt in {status.retry_in:.1f} seconds.", sensor_type=self.sensor_type,
+                                            connection_details=status._asdict())
+            if breaker.state == HALF_OPEN:
+                probes.append(breaker)
+        if probes:
+            try:
+                self.connect()
+                self.setup()
+            except SensorError as e:
+                for probe in probes:
+                    probe.record_failure(e)
+                raise
+
+    def _device_address(self, data_type: str) -> int:
+        """Helper method to return the I2C address of the device serving a data type, used to key the breakers."""
+        return self.address
+
+    def _device_key(self, data_type: str) -> str:
+        """Helper method to return the key of the device serving a data type, used to coalesce reads."""
+        return self.sensor_type
+
+    @abstractmethod
+    def _read_sensor_data(self, data_type: str) -> float:
+        """Helper method to read sensor data from the bus. Implemented by the sensor classes."""
+
+    @abstractmethod
+    def _read_raw(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to read one unrounded sample of each data type. Implemented by the sensor classes."""
+
+    def _read_burst(self, samples: int, method: str, data_types: List[str], interval: float, mad_threshold: float,
+                    ema_alpha: float) -> Dict[str, Any]:
+        """Helper method to read and filter a burst (see read_burst)."""
+        # Imported on first use, so that importing the sensor classes does not load NumPy
+        from filters import FilteredReading, filter_bursts
+        raw = []
+        for index in range(samples):
+            if index and interval:
+                time.sleep(interval)
+            sample = self._read_raw(data_types)
+            raw.append([sample[data_type] for data_type in data_types])
+        values, variances, rejected = filter_bursts(list(zip(*raw)), method, mad_threshold, ema_alpha)
+        readings = {data_type: FilteredReading(round(float(value), self.decimal_precision[data_type]), float(variance),
+                                               samples, int(count))
+                    for data_type, value, variance, count in zip(data_types, values, variances, rejected)}
+        self._publish({data_type: reading.value for data_type, reading in readings.items()})
+        return readings
+
+    def _publish(self, values: Mapping[str, float], timestamp: Optional[float] = None) -> None:
+        """
+        Helper method to pass freshly read values to the listeners.
+
+        Args:
+            values (dict): The read values, keyed by data type.
+            timestamp (float, optional): UNIX timestamp of the values; defaults to the current time.
+        """
+        if self.listeners:
+            timestamp = time.time() if timestamp is None else timestamp
+            readings = {self.channel(data_type): value for data_type, value in values.items()}
+            for listener in self.listeners:
+                listener(timestamp, readings)
+
+
+class SensorAquatic(SensorBase):
     """
     Manages interfacing with the aquatic sensors: Atlas Scientific EZO pH and Conductivity (EC) sensors.
 
     This class provides methods to connect to the sensors via I2C interface, configure their settings,
-    calibrate pH probe, and read pH and conductivity data.
+    calibrate pH probe, and read temperature-compensated pH and conductivity data, on demand or streamed.
     """
 
     PH_I2C_ADDRESS = 0x63
     EC_I2C_ADDRESS = 0x64
+    sensor_type = 'Aquatic'
     decimal_precision = {'ph': 1, 'ec': 0}
+    max_age = {'ph': 2.0, 'ec': 2.0}
+    # Processing delay of the EZO 'R' and 'RT' commands in seconds (see EZO pH and EC datasheets)
+    conversion_delay = {'ph': 0.9, 'ec': 0.6}
+    # Temperature change in degrees Celsius that re-sends the compensation, and maximum age in seconds of the
+    # temperature used for it
+    compensation_threshold = 0.5
+    compensation_max_age = 300.0
+    # Seconds beyond the streaming interval after which the latest streamed conversion is stale
+    stream_max_age = 5.0
 
-    def __init__(self):
-        self.ph_sensor: Union[AtlasI2C, None] = None
-        self.ec_sensor: Union[AtlasI2C, None] = None
+    def __init__(self, backend: Union[Any, None] = None, max_age: Union[Mapping[str, float], None] = None,
+                 name: Optional[str] = None, ph_address: Optional[int] = None, ec_address: Optional[int] = None):
+        self.ph_address: int = self.PH_I2C_ADDRESS if ph_address is None else ph_address
+        self.ec_address: int = self.EC_I2C_ADDRESS if ec_address is None else ec_address
+        super().__init__(backend, max_age, name)
+        self._commands: Union[Any, None] = None
+        self._read_started: Dict[str, float] = {}
+        self._stream_thread: Optional[threading.Thread] = None
+        self._stream_stop: threading.Event = threading.Event()
+        self._stream_condition: threading.Condition = threading.Condition()
+        self._stream_reading: Optional[Tuple[int, float, Dict[str, float]]] = None
+        self._stream_error: Optional[Exception] = None
+        self._stream_interval: float = 0.0
+        # Latest (timestamp, temperature) to compensate with, the temperature sent with the read in flight
+        # and the temperature held by each circuit
+        self._temperature: Optional[Tuple[float, float]] = None
+        self._compensating: Dict[str, float] = {}
+        self._compensated: Dict[str, Optional[float]] = dict.fromkeys(self.decimal_precision)
+        self._temperature_source: Optional[Tuple[Any, str]] = None
+        self.ph_sensor: Union[Any, None] = None
+        self.ec_sensor: Union[Any, None] = None
 
     def connect(self) -> None:
         """Establishes I2C connection with the aquatic sensors."""
         try:
-            self.ph_sensor = AtlasI2C(address=self.PH_I2C_ADDRESS)
-            self.ec_sensor = AtlasI2C(address=self.EC_I2C_ADDRESS)
+            self._commands = self.backend.ezo_commands()
+            self.ph_sensor = self.backend.open_ezo(self.ph_address)
+            self.ec_sensor = self.backend.open_ezo(self.ec_address)
+            # A reconnected (e.g. power cycled) circuit may have lost its compensation temperature
+            self._compensating, self._compensated = {}, dict.fromkeys(self.decimal_precision)
         except (OSError, IOError) as e:
-            raise SensorConnectionError(f"Failed to connect to aquatic sensors:\n{str(e)}", sensor_type="Aquatic")
+            error = SensorConnectionError(f"Failed to connect to aquatic sensors:\n{str(e)}", sensor_type="Aquatic")
+            self._record_error('connect', error)
+            raise error
 
     def setup(self) -> None:
         """Configures aquatic sensor settings."""
@@ -80,74 +460,424 @@ class SensorAquatic:
         pass
 
     def calibrate_ph(self, point: Literal['low', 'mid', 'high']) -> None:
-        """Calibrates the pH sensor."""
+        """Calibrates the pH sensor. Streaming is suspended during the calibration and resumed afterwards."""
         if not self.ph_sensor:
             raise SensorConnectionError("pH sensor not connected. Cannot execute calibration."
                                         "\nReconnect and try again.", sensor_type="Aquatic")
         else:
+            streaming, interval = self.streaming, self._stream_interval
+            self.stop_streaming()
             try:
-                response = self.ph_sensor.query(CalibratePh.format_command(point))
+                calibrate = self._commands.CalibratePh
+                response = self.ph_sensor.query(calibrate.format_command(point), calibrate.processing_delay)
                 if response.status_code != 1:
                     raise SensorCalibrationError(f"pH calibration failed: {response.data.decode()}",
                                                  sensor_type="Aquatic", calibration_point=point)
             except AttributeError as e:
-                SensorCalibrationError(f"pH calibration failed:\n{str(e)}", sensor_type="Aquatic",
-                                       calibration_point=point)
+                raise SensorCalibrationError(f"pH calibration failed:\n{str(e)}", sensor_type="Aquatic",
+                                             calibration_point=point)
+            finally:
+                if streaming:
+                    self.start_streaming(interval)
+
+    @property
+    def compensation(self) -> Dict[str, Optional[float]]:
+        """The compensation temperature last sent to each circuit, keyed by data type; None if never sent."""
+        return dict(self._compensated)
+
+    def set_temperature_source(self, source: Optional[Any], data_type: str = 'temperature') -> None:
+        """
+        Feeds the temperature compensation with the readings of another sensor, without reading it.
 
-    def read_ph(self) -> float:
+        Starts from the cached reading of an in-process source; a SupervisedSensor only feeds its listener.
+
+        Args:
+            source (SensorBase, optional): The sensor measuring the water or air temperature, e.g. a
+                SensorSoil in the reservoir or the SensorAtmospheric; None stops following the current source.
+            data_type (str): The parameter of the source to follow.
+        """
+        if self._temperature_source is not None:
+            self._temperature_source[0].remove_listener(self._on_source_readings)
+            self._temperature_source = None
+        if source is None:
+            return
+        if data_type not in source.decimal_precision:
+            raise CommandArgumentError(f"Cannot compensate the aquatic sensor with {data_type} of the "
+                                       f"{source.sensor_type.lower()} sensor. Invalid data type.",
+                                       parameter="data_type", value=data_type)
+        self._temperature_source = (source, source.channel(data_type))
+        source.add_listener(self._on_source_readings)
+        # vars() skips attribute forwarding, so a proxy is never asked for its cache
+        cache = vars(source).get('cache')
+        try:
+            latest = cache.latest(source.channel(data_type)) if isinstance(cache, ReadCache) else None
+        except Exception:  # The first listener callback provides the temperature instead
+            latest = None
+        if latest is not None:
+            self.update_temperature(latest[1], latest[0])
+
+    def update_temperature(self, temperature: float, timestamp: Optional[float] = None) -> None:
+        """
+        Sets the temperature the next pH and EC reads are compensated with.
+
+        Args:
+            temperature (float): The water temperature in degrees Celsius.
+            timestamp (float, optional): UNIX timestamp of the temperature reading; defaults to now.
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        current = self._temperature
+        if current is None or current[0] <= timestamp:
+            self._temperature = (timestamp, float(temperature))
+
+    @property
+    def streaming(self) -> bool:
+        """True while the circuits are read continuously by the streaming thread."""
+        return self._stream_thread is not None
+
+    def start_streaming(self, interval: float = 0.0) -> None:
+        """
+        Switches to streaming mode: a background thread converts pH and EC back to back.
+
+        Reads then return the latest conversion, until it is older than interval plus stream_max_age seconds.
+
+        Args:
+            interval (float): Pause in seconds between two conversions; 0 converts continuously.
+        """
+        if interval < 0:
+            raise CommandArgumentError("Streaming interval must not be negative.", parameter="interval",
+                                       value=interval)
+        if self._stream_thread is None:
+            for data_type in AquaticReading._fields:
+                # Raises if a circuit is not connected
+                self._get_sensor(data_type)
+            self._stream_interval = interval
+            self._stream_stop.clear()
+            with self._stream_condition:
+                self._stream_reading, self._stream_error = None, None
+            self._stream_thread = threading.Thread(target=self._stream_loop, name="aquatic-stream", daemon=True)
+            self._stream_thread.start()
+
+    def stop_streaming(self) -> None:
+        """Switches back to on-demand reads, after the conversion in flight has been collected."""
+        if self._stream_thread is not None:
+            self._stream_stop.set()
+            self._stream_thread.join()
+            self._stream_thread = None
+            with self._stream_condition:
+                self._stream_condition.notify_all()
+
+    def stream(self, timeout: Optional[float] = None) -> Iterator[Tuple[float, AquaticReading]]:
+        """
+        Yields (timestamp, AquaticReading) for every new streamed conversion, until streaming stops.
+
+        Args:
+            timeout (float, optional): Maximum wait in seconds for a new conversion; raises SensorReadError
+                (or the last streaming error) when exceeded. Waits indefinitely if omitted.
+        """
+        sequence = 0
+        while self.streaming:
+            entry = self._next_streamed(sequence, timeout)
+            if entry is None:
+                return
+            sequence, timestamp, values = entry
+            yield timestamp, _round_reading(AquaticReading, values, self.decimal_precision)
+
+    def read_ph(self, force_refresh: bool = False) -> float:
         """Reads pH value from the sensor."""
-        return self._read_sensor_data('ph')
+        return self._read_sensor_data('ph') if self.streaming else self._cached_read('ph', force_refresh)
 
-    def read_ec(self) -> float:
+    def read_ec(self, force_refresh: bool = False) -> float:
         """Reads conductivity value from the sensor."""
-        return self._read_sensor_data('ec')
+        return self._read_sensor_data('ec') if self.streaming else self._cached_read('ec', force_refresh)
+
+    def read_all(self) -> AquaticReading:
+        """Reads pH and conductivity values, overlapping the conversion of both EZO circuits."""
+        if self.streaming:
+            # Streamed values do not touch the bus, so they bypass the circuit breakers
+            return _round_reading(AquaticReading, self._latest_streamed(), self.decimal_precision)
+        return self._timed('all', self._read_all)
+
+    def start_read(self, data_type: Literal['ph', 'ec']) -> None:
+        """
+        Sends the read command to the sensor without waiting for the conversion to finish.
+
+        The result is collected with finish_read() once conversion_delay[data_type] has elapsed,
+        which allows the conversion to overlap with other bus traffic. Does nothing while streaming.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        if self.streaming:
+            return
+        try:
+            self._guarded(data_type, lambda: self._send_read(data_type))
+        except Exception as e:
+            self._record_error(data_type, e)
+            raise
+        self._read_started[data_type] = time.perf_counter()
+
+    def finish_read(self, data_type: Literal['ph', 'ec']) -> float:
+        """
+        Collects the result of a read command previously sent with start_read().
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        if self.streaming:
+            return self._read_sensor_data(data_type)
+        started = self._read_started.pop(data_type, None)
+        try:
+            value = self._guarded(data_type, lambda: self._fetch_response(data_type))
+        except Exception as e:
+            self._record_error(data_type, e)
+            raise
+        if started is not None:
+            self.metrics.record_read(self.name, data_type, time.perf_counter() - started)
+        self._publish({data_type: value})
+        return value
 
     # Protected methods
-    def _read_sensor_data(self, data_type: Literal['ph', 'ec']) -> float:
+    def _read_all(self) -> AquaticReading:
+        """Helper method to read pH and conductivity values (see read_all)."""
+        reading = _round_reading(AquaticReading, self._convert(list(AquaticReading._fields)), self.decimal_precision)
+        self._publish(reading._asdict())
+        return reading
+
+    def _read_raw(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to read one unrounded sample of each data type; waits for a new conversion while streaming."""
+        if self.streaming:
+            with self._stream_condition:
+                sequence = self._stream_reading[0] if self._stream_reading else 0
+            entry = self._next_streamed(sequence, 2 * max(self.conversion_delay.values()) + self._stream_interval)
+            if entry is None:
+                return self._convert(data_types)
+            return {data_type: entry[2][data_type] for data_type in data_types}
+        return self._convert(data_types)
+
+    def _convert(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to run one conversion of each data type on the bus, overlapping the EZO conversions."""
+        for data_type in data_types:
+            self._send_read(data_type)
+        time.sleep(max(self.conversion_delay[data_type] for data_type in data_types))
+        return {data_type: self._fetch_raw(data_type) for data_type in data_types}
+
+    def _send_read(self, data_type: Literal['ph', 'ec']) -> None:
         """
-        Helper method to read aquatic sensor data.
+        Helper method to send the read command to an EZO circuit, with the compensation temperature if it is due.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        sensor = self._get_sensor(data_type)
+        temperature = self._compensation_due(data_type)
+        try:
+            # 'RT,<temperature>' sets the compensation and takes the reading in the same transaction as 'R'
+            sensor.write(self._commands.Read.format_command() if temperature is None else f"RT,{temperature}")
+        except (OSError, IOError) as e:
+            raise SensorReadError(f"Failed to request {data_type} data from the aquatic sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Aquatic", data_type=data_type)
+        # Held by the circuit once its response arrives (see _fetch_raw)
+        if temperature is None:
+            self._compensating.pop(data_type, None)
+        else:
+            self._compensating[data_type] = temperature
+
+    def _compensation_due(self, data_type: Literal['ph', 'ec']) -> Optional[float]:
+        """
+        Helper method to return the temperature to send with the next read of a circuit, or None to send a plain read.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        latest = self._temperature
+        if latest is None or time.time() - latest[0] > self.compensation_max_age:
+            return None
+        temperature = round(latest[1], 1)
+        held = self._compensated.get(data_type)
+        if held is not None and abs(temperature - held) < self.compensation_threshold:
+            return None
+        return temperature
+
+    def _on_source_readings(self, timestamp: float, readings: Mapping[str, float]) -> None:
+        """Helper method listening to the temperature source (see set_temperature_source)."""
+        source = self._temperature_source
+        if source is not None and source[1] in readings:
+            self.update_temperature(readings[source[1]], timestamp)
+
+    def _fetch_response(self, data_type: Literal['ph', 'ec']) -> float:
+        """
+        Helper method to read and parse the response of an EZO circuit, rounded to the decimal precision.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        return round(self._fetch_raw(data_type), self.decimal_precision[data_type])
+
+    def _fetch_raw(self, data_type: Literal['ph', 'ec']) -> float:
+        """
+        Helper method to read and parse the response of an EZO circuit.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        sensor = self._get_sensor(data_type)
+        try:
+            response = sensor.read(self._commands.Read.format_command())
+            if response.status_code != 1:
+                raise SensorReadError(f"Failed to read {data_type} data from the aquatic sensor:"
+                                      f"\n{response.data.decode()}\nReconnect and try again.",
+                                      sensor_type="Aquatic", data_type=data_type)
+            value = float(response.data.decode())
+        except (AttributeError, ValueError, OSError) as e:
+            raise SensorReadError(f"Failed to read {data_type} data from the aquatic sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Aquatic", data_type=data_type)
+        temperature = self._compensating.pop(data_type, None)
+        if temperature is not None:
+            self._compensated[data_type] = temperature
+        return value
+
+    def _device_address(self, data_type: Literal['ph', 'ec']) -> int:
+        """Helper method to return the I2C address of the EZO circuit serving a data type."""
+        return self.ph_address if data_type == 'ph' else self.ec_address
+
+    def _device_key(self, data_type: Literal['ph', 'ec']) -> str:
+        """Helper method to return the key of the device serving a data type; pH and EC are separate circuits."""
+        return self.channel(data_type)
+
+    def _get_sensor(self, data_type: Literal['ph', 'ec']) -> Any:
+        """
+        Helper method to select the connected EZO circuit for a data type.
 
         Args:
             data_type (str): The name of the parameter to measure
         """
-        sensor = self.ph_sensor if data_type == 'ph' else self.ec_sensor if data_type == 'ec' else None
+        if data_type not in self.decimal_precision:
+            raise CommandArgumentError(f"Cannot read {data_type} from the aquatic sensor. Invalid data type."
+                                       f"\nChoose either ph or ec.", parameter="data_type", value=data_type)
+        sensor = self.ph_sensor if data_type == 'ph' else self.ec_sensor
         if not sensor:
             raise SensorConnectionError(f"{data_type.capitalize()} sensor not connected. Cannot execute data reading."
                                         f"\nReconnect and try again.", sensor_type="Aquatic")
-        else:
+        return sensor
+
+    def _read_sensor_data(self, data_type: Literal['ph', 'ec']) -> float:
+        """
+        Helper method to read aquatic sensor data.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        if self.streaming:
+            return round(self._latest_streamed()[data_type], self.decimal_precision[data_type])
+        self._send_read(data_type)
+        time.sleep(self.conversion_delay[data_type])
+        value = self._fetch_response(data_type)
+        self._publish({data_type: value})
+        return value
+
+    def _stream_loop(self) -> None:
+        """Helper method running the streaming thread: converts both circuits back to back until stopped."""
+        data_types = list(AquaticReading._fields)
+        while not self._stream_stop.is_set():
+            # Wait for the reconnect probe of an open breaker instead of failing fast against it
+            retry_in = max(breaker.status().retry_in for breaker in self.breakers.values())
+            if retry_in:
+                self._stream_stop.wait(retry_in)
+                continue
             try:
-                response = sensor.query(Read.format_command())
-                if response.status_code != 1:
-                    raise SensorReadError(f"Failed to read {data_type} data from the aquatic sensor:"
-                                          f"\n{response.data.decode()}\nReconnect and try again.",
-                                          parameter="data_type", value=data_type)
-                return round(float(response.data.decode()), self.decimal_precision[data_type])
-            except (AttributeError, ValueError) as e:
-                raise SensorReadError(f"Failed to read {data_type} data from the aquatic sensor:\n{str(e)}"
-                                      f"\nReconnect and try again.", sensor_type="Aquatic", data_type=data_type)
+                values = self._timed('stream', lambda: self._convert(data_types))
+            except (SensorReadError, SensorConnectionError) as e:
+                with self._stream_condition:
+                    self._stream_error = e
+                    self._stream_condition.notify_all()
+                self._stream_stop.wait(max(self.conversion_delay.values()))
+                continue
+            timestamp = time.time()
+            with self._stream_condition:
+                sequence = self._stream_reading[0] + 1 if self._stream_reading else 1
+                self._stream_reading, self._stream_error = (sequence, timestamp, values), None
+                self._stream_condition.notify_all()
+            self._publish(_round_reading(AquaticReading, values, self.decimal_precision)._asdict(), timestamp)
+            if self._stream_interval:
+                self._stream_stop.wait(self._stream_interval)
+
+    def _next_streamed(self, sequence: int, timeout: Optional[float]) -> Optional[Tuple[int, float, Dict[str, float]]]:
+        """
+        Helper method to wait for a streamed conversion newer than sequence; returns None if streaming stopped.
 
+        Args:
+            sequence (int): The sequence number of the last conversion seen by the caller (0 for none).
+            timeout (float, optional): Maximum wait in seconds; waits indefinitely if omitted.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._stream_condition:
+            while self.streaming and (self._stream_reading is None or self._stream_reading[0] <= sequence):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise self._stream_error or SensorReadError(
+                        f"No aquatic reading streamed within {timeout} seconds.\nReconnect and try again.",
+                        sensor_type="Aquatic")
+                self._stream_condition.wait(remaining)
+            if self._stream_reading is None or self._stream_reading[0] <= sequence:
+                return None
+            return self._stream_reading
+
+    def _latest_streamed(self) -> Dict[str, float]:
+        """
+        Helper method to return the unrounded values of the latest streamed conversion, waiting for the first.
 
-class SensorAtmospheric:
+        Raises the last streaming error once the conversion is older than the interval plus stream_max_age.
+        """
+        with self._stream_condition:
+            entry, error = self._stream_reading, self._stream_error
+        if entry is None:
+            entry = self._next_streamed(0, 2 * max(self.conversion_delay.values()) + self._stream_interval)
+            if entry is None:
+                return self._convert(list(AquaticReading._fields))
+        age = time.time() - entry[1]
+        if age > self._stream_interval + self.stream_max_age:
+            raise error or SensorReadError(f"Latest streamed aquatic reading is {age:.1f} seconds old."
+                                           f"\nReconnect and try again.", sensor_type="Aquatic")
+        return entry[2]
+
+
+class SensorAtmospheric(SensorBase):
     """
     Manages interfacing with the atmospheric sensor: Pimoroni BME680 Breakout.
 
     This class provides methods to connect to the sensor via I2C interface, configure its settings,
-    and read temperature, humidity, and pressure data.
+    and read temperature, humidity, and pressure data with a measurement profile (see ATMOSPHERIC_PROFILES).
     """
 
+    # Primary address; a second probe on the same bus uses the secondary address (0x77)
     I2C_ADDRESS = 0x76
+    sensor_type = 'Atmospheric'
     decimal_precision = {'temperature': 1, 'humidity': 0, 'pressure': 0}
+    max_age = {'temperature': 1.0, 'humidity': 1.0, 'pressure': 1.0}
 
-    def __init__(self):
-        self.sensor: Union[bme680.BME680, None] = None
+    def __init__(self, backend: Union[Any, None] = None, max_age: Union[Mapping[str, float], None] = None,
+                 profile: Union[str, AtmosphericProfile] = 'balanced', name: Optional[str] = None,
+                 address: Optional[int] = None):
+        self.address: int = self.I2C_ADDRESS if address is None else address
+        super().__init__(backend, max_age, name)
+        self._driver: Union[Any, None] = None
+        self._measurement_started: Optional[float] = None
+        self._measurement: Optional[AtmosphericReading] = None
+        self._measurement_error: Optional[Exception] = None
+        self._measurement_pending: Set[str] = set()
+        self.sensor: Union[Any, None] = None
+        self.profile: AtmosphericProfile = self._resolve_profile(profile)
 
     def connect(self) -> None:
         """Establishes I2C connection with the atmospheric sensor."""
         try:
-            self.sensor = bme680.BME680(self.I2C_ADDRESS)
-        except (OSError, IOError) as e:
-            raise SensorConnectionError(f"Failed to connect to atmospheric sensor:\n{str(e)}",
-                                        sensor_type="Atmospheric")
+            self._driver = self.backend.bme680_constants()
+            self.sensor = self.backend.open_bme680(self.address)
+        except (OSError, IOError, RuntimeError) as e:
+            error = SensorConnectionError(f"Failed to connect to atmospheric sensor:\n{str(e)}",
+                                          sensor_type="Atmospheric")
+            self._record_error('connect', error)
+            raise error
 
     def setup(self) -> None:
         """Configures atmospheric sensor settings."""
@@ -157,28 +887,179 @@ class SensorAtmospheric:
         else:
             try:
                 # Oversampling settings
-                self.sensor.set_temperature_oversample(bme680.OS_8X)
-                self.sensor.set_humidity_oversample(bme680.OS_2X)
-                self.sensor.set_pressure_oversample(bme680.OS_4X)
+                self.sensor.set_temperature_oversample(getattr(self._driver, self.profile.temperature_oversample))
+                self.sensor.set_humidity_oversample(getattr(self._driver, self.profile.humidity_oversample))
+                self.sensor.set_pressure_oversample(getattr(self._driver, self.profile.pressure_oversample))
                 # Filter settings
-                self.sensor.set_filter(bme680.FILTER_SIZE_3)
+                self.sensor.set_filter(getattr(self._driver, self.profile.filter_size))
+                # The gas heater would add its heating time to every measurement
+                self.sensor.set_gas_status(self._driver.DISABLE_GAS_MEAS)
             except AttributeError as e:
                 raise SensorConfigurationError(f"Atmospheric sensor configuration failed:\n{str(e)}."
                                                f"\nReconnect and try again.", sensor_type="Atmospheric")
 
-    def read_temperature(self) -> float:
+    def set_profile(self, profile: Union[str, AtmosphericProfile]) -> None:
+        """
+        Selects the measurement profile, applying it immediately if the sensor is connected.
+
+        Args:
+            profile (str or AtmosphericProfile): A name of ATMOSPHERIC_PROFILES ('fast', 'balanced', 'precise')
+                or custom settings.
+        """
+        self.profile = self._resolve_profile(profile)
+        if self.sensor:
+            self.setup()
+
+    def read_temperature(self, force_refresh: bool = False) -> float:
         """Reads atmospheric temperature from the sensor."""
-        return self._read_sensor_data('temperature')
+        return self._cached_read('temperature', force_refresh)
 
-    def read_humidity(self) -> float:
+    def read_humidity(self, force_refresh: bool = False) -> float:
         """Reads atmospheric humidity from the sensor."""
-        return self._read_sensor_data('humidity')
+        return self._cached_read('humidity', force_refresh)
 
-    def read_pressure(self) -> float:
+    def read_pressure(self, force_refresh: bool = False) -> float:
         """Read atmospheric pressure from the sensor."""
-        return self._read_sensor_data('pressure')
+        return self._cached_read('pressure', force_refresh)
+
+    def read_all(self) -> AtmosphericReading:
+        """Reads temperature, humidity and pressure from a single forced-mode measurement."""
+        return self._timed('all', self._read_all)
+
+    @property
+    def conversion_delay(self) -> Dict[str, float]:
+        """Duration in seconds of a forced-mode measurement with the current profile, keyed by data type."""
+        return dict.fromkeys(self.decimal_precision, self.profile.duration)
+
+    def start_read(self, data_type: Literal['temperature', 'humidity', 'pressure']) -> None:
+        """
+        Triggers a forced-mode measurement without waiting for it to finish.
+
+        One measurement serves all parameters, so the calls for the other parameters do nothing, also when its
+        trigger failed, until finish_read() has collected them once conversion_delay[data_type] has elapsed.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        if data_type in self._measurement_pending:
+            return
+        self._measurement_pending = set(self.decimal_precision)
+        self._measurement_started, self._measurement = None, None
+        try:
+            self._guarded(data_type, self._trigger)
+        except Exception as e:
+            self._record_error(data_type, e)
+            # Recorded for the sweep: the other parameters raise it from finish_read() instead of retrying
+            self._measurement_pending.discard(data_type)
+            self._measurement_error = e
+            raise
+        self._measurement_started, self._measurement_error = time.perf_counter(), None
+
+    def finish_read(self, data_type: Literal['temperature', 'humidity', 'pressure']) -> float:
+        """
+        Collects a parameter of the measurement triggered with start_read(), or makes a blocking read without one.
+
+        The first call fetches all parameters; the others return them, or raise the same error if it failed.
+
+        Args:
+            data_type (str): The name of the parameter to measure
+        """
+        if data_type not in self._measurement_pending:
+            return self._read_sensor_data(data_type)
+        self._measurement_pending.discard(data_type)
+        try:
+            if self._measurement_started is not None:
+                started, self._measurement_started = self._measurement_started, None
+                try:
+                    values = self._guarded(data_type, lambda: self._fetch(list(AtmosphericReading._fields)))
+                except Exception as e:
+                    self._record_error(data_type, e)
+                    self._measurement_error = e
+                    raise
+                self.metrics.record_read(self.name, 'all', time.perf_counter() - started)
+                self._measurement = _round_reading(AtmosphericReading, values, self.decimal_precision)
+                self._publish(self._measurement._asdict())
+            if self._measurement_error is not None:
+                # The measurement of this sweep failed; a blocking read would only hit the same device again
+                raise self._measurement_error
+            return getattr(self._measurement, data_type)
+        finally:
+            if not self._measurement_pending:
+                # Collected in full; a later finish_read() without start_read() reads anew
+                self._measurement, self._measurement_error = None, None
 
     # Protected methods
+    def _read_all(self) -> AtmosphericReading:
+        """Helper method to read temperature, humidity and pressure (see read_all)."""
+        reading = _round_reading(AtmosphericReading, self._read_raw(list(AtmosphericReading._fields)),
+                                 self.decimal_precision)
+        self._publish(reading._asdict())
+        return reading
+
+    def _read_raw(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to read unrounded values of a single forced-mode measurement."""
+        self._measure()
+        return self._fields(data_types)
+
+    def _fetch(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to fetch unrounded values of the measurement triggered by start_read()."""
+        if not self.sensor:
+            raise SensorConnectionError("Atmospheric sensor not connected. Cannot execute data reading."
+                                        "\nReconnect and try again.", sensor_type="Atmospheric")
+        try:
+            if not self.sensor.fetch_measurement():
+                raise SensorReadError("Atmospheric sensor measurement did not complete.\nReconnect and try again.",
+                                      sensor_type="Atmospheric")
+        except (OSError, IOError) as e:
+            raise SensorReadError(f"Failed to read data from the atmospheric sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Atmospheric")
+        return self._fields(data_types)
+
+    def _fields(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to return unrounded values of the last fetched measurement."""
+        try:
+            return {data_type: float(getattr(self.sensor.data, data_type)) for data_type in data_types}
+        except (AttributeError, TypeError, ValueError) as e:
+            raise SensorReadError(f"Failed to read data from the atmospheric sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Atmospheric")
+
+    @staticmethod
+    def _resolve_profile(profile: Union[str, AtmosphericProfile]) -> AtmosphericProfile:
+        """Helper method to return the settings of a measurement profile."""
+        if isinstance(profile, AtmosphericProfile):
+            invalid = [setting for setting in profile[:3] if setting not in _OVERSAMPLING_CYCLES]
+            if not invalid and profile.filter_size.startswith('FILTER_SIZE_'):
+                return profile
+        elif profile in ATMOSPHERIC_PROFILES:
+            return ATMOSPHERIC_PROFILES[profile]
+        raise CommandArgumentError(f"Invalid atmospheric measurement profile.\nChoose one of "
+                                   f"{', '.join(ATMOSPHERIC_PROFILES)} or valid AtmosphericProfile settings.",
+                                   parameter="profile", value=profile)
+
+    def _measure(self) -> None:
+        """Helper method to run a forced-mode measurement of the profile duration and load its results."""
+        if not self.sensor:
+            raise SensorConnectionError("Atmospheric sensor not connected. Cannot execute data reading."
+                                        "\nReconnect and try again.", sensor_type="Atmospheric")
+        try:
+            if not self.sensor.get_sensor_data_timed(self.profile.duration):
+                raise SensorReadError("Atmospheric sensor measurement did not complete.\nReconnect and try again.",
+                                      sensor_type="Atmospheric")
+        except (OSError, IOError) as e:
+            raise SensorReadError(f"Failed to read data from the atmospheric sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Atmospheric")
+
+    def _trigger(self) -> None:
+        """Helper method to trigger a forced-mode measurement without waiting for it."""
+        if not self.sensor:
+            raise SensorConnectionError("Atmospheric sensor not connected. Cannot execute data reading."
+                                        "\nReconnect and try again.", sensor_type="Atmospheric")
+        try:
+            self.sensor.start_measurement()
+        except (OSError, IOError) as e:
+            raise SensorReadError(f"Failed to request data from the atmospheric sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Atmospheric")
+
     def _read_sensor_data(self, data_type: Literal['temperature', 'humidity', 'pressure']) -> float:
         """
         Helper method to read atmospheric sensor data.
@@ -186,24 +1067,15 @@ class SensorAtmospheric:
         Args:
             data_type (str): The name of the parameter to measure
         """
-        if not self.sensor:
-            raise SensorConnectionError("Soil sensor not connected. Cannot execute data reading."
-                                        "\nReconnect and try again.", sensor_type="Atmospheric")
-        else:
-            try:
-                if data_type not in ['temperature', 'humidity', 'pressure']:
-                    raise CommandArgumentError(f"Cannot read {data_type} from the soil sensor. Invalid data type. "
-                                               f"\nChoose either moisture or temperature.", parameter="data_type",
-                                               value=data_type)
-                else:
-                    value = getattr(self.sensor.data, data_type)
-                    return round(float(value), self.decimal_precision[data_type])
-            except (AttributeError, ValueError) as e:
-                raise SensorReadError(f"Failed to read {data_type} data from the soil sensor:\n{str(e)}"
-                                      f"\nReconnect and try again.", sensor_type="Atmospheric", data_type=data_type)
+        if data_type not in self.decimal_precision:
+            raise CommandArgumentError(f"Cannot read {data_type} from the atmospheric sensor. Invalid data type. "
+                                       f"\nChoose either temperature, humidity or pressure.", parameter="data_type",
+                                       value=data_type)
+        # All parameters come from the same measurement, so publish (and cache) all of them
+        return getattr(self._read_all(), data_type)
 
 
-class SensorSoil:
+class SensorSoil(SensorBase):
     """
     Manages interfacing with the soil sensor: Adafruit STEMMA Soil Sensor.
 
@@ -211,33 +1083,71 @@ class SensorSoil:
     and read humidity and temperature data.
     """
 
+    # Default address; further probes use 0x37-0x39 (address jumpers) or multiplexer channels
     I2C_ADDRESS = 0x36
+    sensor_type = 'Soil'
     decimal_precision = {'moisture': 0, 'temperature': 0}
+    max_age = {'moisture': 2.0, 'temperature': 2.0}
 
-    def __init__(self):
-        self.sensor: Union[Seesaw, None] = None
+    def __init__(self, backend: Union[Any, None] = None, max_age: Union[Mapping[str, float], None] = None,
+                 name: Optional[str] = None, address: Optional[int] = None):
+        self.address: int = self.I2C_ADDRESS if address is None else address
+        super().__init__(backend, max_age, name)
+        self.sensor: Union[Any, None] = None
 
     def connect(self) -> None:
         """Establishes I2C connection with the soil sensor."""
         try:
-            self.sensor = Seesaw(board.I2C(), addr=self.I2C_ADDRESS)
-        except (OSError, IOError) as e:
-            raise SensorConnectionError(f"Failed to connect to soil sensor:\n{str(e)}", sensor_type="Soil")
+            self.sensor = self.backend.open_seesaw(self.address)
+        except (OSError, IOError, ValueError) as e:
+            error = SensorConnectionError(f"Failed to connect to soil sensor:\n{str(e)}", sensor_type="Soil")
+            self._record_error('connect', error)
+            raise error
 
     def setup(self) -> None:
         """Configures soil sensor settings."""
         # No configuration required for this sensor
         pass
 
-    def read_moisture(self) -> float:
+    def read_moisture(self, force_refresh: bool = False) -> float:
         """Reads soil moisture from the sensor."""
-        return self._read_sensor_data('moisture')
+        return self._cached_read('moisture', force_refresh)
 
-    def read_temperature(self) -> float:
+    def read_temperature(self, force_refresh: bool = False) -> float:
         """Reads soil temperature from the sensor."""
-        return self._read_sensor_data('temperature')
+        return self._cached_read('temperature', force_refresh)
+
+    def read_all(self) -> SoilReading:
+        """Reads soil moisture and temperature in one pass."""
+        return self._timed('all', self._read_all)
 
     # Protected methods
+    def _read_all(self) -> SoilReading:
+        """Helper method to read soil moisture and temperature (see read_all)."""
+        if not self.sensor:
+            raise SensorConnectionError("Soil sensor not connected. Cannot execute data reading."
+                                        "\nReconnect and try again.", sensor_type="Soil")
+        try:
+            values = {'moisture': self.sensor.moisture_read(), 'temperature': self.sensor.get_temp()}
+            reading = _round_reading(SoilReading, values, self.decimal_precision)
+        except (AttributeError, ValueError, OSError) as e:
+            raise SensorReadError(f"Failed to read data from the soil sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Soil")
+        self._publish(reading._asdict())
+        return reading
+
+    def _read_raw(self, data_types: List[str]) -> Dict[str, float]:
+        """Helper method to read one unrounded sample of each data type."""
+        if not self.sensor:
+            raise SensorConnectionError("Soil sensor not connected. Cannot execute data reading."
+                                        "\nReconnect and try again.", sensor_type="Soil")
+        readers = {'moisture': self.sensor.moisture_read, 'temperature': self.sensor.get_temp}
+        try:
+            return {data_type: float(readers[data_type]()) for data_type in data_types}
+        except (AttributeError, ValueError, OSError) as e:
+            raise SensorReadError(f"Failed to read data from the soil sensor:\n{str(e)}"
+                                  f"\nReconnect and try again.", sensor_type="Soil")
+
     def _read_sensor_data(self, data_type: Literal['moisture', 'temperature']) -> float:
         """
         Helper method to read soil sensor data.
@@ -251,15 +1161,15 @@ class SensorSoil:
         else:
             try:
                 if data_type == 'moisture':
-                    value = self.sensor.moisture_read()
-                    return round(float(value), self.decimal_precision[data_type])
+                    value = round(float(self.sensor.moisture_read()), self.decimal_precision[data_type])
                 elif data_type == 'temperature':
-                    value = self.sensor.get_temp()
-                    return round(float(value), self.decimal_precision[data_type])
+                    value = round(float(self.sensor.get_temp()), self.decimal_precision[data_type])
                 else:
                     raise CommandArgumentError(f"Cannot read {data_type} from the soil sensor. Invalid data type."
                                                f"\nChoose either moisture or temperature.", parameter="data_type",
                                                value=data_type)
-            except (AttributeError, ValueError) as e:
+            except (AttributeError, ValueError, OSError) as e:
                 raise SensorReadError(f"Failed to read {data_type} data from the soil sensor:\n{str(e)}"
                                       f"\nReconnect and try again.", sensor_type="Soil", data_type=data_type)
+            self._publish({data_type: value})
+            return value
@@ -0,0 +1,295 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: storage
+
+This module provides the persistent, append-only reading log of the GrowHub device.
+Readings are batched in memory and flushed by a background thread as fixed-width binary
+records, so the read loop never waits for the SD card and every flush is one sequential write.
+
+On-disk layout (one segment per UTC day):
+    channels.json       Channel name to channel id registry.
+    YYYY-MM-DD.dat      Records: timestamp (float64), channel id (uint32), value (float64), little-endian.
+    YYYY-MM-DD.idx      Time index: one entry per flushed block (min/max timestamp, first record, record count).
+
+Range queries read the time index, then memory-map only the data blocks overlapping the
+requested range, so scanning months of history stays fast and bounded in memory.
+
+Classes:
+    ReadingLog: Append-only reading log with batched background flushes and memory-mapped range queries.
+
+Usage:
+    from sensors import SensorAquatic
+    from storage import ReadingLog
+
+    log = ReadingLog('/var/lib/growhub/readings')
+    log.start()
+    sensor_aquatic = SensorAquatic()
+    sensor_aquatic.add_listener(log.append)
+    ...
+    timestamps, values = log.query('aquatic.ph', start=time.time() - 30 * 86400)
+    log.close()
+"""
+
+
+# Standard library imports
+import json
+import mmap
+import os
+import threading
+import time
+from datetime import datetime, timezone
+# Third-party imports (venv)
+import numpy as np
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple
+)
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+RECORD_DTYPE = np.dtype([('timestamp', '<f8'), ('channel', '<u4'), ('value', '<f8')])
+INDEX_DTYPE = np.dtype([('start', '<f8'), ('end', '<f8'), ('offset', '<u8'), ('count', '<u4')])
+
+
+class ReadingLog:
+    """
+    Append-only reading log with batched background flushes and memory-mapped range queries.
+
+    Batches are written at batch_size records or every flush_interval seconds.
+
+    Args:
+        directory (str): Directory of the log segments; created if missing.
+        flush_interval (float): Maximum time in seconds a reading waits in memory before being written.
+        batch_size (int): Number of buffered records that triggers an early flush.
+        fsync (bool): Whether to fsync every flush, trading SD card writes for durability on power loss.
+    """
+
+    def __init__(self, directory: str, flush_interval: float = 30.0, batch_size: int = 4096,
+                 fsync: bool = True) -> None:
+        if flush_interval <= 0 or batch_size < 1:
+            raise CommandArgumentError("Reading log flush interval and batch size must be positive.",
+                                       parameter="flush_interval" if flush_interval <= 0 else "batch_size",
+                                       value=flush_interval if flush_interval <= 0 else batch_size)
+        self.directory: str = directory
+        self.flush_interval: float = flush_interval
+        self.batch_size: int = batch_size
+        self.fsync: bool = fsync
+        os.makedirs(directory, exist_ok=True)
+        self._channels: Dict[str, int] = self._load_channels()
+        self._batch: List[Tuple[float, int, float]] = []
+        self._batch_lock: threading.Lock = threading.Lock()
+        self._write_lock: threading.Lock = threading.Lock()
+        self._wakeup: threading.Event = threading.Event()
+        self._stopped: threading.Event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        for segment in self._segments():
+            self._recover(segment)
+
+    @property
+    def channels(self) -> Tuple[str, ...]:
+        """Names of the channels stored in the log."""
+        return tuple(self._channels)
+
+    def start(self) -> None:
+        """Starts the background flush thread."""
+        if self._thread is None:
+            self._stopped.clear()
+            self._thread = threading.Thread(target=self._run, name="reading-log", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stops the background flush thread and writes the pending readings."""
+        if self._thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def append(self, timestamp: float, readings: Mapping[str, float]) -> None:
+        """
+        Adds readings to the in-memory batch.
+
+        Args:
+            timestamp (float): UNIX timestamp of the readings.
+            readings (dict): Reading values keyed by channel name, e.g. {'aquatic.ph': 6.2}.
+        """
+        with self._batch_lock:
+            for channel, value in readings.items():
+                channel_id = self._channels.get(channel)
+                if channel_id is None:
+                    channel_id = self._register_channel(channel)
+                self._batch.append((timestamp, channel_id, value))
+            full = len(self._batch) >= self.batch_size
+        if full:
+            self._wakeup.set()
+
+    def flush(self) -> None:
+        """Writes the pending readings to disk."""
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+        if not batch:
+            return
+        records = np.array(batch, dtype=RECORD_DTYPE)
+        records.sort(order='timestamp', kind='stable')
+        with self._write_lock:
+            # Split the batch at UTC day boundaries, one block per segment
+            days = (records['timestamp'] // 86400).astype(np.int64)
+            for day in np.unique(days):
+                self._write_block(self._segment_name(float(day) * 86400), records[days == day])
+
+    def scan(self, channels: Optional[List[str]] = None, start: float = 0.0, end: Optional[float] = None) \
+            -> Iterator[np.ndarray]:
+        """
+        Yields the records within [start, end] block by block, as RECORD_DTYPE arrays.
+
+        Only the index and the data blocks overlapping the range are read, so memory usage is bounded
+        by the largest block regardless of the queried span. Records are in time order within a block.
+
+        Args:
+            channels (list, optional): Channel names to return; all channels if omitted.
+            start (float): Start of the range as a UNIX timestamp.
+            end (float, optional): End of the range as a UNIX timestamp; defaults to the current time.
+        """
+        end = time.time() if end is None else end
+        channel_ids = None
+        if channels is not None:
+            channel_ids = np.array([self._channels[channel] for channel in channels if channel in self._channels],
+                                   dtype=np.uint32)
+            if channel_ids.size == 0:
+                return
+        first_segment, last_segment = self._segment_name(start), self._segment_name(end)
+        for segment in self._segments():
+            if first_segment <= segment <= last_segment:
+                yield from self._scan_segment(segment, channel_ids, start, end)
+
+    def query(self, channel: str, start: float = 0.0, end: Optional[float] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the timestamps and values of a channel within [start, end], oldest first.
+
+        Args:
+            channel (str): The channel name, e.g. 'aquatic.ph'.
+            start (float): Start of the range as a UNIX timestamp.
+            end (float, optional): End of the range as a UNIX timestamp; defaults to the current time.
+        """
+        blocks = list(self.scan([channel], start, end))
+        if not blocks:
+            return np.empty(0), np.empty(0)
+        records = np.concatenate(blocks)
+        records.sort(order='timestamp', kind='stable')
+        return records['timestamp'], records['value']
+
+    # Protected methods
+    def _run(self) -> None:
+        """Helper method running the background flush loop."""
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def _path(self, name: str) -> str:
+        """Helper method to build the path of a file in the log directory."""
+        return os.path.join(self.directory, name)
+
+    def _segments(self) -> List[str]:
+        """Helper method to list the segment names (YYYY-MM-DD) in chronological order."""
+        return sorted(name[:-4] for name in os.listdir(self.directory) if name.endswith('.dat'))
+
+    @staticmethod
+    def _segment_name(timestamp: float) -> str:
+        """Helper method to return the segment name holding a timestamp."""
+        return datetime.fromtimestamp(max(timestamp, 0.0), tz=timezone.utc).strftime('%Y-%m-%d')
+
+    def _load_channels(self) -> Dict[str, int]:
+        """Helper method to load the channel registry."""
+        try:
+            with open(self._path('channels.json'), 'r') as file:
+                return {str(channel): int(channel_id) for channel, channel_id in json.load(file).items()}
+        except FileNotFoundError:
+            return {}
+
+    def _register_channel(self, channel: str) -> int:
+        """Helper method to assign an id to a new channel and persist the registry atomically."""
+        channel_id = len(self._channels)
+        self._channels[channel] = channel_id
+        temporary_path = self._path('channels.json.tmp')
+        with open(temporary_path, 'w') as file:
+            json.dump(self._channels, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary_path, self._path('channels.json'))
+        return channel_id
+
+    def _write_block(self, segment: str, records: np.ndarray) -> None:
+        """Helper method to append one block of records to a segment and index it."""
+        data_path = self._path(f"{segment}.dat")
+        offset = os.path.getsize(data_path) // RECORD_DTYPE.itemsize if os.path.exists(data_path) else 0
+        entry = np.array([(records['timestamp'].min(), records['timestamp'].max(), offset, records.size)],
+                         dtype=INDEX_DTYPE)
+        # Data first, index second: a crash in between leaves an unindexed tail that _recover() indexes
+        for path, payload in ((data_path, records), (self._path(f"{segment}.idx"), entry)):
+            with open(path, 'ab') as file:
+                file.write(payload.tobytes())
+                file.flush()
+                if self.fsync:
+                    os.fsync(file.fileno())
+
+    def _read_index(self, segment: str) -> np.ndarray:
+        """Helper method to read the time index of a segment."""
+        try:
+            with open(self._path(f"{segment}.idx"), 'rb') as file:
+                raw = file.read()
+        except FileNotFoundError:
+            return np.empty(0, dtype=INDEX_DTYPE)
+        return np.frombuffer(raw[:len(raw) - len(raw) % INDEX_DTYPE.itemsize], dtype=INDEX_DTYPE)
+
+    def _recover(self, segment: str) -> None:
+        """Helper method to drop a partially written record and index records left unindexed by a crash."""
+        data_path = self._path(f"{segment}.dat")
+        size = os.path.getsize(data_path)
+        if size % RECORD_DTYPE.itemsize:
+            with open(data_path, 'r+b') as file:
+                file.truncate(size - size % RECORD_DTYPE.itemsize)
+        index_path = self._path(f"{segment}.idx")
+        if os.path.exists(index_path) and os.path.getsize(index_path) % INDEX_DTYPE.itemsize:
+            with open(index_path, 'r+b') as file:
+                file.truncate(os.path.getsize(index_path) // INDEX_DTYPE.itemsize * INDEX_DTYPE.itemsize)
+        index = self._read_index(segment)
+        indexed = int((index['offset'] + index['count']).max()) if index.size else 0
+        total = os.path.getsize(data_path) // RECORD_DTYPE.itemsize
+        if total > indexed:
+            with open(data_path, 'rb') as file:
+                file.seek(indexed * RECORD_DTYPE.itemsize)
+                tail = np.frombuffer(file.read(), dtype=RECORD_DTYPE)
+            entry = np.array([(tail['timestamp'].min(), tail['timestamp'].max(), indexed, tail.size)],
+                             dtype=INDEX_DTYPE)
+            with open(index_path, 'ab') as file:
+                file.write(entry.tobytes())
+
+    def _scan_segment(self, segment: str, channel_ids: Optional[np.ndarray], start: float, end: float) \
+            -> Iterator[np.ndarray]:
+        """Helper method to yield the matching records of the indexed blocks of a segment overlapping a range."""
+        index = self._read_index(segment)
+        blocks = index[(index['end'] >= start) & (index['start'] <= end)]
+        if blocks.size == 0:
+            return
+        with open(self._path(f"{segment}.dat"), 'rb') as file, \
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            for offset, count in zip(blocks['offset'].tolist(), blocks['count'].tolist()):
+                block = np.frombuffer(mapped, dtype=RECORD_DTYPE, count=count,
+                                      offset=offset * RECORD_DTYPE.itemsize)
+                mask = (block['timestamp'] >= start) & (block['timestamp'] <= end)
+                if channel_ids is not None:
+                    mask &= np.isin(block['channel'], channel_ids)
+                # Boolean indexing copies the records, so the map can be closed afterwards
+                matches = block[mask]
+                del block
+                if matches.size:
+                    yield matches
@@ -0,0 +1,342 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: supervisor
+
+This module isolates the blocking I/O of the sensor classes in worker processes. None of the sensor
+drivers (atlas_i2c, bme680, adafruit_seesaw) take a timeout, so a hung I2C transaction blocks its
+caller indefinitely, and a thread cannot be interrupted. A SupervisedSensor runs one sensor instance
+in a dedicated worker process and forwards every call over a pipe with a deadline:
+    1. A call that misses its deadline gets the worker killed, and raises SensorConnectionError.
+    2. The next call starts a new worker and replays connect(), setup() and the sensor configuration
+       (set_profile(), start_streaming(), update_temperature()) before it is forwarded, each under the
+       same deadline.
+    3. A worker that exits unexpectedly is handled the same way.
+
+Readings published in the worker are passed to the listeners of the SupervisedSensor, and the read
+latencies and errors recorded in the worker are relayed to the metrics registry of the supervising
+process, so history, storage and metrics attach to a SupervisedSensor like to the sensor itself.
+
+Each worker owns its own devices, so the per-device transaction sequences never interleave; the
+kernel I2C driver serializes the single transactions of different workers on a shared bus.
+
+Default call timeouts:
+    read_burst      60 seconds.
+    calibrate_ph    30 seconds.
+    Other calls     5 seconds.
+
+Classes:
+    SupervisedSensor: Runs a sensor in a worker process, with per-call timeouts and automatic restarts.
+
+Usage:
+    from acquisition import AcquisitionEngine
+    from sensors import SensorAquatic, SensorAtmospheric, SensorSoil
+    from supervisor import SupervisedSensor
+
+    sensors = [SupervisedSensor(SensorAquatic), SupervisedSensor(SensorAtmospheric, timeout=2.0),
+               SupervisedSensor(SensorSoil, timeout=2.0)]
+    engine = AcquisitionEngine(sensors)
+    engine.connect()
+    snapshot = engine.sweep()
+    ...
+    for sensor in sensors:
+        sensor.close()
+"""
+
+
+# Standard library imports
+import multiprocessing
+import signal
+import threading
+import weakref
+# Third-party imports (venv)
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple
+)
+# Codebase imports (firmware)
+from metrics import metrics
+# Codebase imports (API)
+from api_client import APIClient
+SensorConnectionError = APIClient.get_exception('SensorConnectionError')
+SensorError = APIClient.get_exception('SensorError')
+SensorReadError = APIClient.get_exception('SensorReadError')
+
+
+DEFAULT_TIMEOUT = 5.0
+CALL_TIMEOUTS = {'read_burst': 60.0, 'calibrate_ph': 30.0}
+# Calls replayed on a restarted worker, keyed by the configuration they set (latest call per key)
+_REPLAYED = {'connect': 'connect', 'setup': 'setup', 'set_profile': 'profile',
+             'start_streaming': 'streaming', 'stop_streaming': 'streaming', 'update_temperature': 'temperature'}
+# Time in seconds to wait for a killed worker; a process stuck in the kernel I2C driver may exit late
+_JOIN_TIMEOUT = 1.0
+
+# Supervised sensors of the process, exported as the worker restart counter (see metrics)
+_supervised: 'weakref.WeakSet[SupervisedSensor]' = weakref.WeakSet()
+
+
+class _MetricsRelay:
+    """Stands in for the metrics registry of a sensor in a worker process, queuing its records for the supervisor."""
+
+    def __init__(self) -> None:
+        self.records: List[Tuple[str, str, str, Any]] = []
+
+    def record_read(self, sensor: str, channel: str, seconds: float) -> None:
+        self.records.append(('read', sensor, channel, seconds))
+
+    def record_error(self, sensor: str, channel: str, error: BaseException) -> None:
+        self.records.append(('error', sensor, channel, _pack_error(error)))
+
+
+def _pack_error(error: BaseException) -> Tuple[str, Dict[str, Any]]:
+    """
+    Helper function to convert an exception to a picklable (class name, attributes) pair.
+
+    The GrowHub exceptions keep their attributes; other exceptions are reduced to their message.
+
+    Args:
+        error (exception): The exception raised in the worker process.
+    """
+    name = type(error).__name__
+    try:
+        APIClient.get_exception(name)
+    except Exception:
+        return name, {'message': str(error)}
+    return name, dict(vars(error))
+
+
+def _unpack_error(packed: Tuple[str, Dict[str, Any]], sensor_type: str) -> Exception:
+    """
+    Helper function to rebuild an exception packed by _pack_error.
+
+    Exceptions other than the GrowHub exceptions are raised as SensorReadError.
+
+    Args:
+        packed (tuple): The (class name, attributes) pair.
+        sensor_type (str): The sensor type, used for the SensorReadError of foreign exceptions.
+    """
+    name, state = packed
+    try:
+        exception_class = APIClient.get_exception(name)
+    except Exception:
+        return SensorReadError(f"{name} in the {sensor_type.lower()} sensor worker:\n{state['message']}",
+                               sensor_type=sensor_type)
+    error = exception_class.__new__(exception_class)
+    error.__dict__.update(state)
+    error.args = (state.get('message'),)
+    return error
+
+
+def _serve(connection: Any, factory: Callable[[], Any]) -> None:
+    """
+    Helper function running the worker process: creates the sensor and serves the forwarded calls.
+
+    Requests are (method, args, kwargs) tuples, or None to exit. Responses are (ok, result or packed error,
+    published readings, metrics records) tuples.
+
+    Args:
+        connection (Connection): The worker end of the pipe.
+        factory (callable): Creates the sensor instance.
+    """
+    # Interrupts are handled by the supervising process, which closes its workers
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    sensor = factory()
+    relay = sensor.metrics = _MetricsRelay()
+    published: List[Tuple[float, Dict[str, float]]] = []
+    sensor.add_listener(lambda timestamp, readings: published.append((timestamp, readings)))
+    while True:
+        try:
+            request = connection.recv()
+        except EOFError:
+            break
+        if request is None:
+            break
+        method, args, kwargs = request
+        try:
+            attribute = getattr(sensor, method)
+            response = (True, attribute(*args, **kwargs) if callable(attribute) else attribute)
+        except Exception as e:
+            response = (False, _pack_error(e))
+        # Readings published by background threads (streaming) are passed on with the next response
+        readings, records = published[:], relay.records[:]
+        del published[:len(readings)], relay.records[:len(records)]
+        try:
+            connection.send(response + (readings, records))
+        except Exception as e:
+            # Results that cannot be pickled, e.g. the generator of stream()
+            connection.send((False, _pack_error(e), readings, records))
+    connection.close()
+
+
+class SupervisedSensor:
+    """
+    Runs a sensor in a dedicated worker process, with per-call timeouts and automatic restarts.
+
+    The public interface of the sensor is forwarded to the worker, except stream(); use the listeners instead.
+
+    Args:
+        factory (callable): Creates the sensor instance, e.g. SensorSoil or functools.partial(SensorAtmospheric,
+            profile='fast'). It is called once locally (for the sensor metadata, without connecting) and once
+            in every worker; with the 'spawn' start method it must be picklable.
+        timeout (float): Deadline in seconds of a forwarded call.
+        timeouts (dict, optional): Deadline overrides keyed by method name, e.g. {'read_burst': 20.0}.
+        start_method (str, optional): The multiprocessing start method; the platform default if omitted.
+    """
+
+    def __init__(self, factory: Callable[[], Any], timeout: float = DEFAULT_TIMEOUT,
+                 timeouts: Optional[Mapping[str, float]] = None, start_method: Optional[str] = None) -> None:
+        self.factory: Callable[[], Any] = factory
+        self.sensor = factory()
+        self.sensor_type: str = self.sensor.sensor_type
+        self.name: str = self.sensor.name
+        self.decimal_precision: Dict[str, int] = self.sensor.decimal_precision
+        self.timeout: float = timeout
+        self.timeouts: Dict[str, float] = {**CALL_TIMEOUTS, **(timeouts or {})}
+        self.listeners: List[Callable[[float, Dict[str, float]], None]] = []
+        self.metrics = metrics
+        self.restarts: int = 0
+        self._context = multiprocessing.get_context(start_method)
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self._connection: Optional[Any] = None
+        self._replay: Dict[str, Tuple[str, tuple, dict]] = {}
+        self._lock: threading.Lock = threading.Lock()
+        _supervised.add(self)
+
+    def __getattr__(self, name: str) -> Any:
+        """Forwards the public methods, properties and instance attributes of the sensor to the worker."""
+        sensor = self.__dict__.get('sensor')
+        if sensor is None or name.startswith('_') or not hasattr(sensor, name):
+            raise AttributeError(f"'{type(sensor).__name__}' object has no attribute '{name}'")
+        attribute = getattr(type(sensor), name, None)
+        if attribute is None or isinstance(attribute, property):
+            # Instance state (e.g. profile, streaming) lives in the worker
+            return self.call(name)
+        if callable(attribute):
+            return lambda *args, **kwargs: self.call(name, *args, **kwargs)
+        return getattr(sensor, name)
+
+    @property
+    def alive(self) -> bool:
+        """True if the worker process is running."""
+        return self._process is not None and self._process.is_alive()
+
+    def add_listener(self, listener: Callable[[float, Dict[str, float]], None]) -> None:
+        """Registers a listener (see SensorBase.add_listener) receiving every successful read of the worker."""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[float, Dict[str, float]], None]) -> None:
+        """Unregisters a listener added with add_listener()."""
+        self.listeners.remove(listener)
+
+    def channel(self, data_type: str) -> str:
+        """Returns the channel name of a measured parameter, e.g. 'aquatic.ph'."""
+        return self.sensor.channel(data_type)
+
+    def connect(self) -> None:
+        """Connects the sensor in the worker process; restarted workers reconnect automatically."""
+        self.call('connect')
+
+    def setup(self) -> None:
+        """Configures the sensor in the worker process; restarted workers are configured automatically."""
+        self.call('setup')
+
+    def call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Calls a sensor method in the worker process and returns its result.
+
+        Starts (or restarts) the worker first if needed. Raises SensorConnectionError if the call misses
+        its deadline or the worker exits; the worker is then killed and restarted by the next call.
+
+        Args:
+            method (str): The name of the sensor method or property.
+            *args: Positional arguments of the method.
+            **kwargs: Keyword arguments of the method.
+        """
+        with self._lock:
+            if not self.alive:
+                self._start()
+            result = self._exchange(method, args, kwargs)
+            if method in _REPLAYED:
+                self._replay[_REPLAYED[method]] = (method, args, kwargs)
+            return result
+
+    def close(self) -> None:
+        """Stops the worker process. The next call starts a new worker."""
+        with self._lock:
+            if self._process is not None:
+                try:
+                    self._connection.send(None)
+                except OSError:
+                    pass
+                self._process.join(_JOIN_TIMEOUT)
+                self._stop()
+
+    # Protected methods
+    def _start(self) -> None:
+        """Helper method to start a worker process and replay the connection and configuration calls."""
+        if self._process is not None:
+            # The worker exited since the last call
+            self._stop()
+            self.restarts += 1
+        connection, worker_connection = self._context.Pipe()
+        self._process = self._context.Process(target=_serve, args=(worker_connection, self.factory),
+                                              name=f"sensor-{self.name}", daemon=True)
+        self._process.start()
+        worker_connection.close()
+        self._connection = connection
+        try:
+            for method, args, kwargs in list(self._replay.values()):
+                self._exchange(method, args, kwargs)
+        except SensorError:
+            # Not connected: start over on the next call
+            self._stop()
+            raise
+
+    def _stop(self) -> None:
+        """Helper method to kill the worker process, if still running, and close the pipe."""
+        if self._process is None:
+            return
+        if self._process.is_alive():
+            self._process.kill()
+            self._process.join(_JOIN_TIMEOUT)
+        self._connection.close()
+        self._process, self._connection = None, None
+
+    def _exchange(self, method: str, args: tuple, kwargs: dict) -> Any:
+        """Helper method to forward a call to the worker and wait for its response until the deadline."""
+        timeout = self.timeouts.get(method, self.timeout)
+        try:
+            self._connection.send((method, args, kwargs))
+            if not self._connection.poll(timeout):
+                raise TimeoutError(f"No response from {method}() within {timeout:g} seconds")
+            ok, result, readings, records = self._connection.recv()
+        except (EOFError, OSError) as e:
+            # Hung or crashed worker (TimeoutError is an OSError): kill it, the next call starts a new one
+            self._stop()
+            self.restarts += 1
+            error = SensorConnectionError(f"{self.sensor_type} sensor worker failed in {method}() and was stopped:"
+                                          f"\n{str(e) or type(e).__name__}",
+                                          sensor_type=self.sensor_type,
+                                          connection_details={'method': method, 'timeout': timeout})
+            self.metrics.record_error(self.name, 'worker', error)
+            raise error
+        for kind, sensor, channel, value in records:
+            if kind == 'read':
+                self.metrics.record_read(sensor, channel, value)
+            else:
+                self.metrics.record_error(sensor, channel, _unpack_error(value, self.sensor_type))
+        for timestamp, values in readings:
+            for listener in self.listeners:
+                listener(timestamp, values)
+        if not ok:
+            raise _unpack_error(result, self.sensor_type)
+        return result
+
+
+metrics.register_collector('growhub_worker_restarts_total', "Sensor worker process restarts by sensor.", ('sensor',),
+                           lambda: {(sensor.name,): sensor.restarts for sensor in list(_supervised)})
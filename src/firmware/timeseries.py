@@ -0,0 +1,235 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: timeseries
+
+This module provides a bounded in-memory history of sensor readings. Every channel
+(e.g. 'aquatic.ph', 'atmospheric.temperature') is stored in a preallocated ring of
+timestamps and values, so memory usage is fixed regardless of uptime. Rollups over
+a window are computed with vectorized NumPy reductions on zero-copy views of the
+rings, so history queries never touch the I2C bus and never create a Python float
+per sample.
+
+Classes:
+    Summary: Min/max/mean/count of a channel over a window.
+    Rollup: Per-bucket min/max/mean/count of a channel over a window.
+    TimeSeriesBuffer: Fixed-size ring buffer of readings with downsampling rollups.
+
+Usage:
+    from sensors import SensorAtmospheric
+    from timeseries import TimeSeriesBuffer
+
+    history = TimeSeriesBuffer(capacity=17280)
+    sensor_atmospheric = SensorAtmospheric()
+    sensor_atmospheric.add_listener(history.append)
+    ...
+    last_hour = history.summary('atmospheric.temperature', window='1h')
+    last_day = history.rollup('atmospheric.temperature', span=86400, resolution=300)
+"""
+
+
+# Standard library imports
+import threading
+import time
+from array import array
+# Third-party imports (venv)
+import numpy as np
+from typing import (
+    Dict,
+    Iterable,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union
+)
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+# Named rollup windows in seconds
+WINDOWS = {'1m': 60, '5m': 300, '1h': 3600, '1d': 86400}
+
+
+class Summary(NamedTuple):
+    """Min/max/mean/count of a channel over a window. Statistics are NaN if the window holds no samples."""
+
+    minimum: float
+    maximum: float
+    mean: float
+    count: int
+
+
+class Rollup(NamedTuple):
+    """Per-bucket statistics of a channel. Each field is an array with one element per non-empty bucket."""
+
+    timestamp: np.ndarray
+    minimum: np.ndarray
+    maximum: np.ndarray
+    mean: np.ndarray
+    count: np.ndarray
+
+
+class _ChannelRing:
+    """Preallocated ring of (timestamp, value) pairs of one channel."""
+
+    __slots__ = ('capacity', 'timestamps', 'values', 'head', 'size')
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity: int = capacity
+        self.timestamps: array = array('d', bytes(8 * capacity))
+        self.values: array = array('d', bytes(8 * capacity))
+        self.head: int = 0  # Index of the next write
+        self.size: int = 0
+
+    def append(self, timestamp: float, value: float) -> None:
+        self.timestamps[self.head] = timestamp
+        self.values[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def ordered(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Returns timestamps and values, oldest first. Views when the ring has not wrapped, copies otherwise."""
+        timestamps = np.frombuffer(self.timestamps, dtype=np.float64)
+        values = np.frombuffer(self.values, dtype=np.float64)
+        if self.size < self.capacity:
+            return timestamps[:self.size], values[:self.size]
+        return (np.concatenate((timestamps[self.head:], timestamps[:self.head])),
+                np.concatenate((values[self.head:], values[:self.head])))
+
+
+class TimeSeriesBuffer:
+    """
+    Fixed-size ring buffer of sensor readings with vectorized downsampling rollups.
+
+    Uses 16 bytes per sample and channel; samples must be appended in time order per channel.
+
+    Args:
+        capacity (int): Number of samples kept per channel.
+        channels (iterable, optional): Channels to preallocate; others are allocated on first use.
+    """
+
+    def __init__(self, capacity: int = 17280, channels: Optional[Iterable[str]] = None) -> None:
+        if capacity < 1:
+            raise CommandArgumentError("Time series capacity must be at least 1.", parameter="capacity",
+                                       value=capacity)
+        self.capacity: int = capacity
+        self._rings: Dict[str, _ChannelRing] = {channel: _ChannelRing(capacity) for channel in channels or ()}
+        self._lock: threading.Lock = threading.Lock()
+
+    @property
+    def channels(self) -> Tuple[str, ...]:
+        """Names of the channels holding history."""
+        return tuple(self._rings)
+
+    def append(self, timestamp: float, readings: Mapping[str, float]) -> None:
+        """
+        Stores one reading per channel.
+
+        Args:
+            timestamp (float): UNIX timestamp of the readings.
+            readings (dict): Reading values keyed by channel name, e.g. {'aquatic.ph': 6.2}.
+        """
+        with self._lock:
+            for channel, value in readings.items():
+                ring = self._rings.get(channel)
+                if ring is None:
+                    ring = self._rings[channel] = _ChannelRing(self.capacity)
+                ring.append(timestamp, value)
+
+    def append_snapshot(self, snapshot) -> None:
+        """Stores the readings of an acquisition SensorSnapshot."""
+        self.append(snapshot.timestamp, snapshot.readings)
+
+    def latest(self, channel: str) -> Optional[Tuple[float, float]]:
+        """Returns the most recent (timestamp, value) of a channel, or None if it has no history."""
+        with self._lock:
+            ring = self._rings.get(channel)
+            if ring is None or ring.size == 0:
+                return None
+            index = (ring.head - 1) % ring.capacity
+            return ring.timestamps[index], ring.values[index]
+
+    def window(self, channel: str, span: Union[float, str], now: Optional[float] = None) \
+            -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the timestamps and values of a channel within the last span seconds, oldest first.
+
+        Args:
+            channel (str): The channel name, e.g. 'aquatic.ph'.
+            span (float or str): Window length in seconds, or a named window ('1m', '5m', '1h', '1d').
+            now (float, optional): End of the window as a UNIX timestamp; defaults to the current time.
+        """
+        end = time.time() if now is None else now
+        start = end - self._seconds(span)
+        with self._lock:
+            ring = self._rings.get(channel)
+            if ring is None:
+                return np.empty(0), np.empty(0)
+            timestamps, values = ring.ordered()
+            first, last = np.searchsorted(timestamps, (start, end), side='right')
+            # Copy the slice so later appends cannot modify the returned arrays
+            return timestamps[first:last].copy(), values[first:last].copy()
+
+    def summary(self, channel: str, window: Union[float, str] = '1h', now: Optional[float] = None) -> Summary:
+        """
+        Returns min/max/mean/count of a channel over a window.
+
+        Args:
+            channel (str): The channel name, e.g. 'aquatic.ph'.
+            window (float or str): Window length in seconds, or a named window ('1m', '5m', '1h', '1d').
+            now (float, optional): End of the window as a UNIX timestamp; defaults to the current time.
+        """
+        _, values = self.window(channel, window, now)
+        if values.size == 0:
+            return Summary(float('nan'), float('nan'), float('nan'), 0)
+        return Summary(float(values.min()), float(values.max()), float(values.mean()), int(values.size))
+
+    def rollup(self, channel: str, span: Union[float, str] = '1d', resolution: Union[float, str] = '5m',
+               now: Optional[float] = None) -> Rollup:
+        """
+        Downsamples a channel into fixed-width buckets, e.g. the last 24 h at 5 min resolution.
+
+        Buckets are aligned to multiples of the resolution; empty buckets are omitted.
+
+        Args:
+            channel (str): The channel name, e.g. 'aquatic.ph'.
+            span (float or str): Window length in seconds, or a named window ('1m', '5m', '1h', '1d').
+            resolution (float or str): Bucket width in seconds, or a named window.
+            now (float, optional): End of the window as a UNIX timestamp; defaults to the current time.
+        """
+        resolution = self._seconds(resolution)
+        if resolution <= 0:
+            raise CommandArgumentError("Rollup resolution must be positive.", parameter="resolution",
+                                       value=resolution)
+        timestamps, values = self.window(channel, span, now)
+        if values.size == 0:
+            empty = np.empty(0)
+            return Rollup(empty, empty, empty, empty, np.empty(0, dtype=np.int64))
+        buckets = np.floor_divide(timestamps, resolution)
+        # Start index of every bucket; timestamps are sorted, so each bucket is a contiguous run
+        starts = np.flatnonzero(np.diff(buckets, prepend=buckets[0] - 1))
+        counts = np.diff(np.append(starts, values.size))
+        return Rollup(timestamp=buckets[starts] * resolution,
+                      minimum=np.minimum.reduceat(values, starts),
+                      maximum=np.maximum.reduceat(values, starts),
+                      mean=np.add.reduceat(values, starts) / counts,
+                      count=counts)
+
+    def clear(self) -> None:
+        """Discards the history of all channels, keeping their allocated memory."""
+        with self._lock:
+            for ring in self._rings.values():
+                ring.head = ring.size = 0
+
+    # Protected methods
+    @staticmethod
+    def _seconds(span: Union[float, str]) -> float:
+        """Helper method to convert a named window to seconds."""
+        if isinstance(span, str):
+            if span not in WINDOWS:
+                raise CommandArgumentError(f"Unknown window {span}.\nChoose one of {', '.join(WINDOWS)}.",
+                                           parameter="window", value=span)
+            return float(WINDOWS[span])
+        return float(span)
@@ -0,0 +1,391 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /src/firmware/ | Python 3.9.19
+
+"""
+GrowHub firmware module: uplink
+
+This module moves the readings of the GrowHub device to a fleet collector (see collector_api) over an
+unreliable network. Readings are batched in memory, sealed into compressed frames on disk, and a
+background thread posts the frames to the collector oldest first, one HTTP request per frame over a
+persistent connection. A frame is deleted only once the collector acknowledged it, so delivery is
+at-least-once: frames survive network outages, collector restarts and device reboots, and a frame
+whose acknowledgement was lost is sent again (the collector discards it as a duplicate).
+
+Readings still in the in-memory batch are lost on power loss, like those of the reading log; the
+batch is sealed every flush_interval seconds, when it reaches batch_size readings, and on close().
+
+Retries are paced by a circuit breaker (see breaker): max_retries consecutive failures stop the
+sender for a backoff that doubles on every failed retry, up to max_backoff. Frames rejected by the
+collector as malformed (4xx other than 408 and 429) are moved to the rejected/ directory, so they
+do not block the queue. Once the frames exceed max_bytes on disk, the oldest are dropped.
+
+On-disk layout:
+    uplink.json                 Queue id (random, identifies the sequence numbers) and next sequence number.
+    <sequence>.frame            Sealed frames, zlib-compressed JSON, named by 12-digit sequence number.
+    rejected/<sequence>.frame   Frames rejected by the collector.
+
+Frame (before compression):
+    {"node": "growhub-01", "queue": "<queue id>", "sequence": 42, "channels": ["aquatic.ph", ...],
+     "readings": [[timestamp, channel index, value], ...]}
+
+Queue state is exported as the growhub_uplink_pending_frames gauge and the growhub_uplink_sent_frames_total,
+growhub_uplink_rejected_frames_total and growhub_uplink_dropped_frames_total counters (see metrics).
+
+Classes:
+    UplinkQueue: Durable store-and-forward queue of readings, posting compressed frames to a collector.
+
+Usage:
+    from acquisition import AcquisitionEngine
+    from uplink import UplinkQueue
+
+    uplink = UplinkQueue('/var/lib/growhub/uplink', 'http://collector.local:8090/ingest', node='growhub-01')
+    uplink.start()
+    while True:
+        snapshot = engine.sweep()
+        uplink.append(snapshot.timestamp, snapshot.readings)
+    ...
+    uplink.close()
+"""
+
+
+# Standard library imports
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+import weakref
+import zlib
+from collections import deque
+from urllib.parse import urlsplit
+# Third-party imports (venv)
+from typing import (
+    Deque,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple
+)
+# Codebase imports (firmware)
+from breaker import CircuitBreaker
+from metrics import metrics
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+# Collector responses retried like network errors; other 4xx responses reject the frame
+RETRIED_STATUS = (408, 429)
+
+# Uplink queues of the process, exported by the collectors registered below
+_queues: 'weakref.WeakSet[UplinkQueue]' = weakref.WeakSet()
+
+
+class UplinkQueue:
+    """
+    Durable store-and-forward queue of readings, posting compressed frames to a collector.
+
+    Args:
+        directory (str): Directory of the queued frames; created if missing.
+        endpoint (str): URL of the collector ingest endpoint, e.g. 'http://collector.local:8090/ingest'.
+        node (str, optional): Name of the device in the fleet; defaults to the host name.
+        flush_interval (float): Maximum time in seconds a reading waits in memory before being sealed.
+        batch_size (int): Number of buffered readings that triggers an early seal.
+        max_bytes (int): Disk budget of the queued frames in bytes; the oldest frames are dropped beyond it.
+        timeout (float): Timeout in seconds of a collector request.
+        max_retries (int): Consecutive failed requests before the sender backs off.
+        backoff (float): Seconds before the first retry after a back-off.
+        max_backoff (float): Upper bound in seconds of the doubling back-off.
+        fsync (bool): Whether to fsync sealed frames, trading SD card writes for durability on power loss.
+    """
+
+    def __init__(self, directory: str, endpoint: str, node: Optional[str] = None, flush_interval: float = 60.0,
+                 batch_size: int = 2000, max_bytes: int = 64 * 1024 * 1024, timeout: float = 10.0,
+                 max_retries: int = 3, backoff: float = 2.0, max_backoff: float = 300.0, fsync: bool = True) -> None:
+        url = urlsplit(endpoint)
+        if url.scheme not in ('http', 'https') or not url.hostname:
+            raise CommandArgumentError("Uplink endpoint must be an http(s) URL.", parameter="endpoint",
+                                       value=endpoint)
+        if flush_interval <= 0 or batch_size < 1:
+            raise CommandArgumentError("Uplink flush interval and batch size must be positive.",
+                                       parameter="flush_interval" if flush_interval <= 0 else "batch_size",
+                                       value=flush_interval if flush_interval <= 0 else batch_size)
+        self.directory: str = directory
+        self.endpoint: str = endpoint
+        self.node: str = node or socket.gethostname()
+        self.flush_interval: float = flush_interval
+        self.batch_size: int = batch_size
+        self.max_bytes: int = max_bytes
+        self.timeout: float = timeout
+        self.fsync: bool = fsync
+        self.breaker: CircuitBreaker = CircuitBreaker(f"uplink@{url.netloc}", max_retries, backoff, max_backoff)
+        self.sent: int = 0
+        self.rejected: int = 0
+        self.dropped: int = 0
+        self._url = url
+        self._connection: Optional[http.client.HTTPConnection] = None
+        os.makedirs(os.path.join(directory, 'rejected'), exist_ok=True)
+        self._queue_id, self._sequence = self._load_state()
+        # Sealed frames as (sequence, size in bytes), oldest first
+        self._frames: Deque[Tuple[int, int]] = deque(sorted(self._scan_frames()))
+        if self._frames:
+            self._sequence = max(self._sequence, self._frames[-1][0] + 1)
+        self._batch: List[Tuple[float, str, float]] = []
+        self._batch_lock: threading.Lock = threading.Lock()
+        self._seal_lock: threading.Lock = threading.Lock()
+        self._frames_lock: threading.Lock = threading.Lock()
+        self._full: threading.Event = threading.Event()
+        self._sealed: threading.Event = threading.Event()
+        self._settled: threading.Event = threading.Event()
+        self._stopped: threading.Event = threading.Event()
+        self._threads: List[threading.Thread] = []
+        _queues.add(self)
+
+    @property
+    def pending(self) -> int:
+        """Number of sealed frames waiting for delivery."""
+        return len(self._frames)
+
+    @property
+    def pending_bytes(self) -> int:
+        """Disk usage in bytes of the sealed frames waiting for delivery."""
+        with self._frames_lock:
+            return sum(size for _, size in self._frames)
+
+    def start(self) -> None:
+        """Starts the background seal and sender threads."""
+        if self._threads:
+            return
+        self._stopped.clear()
+        self._threads = [threading.Thread(target=self._run_sealer, name="uplink-seal", daemon=True),
+                         threading.Thread(target=self._run_sender, name="uplink-send", daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    def close(self) -> None:
+        """Stops the background threads and seals the pending readings; undelivered frames stay on disk."""
+        self._stopped.set()
+        self._full.set()
+        self._sealed.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+        self.flush()
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+    def append(self, timestamp: float, readings: Mapping[str, float]) -> None:
+        """
+        Adds readings to the in-memory batch.
+
+        Args:
+            timestamp (float): UNIX timestamp of the readings.
+            readings (dict): Reading values keyed by channel name, e.g. {'aquatic.ph': 6.2}.
+        """
+        with self._batch_lock:
+            self._batch.extend((timestamp, channel, value) for channel, value in readings.items())
+            full = len(self._batch) >= self.batch_size
+        if full:
+            self._full.set()
+
+    def flush(self) -> None:
+        """Seals the batched readings into frames of at most batch_size readings and wakes the sender."""
+        with self._batch_lock:
+            batch, self._batch = self._batch, []
+        for start in range(0, len(batch), self.batch_size):
+            self._seal(batch[start:start + self.batch_size])
+        if batch:
+            self._sealed.set()
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Seals the batched readings and waits until every frame was delivered; requires start().
+
+        Args:
+            timeout (float, optional): Maximum time to wait in seconds; waits indefinitely if omitted.
+
+        Returns:
+            bool: Whether the queue is empty.
+        """
+        self.flush()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._frames:
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return False
+            self._settled.wait(remaining)
+            self._settled.clear()
+        return True
+
+    # Protected methods
+    def _path(self, *names: str) -> str:
+        """Helper method to build the path of a file in the queue directory."""
+        return os.path.join(self.directory, *names)
+
+    @staticmethod
+    def _frame_name(sequence: int) -> str:
+        """Helper method to return the file name of a frame."""
+        return f"{sequence:012d}.frame"
+
+    def _load_state(self) -> Tuple[str, int]:
+        """Helper method to load the queue id and the next sequence number, creating a new queue id if missing."""
+        try:
+            with open(self._path('uplink.json'), 'r') as file:
+                state = json.load(file)
+            return str(state['queue']), int(state['next_sequence'])
+        except FileNotFoundError:
+            queue_id = uuid.uuid4().hex
+            self._save_state(queue_id, 0)
+            return queue_id, 0
+
+    def _save_state(self, queue_id: str, next_sequence: int) -> None:
+        """Helper method to persist the queue state atomically."""
+        self._write_atomic('uplink.json', json.dumps({'queue': queue_id, 'next_sequence': next_sequence}).encode())
+
+    def _write_atomic(self, name: str, payload: bytes) -> None:
+        """Helper method to write a file of the queue directory through a temporary file and a rename."""
+        temporary_path = self._path(f"{name}.tmp")
+        with open(temporary_path, 'wb') as file:
+            file.write(payload)
+            file.flush()
+            if self.fsync:
+                os.fsync(file.fileno())
+        os.replace(temporary_path, self._path(name))
+
+    def _scan_frames(self) -> List[Tuple[int, int]]:
+        """Helper method to list the sealed frames on disk, removing the temporary files left by a crash."""
+        frames = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.tmp'):
+                os.remove(self._path(name))
+            elif name.endswith('.frame'):
+                frames.append((int(name[:-len('.frame')]), os.path.getsize(self._path(name))))
+        return frames
+
+    def _seal(self, readings: List[Tuple[float, str, float]]) -> None:
+        """Helper method to write a batch of readings as a compressed frame and drop the oldest frames over budget."""
+        channels: Dict[str, int] = {}
+        records = [[timestamp, channels.setdefault(channel, len(channels)), value]
+                   for timestamp, channel, value in readings]
+        with self._seal_lock:
+            sequence = self._sequence
+            payload = zlib.compress(json.dumps({'node': self.node, 'queue': self._queue_id, 'sequence': sequence,
+                                                'channels': list(channels), 'readings': records},
+                                               separators=(',', ':')).encode())
+            self._write_atomic(self._frame_name(sequence), payload)
+            self._sequence += 1
+            self._save_state(self._queue_id, self._sequence)
+            with self._frames_lock:
+                self._frames.append((sequence, len(payload)))
+                total = sum(size for _, size in self._frames)
+                while total > self.max_bytes and len(self._frames) > 1:
+                    oldest, size = self._frames.popleft()
+                    total -= size
+                    self.dropped += 1
+                    self._remove(self._frame_name(oldest))
+
+    def _remove(self, name: str) -> None:
+        """Helper method to delete a frame; a frame dropped while in flight is already gone."""
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def _run_sealer(self) -> None:
+        """Helper method running the background seal loop."""
+        while not self._stopped.is_set():
+            self._full.wait(self.flush_interval)
+            self._full.clear()
+            self.flush()
+
+    def _run_sender(self) -> None:
+        """Helper method running the background sender loop: oldest frame first, paced by the circuit breaker."""
+        while not self._stopped.is_set():
+            with self._frames_lock:
+                frame = self._frames[0] if self._frames else None
+            if frame is None:
+                self._sealed.wait()
+                self._sealed.clear()
+                continue
+            if not self.breaker.allow():
+                self._stopped.wait(max(self.breaker.status().retry_in, 0.01))
+                continue
+            self._deliver(frame[0])
+
+    def _deliver(self, sequence: int) -> None:
+        """Helper method to post one frame and settle it according to the collector response."""
+        name = self._frame_name(sequence)
+        try:
+            with open(self._path(name), 'rb') as file:
+                payload = file.read()
+        except FileNotFoundError:
+            # Dropped over budget meanwhile
+            self.breaker.release()
+            self._settle(sequence)
+            return
+        try:
+            status = self._post(payload)
+        except (OSError, http.client.HTTPException) as e:
+            self._disconnect()
+            self.breaker.record_failure(e)
+            return
+        if 200 <= status < 300:
+            self.breaker.record_success()
+            self.sent += 1
+            self._remove(name)
+        elif status >= 500 or status in RETRIED_STATUS:
+            self.breaker.record_failure(ConnectionError(f"Collector answered {status}."))
+            return
+        else:
+            # Malformed for the collector: keep it aside rather than blocking the queue
+            self.breaker.record_success()
+            self.rejected += 1
+            try:
+                os.replace(self._path(name), self._path('rejected', name))
+            except FileNotFoundError:
+                pass
+        self._settle(sequence)
+
+    def _settle(self, sequence: int) -> None:
+        """Helper method to remove a delivered, rejected or dropped frame from the pending frames."""
+        with self._frames_lock:
+            if self._frames and self._frames[0][0] == sequence:
+                self._frames.popleft()
+        self._settled.set()
+
+    def _post(self, payload: bytes) -> int:
+        """Helper method to post a frame over the persistent connection; returns the HTTP status code."""
+        if self._connection is None:
+            connection_class = http.client.HTTPSConnection if self._url.scheme == 'https' else \
+                http.client.HTTPConnection
+            self._connection = connection_class(self._url.hostname, self._url.port, timeout=self.timeout)
+        target = self._url.path or '/'
+        if self._url.query:
+            target += f"?{self._url.query}"
+        self._connection.request('POST', target, payload, {
+            'Content-Type': 'application/json', 'Content-Encoding': 'deflate', 'X-GrowHub-Node': self.node})
+        response = self._connection.getresponse()
+        response.read()
+        if response.getheader('Connection', '').lower() == 'close':
+            self._disconnect()
+        return response.status
+
+    def _disconnect(self) -> None:
+        """Helper method to close the collector connection after an error; the next request reconnects."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+
+
+metrics.register_collector('growhub_uplink_pending_frames', "Frames waiting for delivery to the collector by node.",
+                           ('node',), lambda: {(queue.node,): queue.pending for queue in list(_queues)},
+                           metric_type='gauge')
+metrics.register_collector('growhub_uplink_sent_frames_total', "Frames delivered to the collector by node.",
+                           ('node',), lambda: {(queue.node,): queue.sent for queue in list(_queues)})
+metrics.register_collector('growhub_uplink_rejected_frames_total', "Frames rejected by the collector by node.",
+                           ('node',), lambda: {(queue.node,): queue.rejected for queue in list(_queues)})
+metrics.register_collector('growhub_uplink_dropped_frames_total', "Frames dropped over the disk budget by node.",
+                           ('node',), lambda: {(queue.node,): queue.dropped for queue in list(_queues)})
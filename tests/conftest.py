@@ -0,0 +1,47 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/ | Python 3.9.19
+
+"""
+GrowHub tests: shared fixtures
+
+Puts the firmware and API codebases on the import path, like the benchmarks do, and provides
+sensors on the simulated I2C backend, so the suite runs on any Linux box without the hardware.
+
+Usage:
+    python -m pytest -q tests
+"""
+
+
+# Standard library imports
+import os
+import sys
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware, API)
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path[:0] = [os.path.join(ROOT_DIR, 'src', 'firmware'), os.path.join(ROOT_DIR, 'src', 'api')]
+from backends import SimulatedBackend  # noqa: E402
+from sensors import SensorAtmospheric, SensorSoil  # noqa: E402
+
+
+@pytest.fixture
+def backend() -> SimulatedBackend:
+    """Simulated bus with instant, noiseless transactions."""
+    return SimulatedBackend(seed=1, transaction_delay=0.0)
+
+
+@pytest.fixture
+def soil(backend: SimulatedBackend) -> SensorSoil:
+    """Connected soil sensor on the simulated bus."""
+    sensor = SensorSoil(backend=backend)
+    sensor.connect()
+    sensor.setup()
+    return sensor
+
+
+@pytest.fixture
+def atmospheric(backend: SimulatedBackend) -> SensorAtmospheric:
+    """Connected atmospheric sensor on the simulated bus, with the fast measurement profile."""
+    sensor = SensorAtmospheric(backend=backend, profile='fast')
+    sensor.connect()
+    sensor.setup()
+    return sensor
@@ -0,0 +1,108 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/integration/ | Python 3.9.19
+
+"""
+GrowHub tests: collector_api
+
+Frame ingestion, duplicate detection, frame validation and size limits of CollectorServer.
+"""
+
+
+# Standard library imports
+import http.client
+import json
+import socket
+import zlib
+# Third-party imports (venv)
+import pytest
+# Codebase imports (API)
+from collector_api import CollectorServer
+
+
+@pytest.fixture
+def collector():
+    """Collector on a free loopback port, recording the ingested readings in collector.received."""
+    received = []
+    server = CollectorServer(lambda node, timestamp, readings: received.append((node, timestamp, readings)),
+                             host='127.0.0.1', port=0, max_frame_bytes=4096)
+    server.received = received
+    server.start()
+    yield server
+    server.stop()
+
+
+def frame(sequence: int, node: str = 'growhub-01') -> bytes:
+    """Returns a compressed frame of two timestamps."""
+    return zlib.compress(json.dumps({'node': node, 'queue': 'q1', 'sequence': sequence,
+                                     'channels': ['aquatic.ph', 'aquatic.ec'],
+                                     'readings': [[1000.0, 0, 6.2], [1000.0, 1, 1200.0], [1005.0, 0, 6.3]]}).encode())
+
+
+def post(server: CollectorServer, body: bytes, encoding: str = 'deflate'):
+    """Returns (status, JSON body) of a POST /ingest request."""
+    connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5.0)
+    try:
+        connection.request('POST', '/ingest', body, {'Content-Encoding': encoding})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+def test_frames_are_grouped_by_timestamp(collector):
+    status, body = post(collector, frame(0))
+    assert (status, body) == (200, {'node': 'growhub-01', 'sequence': 0, 'duplicate': False})
+    assert collector.received == [('growhub-01', 1000.0, {'aquatic.ph': 6.2, 'aquatic.ec': 1200.0}),
+                                  ('growhub-01', 1005.0, {'aquatic.ph': 6.3})]
+    assert collector.status()['growhub-01'].readings == 3
+
+
+def test_duplicates_are_acknowledged_once(collector):
+    post(collector, frame(0))
+    post(collector, frame(1))
+    status, body = post(collector, frame(0))
+    assert status == 200 and body['duplicate']
+    assert len(collector.received) == 4
+    status = collector.status()['growhub-01']
+    assert (status.frames, status.duplicates, status.sequence) == (2, 1, 1)
+
+
+@pytest.mark.parametrize('body, encoding', [(b"not a frame", 'deflate'), (b"{}", 'identity'),
+                                            (b"{}", 'gzip'), (frame(0, node='../etc'), 'deflate')])
+def test_malformed_frames_are_rejected(collector, body, encoding):
+    status, response = post(collector, body, encoding)
+    assert status == 400 and response['error']['type'] == 'CommandArgumentError'
+    assert collector.received == []
+
+
+def test_sink_errors_are_retried_by_the_device(collector):
+    def failing_sink(node, timestamp, readings):
+        raise RuntimeError("disk full")
+
+    collector.sink = failing_sink
+    status, _ = post(collector, frame(0))
+    assert status == 500
+    # Not acknowledged: the same frame is accepted once the sink recovers
+    collector.sink = lambda node, timestamp, readings: collector.received.append(readings)
+    assert post(collector, frame(0))[1]['duplicate'] is False
+
+
+def test_oversized_and_malformed_requests(collector):
+    with socket.create_connection(('127.0.0.1', collector.port), timeout=5.0) as connection:
+        connection.sendall(b"POST /ingest HTTP/1.1\r\nContent-Length: 5000\r\n\r\n")
+        assert connection.recv(65536).startswith(b"HTTP/1.1 413 ")
+    with socket.create_connection(('127.0.0.1', collector.port), timeout=5.0) as connection:
+        connection.sendall(b"POST /ingest\r\n\r\n")
+        assert connection.recv(65536).startswith(b"HTTP/1.1 400 ")
+    # A request line over the 64 KiB stream limit
+    with socket.create_connection(('127.0.0.1', collector.port), timeout=5.0) as connection:
+        connection.sendall(b"POST /" + b"x" * 70000 + b" HTTP/1.1\r\n\r\n")
+        assert connection.recv(65536).startswith(b"HTTP/1.1 400 ")
+
+
+def test_nodes_endpoint(collector):
+    post(collector, frame(0))
+    connection = http.client.HTTPConnection('127.0.0.1', collector.port, timeout=5.0)
+    connection.request('GET', '/nodes')
+    nodes = json.loads(connection.getresponse().read())
+    connection.close()
+    assert nodes['growhub-01']['frames'] == 1 and nodes['growhub-01']['sequence'] == 0
@@ -0,0 +1,106 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/integration/ | Python 3.9.19
+
+"""
+GrowHub tests: readings_api
+
+ETag revalidation, structured errors, history and malformed requests of ReadingsServer.
+"""
+
+
+# Standard library imports
+import http.client
+import json
+import socket
+import time
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from acquisition import SensorSnapshot
+from timeseries import TimeSeriesBuffer
+# Codebase imports (API)
+from readings_api import ReadingStore, ReadingsServer
+from api_client import APIClient
+SensorReadError = APIClient.get_exception('SensorReadError')
+
+
+@pytest.fixture
+def server():
+    """Readings server of a store and a history on a free loopback port."""
+    history = TimeSeriesBuffer(capacity=16)
+    server = ReadingsServer(ReadingStore(), history, port=0)
+    server.start()
+    yield server
+    server.stop()
+
+
+def get(server: ReadingsServer, target: str, headers: dict = None):
+    """Returns (status, headers, body) of a GET request."""
+    connection = http.client.HTTPConnection('127.0.0.1', server.port, timeout=5.0)
+    try:
+        connection.request('GET', target, headers=headers or {})
+        response = connection.getresponse()
+        return response.status, dict(response.getheaders()), response.read()
+    finally:
+        connection.close()
+
+
+def raw_request(server: ReadingsServer, request: bytes) -> bytes:
+    """Sends raw bytes and returns everything the server answers until it closes the connection."""
+    with socket.create_connection(('127.0.0.1', server.port), timeout=5.0) as connection:
+        connection.sendall(request)
+        response = b""
+        while True:
+            chunk = connection.recv(65536)
+            if not chunk:
+                return response
+            response += chunk
+
+
+def test_etag_revalidation(server):
+    server.store.append(1000.0, {'aquatic.ph': 6.2})
+    status, headers, body = get(server, '/readings')
+    assert status == 200 and json.loads(body)['readings']['aquatic.ph'] == {'value': 6.2, 'timestamp': 1000.0}
+    etag = headers['ETag']
+    status, headers, body = get(server, '/readings', {'If-None-Match': etag})
+    assert (status, headers['ETag'], body) == (304, etag, b"")
+    server.store.append(1001.0, {'aquatic.ph': 6.3})
+    status, headers, _ = get(server, '/readings', {'If-None-Match': etag})
+    assert status == 200 and headers['ETag'] != etag
+
+
+def test_channel_errors_are_structured(server):
+    error = SensorReadError("EC probe unplugged.", sensor_type="Aquatic", data_type='ec')
+    server.store.update(SensorSnapshot(1000.0, {'aquatic.ph': 6.2}, {'aquatic.ec': error}))
+    status, _, body = get(server, '/readings/aquatic.ec')
+    details = json.loads(body)['error']
+    assert status == 502 and (details['type'], details['sensor_type']) == ('SensorReadError', 'Aquatic')
+    status, _, body = get(server, '/readings/unknown.channel')
+    assert status == 404 and json.loads(body)['error']['type'] == 'CommandDoesNotExistError'
+
+
+def test_history_summary_and_rollup(server):
+    now = time.time()
+    for second in range(4):
+        server.history.append(now - 3 + second, {'soil.moisture': 650.0 + second})
+    status, _, body = get(server, '/history/soil.moisture?window=1m')
+    assert status == 200 and json.loads(body)['count'] == 4 and json.loads(body)['mean'] == 651.5
+    status, _, body = get(server, '/history/soil.moisture?span=1h&resolution=3600')
+    assert status == 200 and sum(json.loads(body)['count']) == 4
+    assert get(server, '/history/soil.moisture?window=1y')[0] == 400
+    assert get(server, '/history/unknown.channel')[0] == 404
+
+
+@pytest.mark.parametrize('request_line', [b"GARBAGE\r\n\r\n", b"GET /readings\r\n\r\n", b"GET / FTP/1.0\r\n\r\n",
+                                          b"GET /readings HTTP/1.1\r\nNoColonHeader\r\n\r\n",
+                                          b"GET /readings HTTP/1.1\r\nX-Padding: " + b"x" * 70000 + b"\r\n\r\n"])
+def test_malformed_requests_are_answered_with_400(server, request_line):
+    response = raw_request(server, request_line)
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert json.loads(response.split(b"\r\n\r\n", 1)[1])['error']['type'] == 'CommandArgumentError'
+    # The server keeps serving other clients
+    assert get(server, '/readings')[0] == 200
+
+
+def test_other_methods_are_not_allowed(server):
+    response = raw_request(server, b"POST /readings HTTP/1.1\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+    assert response.startswith(b"HTTP/1.1 405 ")
@@ -0,0 +1,71 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/integration/ | Python 3.9.19
+
+"""
+GrowHub tests: supervisor
+
+Call forwarding, deadlines and worker restarts of SupervisedSensor, with sensors on the simulated bus.
+"""
+
+
+# Standard library imports
+import sys
+from functools import partial
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from backends import SimulatedBackend
+from sensors import SensorSoil
+from supervisor import SupervisedSensor
+# Codebase imports (API)
+from api_client import APIClient
+SensorConnectionError = APIClient.get_exception('SensorConnectionError')
+
+
+# The simulated backend holds locks, so the factories are passed to forked workers
+pytestmark = pytest.mark.skipif(sys.platform == 'win32', reason="requires the 'fork' start method")
+
+
+@pytest.fixture
+def supervised():
+    """Supervised soil sensor factory; the workers are stopped after the test."""
+    sensors = []
+
+    def create(timeout: float = 5.0, **device_options) -> SupervisedSensor:
+        factory = partial(SensorSoil, backend=SimulatedBackend(seed=1, transaction_delay=0.0, **device_options))
+        sensor = SupervisedSensor(factory, timeout=timeout, start_method='fork')
+        sensors.append(sensor)
+        return sensor
+
+    yield create
+    for sensor in sensors:
+        sensor.close()
+
+
+def test_calls_and_readings_are_forwarded(supervised):
+    sensor = supervised()
+    received = []
+    sensor.add_listener(lambda timestamp, readings: received.append(readings))
+    sensor.connect()
+    assert sensor.read_moisture(force_refresh=True) == 650.0
+    assert sensor.alive and sensor.restarts == 0
+    assert received == [{'soil.moisture': 650.0}]
+
+
+def test_missed_deadline_kills_the_worker(supervised):
+    sensor = supervised(timeout=0.5, hang_rate=1.0, hang_time=30.0)
+    sensor.connect()
+    with pytest.raises(SensorConnectionError) as error:
+        sensor.read_moisture(force_refresh=True)
+    assert error.value.connection_details == {'method': 'read_moisture', 'timeout': 0.5}
+    assert not sensor.alive and sensor.restarts == 1
+
+
+def test_crashed_worker_is_restarted_and_reconnected(supervised):
+    sensor = supervised()
+    sensor.connect()
+    sensor.read_moisture(force_refresh=True)
+    sensor._process.kill()
+    sensor._process.join()
+    # The connect() call is replayed on the new worker before the read
+    assert sensor.read_temperature(force_refresh=True) == 21.0
+    assert sensor.alive and sensor.restarts == 1
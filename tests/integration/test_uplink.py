@@ -0,0 +1,139 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/integration/ | Python 3.9.19
+
+"""
+GrowHub tests: uplink
+
+Delivery, retries, duplicate frames and disk budget of UplinkQueue, against a local CollectorServer.
+"""
+
+
+# Standard library imports
+import os
+import shutil
+import threading
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from uplink import UplinkQueue
+# Codebase imports (API)
+from collector_api import CollectorServer
+
+
+class Sink:
+    """Collector sink recording the ingested readings; the first failures calls raise."""
+
+    def __init__(self, failures: int = 0) -> None:
+        self.failures: int = failures
+        self.readings: list = []
+        self._lock: threading.Lock = threading.Lock()
+
+    def __call__(self, node: str, timestamp: float, readings: dict) -> None:
+        with self._lock:
+            if self.failures:
+                self.failures -= 1
+                raise RuntimeError("Sink unavailable")
+            self.readings.append((node, timestamp, readings))
+
+
+@pytest.fixture
+def collector():
+    """Collector factory listening on a free loopback port; the servers are stopped after the test."""
+    servers = []
+
+    def create(sink: Sink) -> CollectorServer:
+        server = CollectorServer(sink, host='127.0.0.1', port=0)
+        server.start()
+        servers.append(server)
+        return server
+
+    yield create
+    for server in servers:
+        server.stop()
+
+
+def uplink_queue(directory: str, server: CollectorServer, **options) -> UplinkQueue:
+    """Returns a queue posting to a local collector, with fast retries."""
+    return UplinkQueue(directory, f"http://127.0.0.1:{server.port}/ingest", node='growhub-test', fsync=False,
+                       backoff=0.05, max_backoff=0.1, timeout=2.0, **options)
+
+
+def test_frames_are_delivered_in_order(tmp_path, collector):
+    sink = Sink()
+    queue = uplink_queue(str(tmp_path), collector(sink), batch_size=2)
+    queue.start()
+    try:
+        for second in range(5):
+            queue.append(1000.0 + second, {'aquatic.ph': 6.0 + second / 10})
+        assert queue.drain(timeout=10.0)
+    finally:
+        queue.close()
+    assert [timestamp for _, timestamp, _ in sink.readings] == [1000.0, 1001.0, 1002.0, 1003.0, 1004.0]
+    assert queue.sent == 3 and queue.pending == 0
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.frame')] == []
+
+
+def test_failed_posts_are_retried(tmp_path, collector):
+    sink = Sink(failures=4)
+    server = collector(sink)
+    queue = uplink_queue(str(tmp_path), server, max_retries=2)
+    queue.start()
+    try:
+        queue.append(1000.0, {'soil.moisture': 650.0})
+        assert queue.drain(timeout=10.0)
+    finally:
+        queue.close()
+    assert sink.readings == [('growhub-test', 1000.0, {'soil.moisture': 650.0})]
+    assert queue.sent == 1 and queue.breaker.trips >= 1
+    assert server.status()['growhub-test'].frames == 1
+
+
+def test_frames_survive_an_outage_and_a_restart(tmp_path, collector):
+    queue = UplinkQueue(str(tmp_path), 'http://127.0.0.1:9/ingest', node='growhub-test', fsync=False)
+    queue.append(1000.0, {'soil.moisture': 650.0})
+    queue.close()
+    assert queue.pending == 1
+    sink = Sink()
+    restarted = uplink_queue(str(tmp_path), collector(sink))
+    assert restarted.pending == 1
+    restarted.start()
+    try:
+        assert restarted.drain(timeout=10.0)
+    finally:
+        restarted.close()
+    assert sink.readings == [('growhub-test', 1000.0, {'soil.moisture': 650.0})]
+
+
+def test_resent_frames_are_acknowledged_without_reaching_the_sink(tmp_path, collector):
+    sink = Sink()
+    server = collector(sink)
+    queue = uplink_queue(str(tmp_path), server)
+    queue.append(1000.0, {'soil.moisture': 650.0})
+    queue.flush()
+    # Keep a copy of the frame, as if its acknowledgement had been lost after delivery
+    frame = next(name for name in os.listdir(tmp_path) if name.endswith('.frame'))
+    shutil.copy(os.path.join(tmp_path, frame), os.path.join(tmp_path, 'lost'))
+    queue.start()
+    try:
+        assert queue.drain(timeout=10.0)
+    finally:
+        queue.close()
+    os.replace(os.path.join(tmp_path, 'lost'), os.path.join(tmp_path, frame))
+    resent = uplink_queue(str(tmp_path), server)
+    resent.start()
+    try:
+        assert resent.drain(timeout=10.0)
+    finally:
+        resent.close()
+    assert len(sink.readings) == 1
+    status = server.status()['growhub-test']
+    assert (status.frames, status.duplicates, status.sequence) == (1, 1, 0)
+
+
+def test_oldest_frames_are_dropped_over_the_disk_budget(tmp_path):
+    queue = UplinkQueue(str(tmp_path), 'http://127.0.0.1:9/ingest', node='growhub-test', fsync=False, max_bytes=1)
+    for second in range(3):
+        queue.append(1000.0 + second, {'soil.moisture': 650.0})
+        queue.flush()
+    # The newest frame is always kept
+    assert (queue.pending, queue.dropped) == (1, 2)
+    assert sorted(name for name in os.listdir(tmp_path) if name.endswith('.frame')) == ['000000000002.frame']
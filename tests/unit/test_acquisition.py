@@ -0,0 +1,95 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: acquisition
+
+Overlapped conversion waits, multiplexer grouping, per-channel errors and channel name checks of AcquisitionEngine.
+"""
+
+
+# Standard library imports
+import time
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from acquisition import AcquisitionEngine
+from backends import SimulatedBackend
+from sensors import SensorAquatic, SensorSoil
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+SensorReadError = APIClient.get_exception('SensorReadError')
+
+
+@pytest.fixture
+def aquatic():
+    """Aquatic sensor on its own simulated bus, with 0.2 s EZO conversions."""
+    sensor = SensorAquatic(backend=SimulatedBackend(seed=1, transaction_delay=0.0, conversion_delay=0.2))
+    sensor.conversion_delay = {'ph': 0.2, 'ec': 0.2}
+    return sensor
+
+
+@pytest.fixture
+def engine(aquatic, atmospheric, soil):
+    """Engine of the three sensor types; its threads are shut down after the test."""
+    engine = AcquisitionEngine([soil, aquatic, atmospheric])
+    assert engine.connect() == {}
+    yield engine
+    engine.close()
+
+
+def test_conversions_are_waited_for_once(engine):
+    start = time.monotonic()
+    snapshot = engine.sweep()
+    elapsed = time.monotonic() - start
+    assert snapshot.ok and snapshot.readings == {
+        'aquatic.ph': 6.2, 'aquatic.ec': 1200.0, 'atmospheric.temperature': 23.5, 'atmospheric.humidity': 55.0,
+        'atmospheric.pressure': 1013.0, 'soil.moisture': 650.0, 'soil.temperature': 21.0}
+    # Both EZO conversions (0.2 s each) overlap instead of adding up
+    assert 0.2 <= elapsed < 0.35
+
+
+def test_reads_are_grouped_by_multiplexer_channel(backend):
+    # Listed across channels; read channel by channel, so each sweep switches once per channel
+    probes = [(5, 0x36), (3, 0x36), (5, 0x37), (3, 0x37), (0, 0x36)]
+    engine = AcquisitionEngine([SensorSoil(backend=backend.channel(0x70, channel), name=f"soil{index}", address=address)
+                                for index, (channel, address) in enumerate(probes)])
+    assert engine.connect() == {}
+    mux = backend.muxes[0x70]
+    try:
+        for _ in range(2):
+            switches = mux.switches
+            snapshot = engine.sweep()
+            assert snapshot.ok and len(snapshot.readings) == 10
+            assert mux.switches - switches == 3
+    finally:
+        engine.close()
+
+
+def test_errors_are_isolated_per_channel(engine, aquatic, backend, soil):
+    backend.devices[soil.address].offline = True
+    aquatic.backend.devices[aquatic.ph_address].offline = True
+    snapshot = engine.sweep()
+    assert set(snapshot.errors) == {'soil.moisture', 'soil.temperature', 'aquatic.ph'}
+    assert all(isinstance(error, SensorReadError) for error in snapshot.errors.values())
+    assert set(snapshot.readings) == {'aquatic.ec', 'atmospheric.temperature', 'atmospheric.humidity',
+                                      'atmospheric.pressure'}
+
+
+def test_failed_atmospheric_trigger_costs_one_transaction_per_sweep(engine, atmospheric, backend):
+    device = backend.devices[atmospheric.address]
+    device.offline = True
+    transactions = device.transactions
+    snapshot = engine.sweep()
+    assert {channel for channel in snapshot.errors if channel.startswith('atmospheric.')} == {
+        'atmospheric.temperature', 'atmospheric.humidity', 'atmospheric.pressure'}
+    assert device.transactions - transactions == 1
+    assert next(iter(atmospheric.breaker_status().values())).failures == 1
+
+
+def test_probes_of_one_type_need_distinct_names(backend):
+    with pytest.raises(CommandArgumentError) as error:
+        AcquisitionEngine([SensorSoil(backend=backend), SensorSoil(backend=backend, address=0x37)])
+    assert error.value.value == ['soil.moisture', 'soil.temperature']
+    engine = AcquisitionEngine([SensorSoil(backend=backend), SensorSoil(backend=backend, name='soil2', address=0x37)])
+    assert len(engine.sensors) == 2
@@ -0,0 +1,61 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: backends
+
+Fake devices, failure injection and driver-free commands and constants of SimulatedBackend.
+"""
+
+
+# Standard library imports
+import sys
+import time
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from backends import FakeEZO, SimulatedBackend
+
+
+def test_ezo_reports_processing_until_the_conversion_is_done(backend):
+    device = backend.add_device(FakeEZO(0x63, conversion_delay=0.05))
+    device.write('R')
+    assert device.read('R').status_code == FakeEZO.STATUS_PROCESSING
+    time.sleep(0.06)
+    response = device.read('R')
+    assert (response.status_code, response.data) == (FakeEZO.STATUS_SUCCESS, b"6.200")
+    # The response is consumed by the first successful read
+    assert device.read('R').status_code == FakeEZO.STATUS_NO_DATA
+
+
+def test_devices_keep_their_state_across_reconnects(backend):
+    device = backend.open_seesaw(0x36)
+    device.offline = True
+    with pytest.raises(OSError):
+        backend.open_seesaw(0x36)
+    device.offline = False
+    assert backend.open_seesaw(0x36) is device
+    with pytest.raises(OSError):
+        backend.open_ezo(0x36)
+
+
+def test_failure_injection_is_reproducible():
+    def failures(seed: int) -> list:
+        device = SimulatedBackend(seed=seed, transaction_delay=0.0, failure_rate=0.5).open_seesaw(0x36)
+        outcomes = []
+        for _ in range(20):
+            try:
+                device.moisture_read()
+                outcomes.append(False)
+            except OSError:
+                outcomes.append(True)
+        return outcomes
+
+    assert failures(7) == failures(7) and any(failures(7)) and not all(failures(7))
+
+
+def test_sensors_run_without_the_driver_packages(atmospheric, backend):
+    commands = backend.ezo_commands()
+    assert commands.Read.format_command() == 'R'
+    assert commands.CalibratePh.format_command('mid') == 'Cal,mid,7.0'
+    assert atmospheric.read_all().temperature == 23.5
+    assert not {'atlas_i2c', 'bme680', 'board', 'adafruit_seesaw'} & set(sys.modules)
@@ -0,0 +1,76 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: breaker
+
+State transitions of CircuitBreaker, and the breakers of a sensor with a dead device.
+"""
+
+
+# Standard library imports
+import time
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+# Codebase imports (API)
+from api_client import APIClient
+SensorConnectionError = APIClient.get_exception('SensorConnectionError')
+SensorReadError = APIClient.get_exception('SensorReadError')
+
+
+def test_opens_after_consecutive_failures_only():
+    breaker = CircuitBreaker('test@0x10', failure_threshold=3, backoff=60.0)
+    breaker.record_failure(OSError('one'))
+    breaker.record_failure(OSError('two'))
+    breaker.record_success()
+    breaker.record_failure(OSError('three'))
+    breaker.record_failure(OSError('four'))
+    assert breaker.state == CLOSED and breaker.allow()
+    breaker.record_failure(OSError('five'))
+    status = breaker.status()
+    assert (status.state, status.trips, status.last_error) == (OPEN, 1, 'five')
+    assert 59.0 < status.retry_in <= 60.0
+    assert not breaker.allow() and breaker.status().rejected == 1
+
+
+def test_half_open_probe_closes_or_doubles_the_backoff():
+    breaker = CircuitBreaker('test@0x10', failure_threshold=1, backoff=0.01, max_backoff=0.03)
+    breaker.record_failure(OSError('down'))
+    time.sleep(0.02)
+    assert breaker.allow() and breaker.state == HALF_OPEN
+    # Only one probe at a time
+    assert not breaker.allow()
+    breaker.record_failure(OSError('still down'))
+    assert (breaker.state, breaker.backoff, breaker.trips) == (OPEN, 0.02, 1)
+    time.sleep(0.03)
+    assert breaker.allow()
+    breaker.record_failure(OSError('still down'))
+    assert breaker.backoff == 0.03
+    time.sleep(0.04)
+    assert breaker.allow()
+    breaker.record_success()
+    assert (breaker.state, breaker.failures, breaker.backoff) == (CLOSED, 0, 0.01)
+
+
+def test_release_retries_a_pending_probe():
+    breaker = CircuitBreaker('test@0x10', failure_threshold=1, backoff=0.01)
+    breaker.record_failure(OSError('down'))
+    time.sleep(0.02)
+    assert breaker.allow()
+    breaker.release()
+    assert breaker.state == OPEN and breaker.status().retry_in == 0.0
+    assert breaker.allow()
+
+
+def test_dead_device_fails_fast_without_bus_transactions(soil, backend):
+    device = backend.devices[soil.address]
+    device.offline = True
+    for _ in range(soil.breaker_policy['failure_threshold']):
+        with pytest.raises(SensorReadError):
+            soil.read_moisture(force_refresh=True)
+    transactions = device.transactions
+    with pytest.raises(SensorConnectionError):
+        soil.read_moisture(force_refresh=True)
+    assert device.transactions == transactions
+    assert soil.breaker_status()[f"soil@0x{soil.address:02x}"].state == OPEN
@@ -0,0 +1,77 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: cache
+
+Max-age, forced refreshes, listener updates and request coalescing of ReadCache.
+"""
+
+
+# Standard library imports
+import threading
+import time
+# Codebase imports (firmware)
+from cache import CacheStats, ReadCache
+
+
+def test_max_age_and_force_refresh():
+    cache = ReadCache({'soil.moisture': 60.0})
+    calls = []
+
+    def loader() -> float:
+        calls.append(None)
+        return float(len(calls))
+
+    assert cache.get('soil.moisture', 'soil', loader) == 1.0
+    assert cache.get('soil.moisture', 'soil', loader) == 1.0
+    assert cache.get('soil.moisture', 'soil', loader, force_refresh=True) == 2.0
+    assert cache.stats()['soil.moisture'] == CacheStats(hits=1, misses=2, coalesced=0)
+
+
+def test_expired_and_uncached_channels_call_the_loader():
+    cache = ReadCache({'soil.moisture': 0.05})
+    cache.append(time.time() - 1.0, {'soil.moisture': 600.0})
+    assert cache.get('soil.moisture', 'soil', lambda: 650.0) == 650.0
+    # Channels without max_age use default_max_age, 0 disables caching
+    assert cache.get('soil.temperature', 'soil', lambda: 21.0) == 21.0
+    assert cache.get('soil.temperature', 'soil', lambda: 22.0) == 22.0
+
+
+def test_append_keeps_the_newest_reading():
+    cache = ReadCache({'aquatic.ph': 60.0})
+    cache.append(100.0, {'aquatic.ph': 6.5})
+    cache.append(50.0, {'aquatic.ph': 5.0})
+    assert cache.latest('aquatic.ph') == (100.0, 6.5)
+    cache.invalidate('aquatic.ph')
+    assert cache.latest('aquatic.ph') is None
+
+
+def test_concurrent_requests_of_a_device_are_coalesced():
+    cache = ReadCache({'aquatic.ph': 60.0})
+    calls = []
+
+    def loader() -> float:
+        calls.append(None)
+        time.sleep(0.05)
+        return 6.2
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(cache.get('aquatic.ph', 'aquatic', loader)))
+               for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == [6.2] * 5 and len(calls) == 1
+    stats = cache.stats()['aquatic.ph']
+    assert stats.misses == 1 and stats.hits + stats.coalesced == 4
+
+
+def test_sensor_reads_are_served_from_the_cache(soil, backend):
+    device = backend.devices[soil.address]
+    soil.read_moisture()
+    transactions = device.transactions
+    soil.read_moisture()
+    assert device.transactions == transactions
+    soil.read_moisture(force_refresh=True)
+    assert device.transactions > transactions
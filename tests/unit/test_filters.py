@@ -0,0 +1,57 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: filters
+
+Outlier rejection, estimators and argument checks of the burst filters, and read_burst() of the sensors.
+"""
+
+
+# Third-party imports (venv)
+import numpy as np
+import pytest
+# Codebase imports (firmware)
+from filters import filter_burst, filter_bursts
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+def test_outliers_are_rejected():
+    reading = filter_burst([6.0, 6.1, 6.0, 6.1, 14.0], method='mean')
+    assert reading.rejected == 1 and reading.value == pytest.approx(6.05)
+    assert reading.quality == pytest.approx(0.8)
+
+
+def test_quantized_channel_with_zero_mad_keeps_its_samples():
+    reading = filter_burst([650.0, 650.0, 650.0, 651.0], method='median')
+    assert reading.value == 650.0 and reading.rejected == 0
+
+
+def test_ema_weighs_the_latest_samples_most():
+    reading = filter_burst([0.0, 10.0], method='ema', mad_threshold=0, ema_alpha=0.5)
+    assert reading.value == pytest.approx(20.0 / 3.0)
+
+
+def test_channels_are_filtered_in_one_batch():
+    values, variances, rejected = filter_bursts(np.array([[1.0, 2.0, 3.0], [np.nan, np.nan, np.nan]]))
+    assert values[0] == 2.0 and variances[0] == 1.0 and rejected[0] == 0
+    # Every read of the second channel failed
+    assert np.isnan(values[1]) and rejected[1] == 3
+
+
+@pytest.mark.parametrize('arguments', [{'method': 'mode'}, {'ema_alpha': 0.0}, {'ema_alpha': 1.5},
+                                       {'mad_threshold': -1.0}])
+def test_invalid_arguments(arguments):
+    with pytest.raises(CommandArgumentError):
+        filter_burst([1.0, 2.0], **arguments)
+
+
+def test_read_burst_validates_before_reading(soil, backend):
+    device = backend.devices[soil.address]
+    transactions = device.transactions
+    with pytest.raises(CommandArgumentError):
+        soil.read_burst(samples=5, method='ema', ema_alpha=0.0)
+    assert device.transactions == transactions
+    bursts = soil.read_burst(samples=4)
+    assert bursts['moisture'].value == 650.0 and bursts['moisture'].samples == 4
@@ -0,0 +1,172 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: i2c_bus
+
+Shared handles, multiplexer switching and driver adapters of I2CBusManager, on a fake smbus2 module.
+"""
+
+
+# Standard library imports
+import sys
+import types
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from i2c_bus import I2CBusManager, _BusioI2C, _timed_bme680
+
+
+class FakeMessage:
+    """Fake smbus2.i2c_msg message; read messages are filled with the responses of the fake bus."""
+
+    def __init__(self, address: int, data: bytes = b"", length: int = 0, read: bool = False) -> None:
+        self.address, self.data, self.length, self.is_read = address, data, length, read
+
+    def __bytes__(self) -> bytes:
+        return self.data
+
+
+class FakeSMBus:
+    """Fake smbus2.SMBus recording every call; reads return the bytes queued in responses[address]."""
+
+    opened = []
+
+    def __init__(self, bus_number: int) -> None:
+        self.bus_number = bus_number
+        self.calls = []
+        self.responses = {}
+        self.fail_writes = 0
+        self.closed = False
+        FakeSMBus.opened.append(self)
+
+    def write_byte(self, address: int, value: int) -> None:
+        if self.fail_writes:
+            self.fail_writes -= 1
+            raise OSError("[Errno 121] Remote I/O error")
+        self.calls.append(('write_byte', address, value))
+
+    def read_byte_data(self, address: int, register: int) -> int:
+        self.calls.append(('read_byte_data', address, register))
+        return 0x61
+
+    def i2c_rdwr(self, *messages: FakeMessage) -> None:
+        for message in messages:
+            if message.is_read:
+                message.data = self.responses.get(message.address, bytes(message.length))[:message.length]
+        self.calls.append(('i2c_rdwr', [(message.address, message.is_read, bytes(message)) for message in messages]))
+
+    def close(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def smbus(monkeypatch):
+    """Installs the fake smbus2 module; returns the list of opened fake handles."""
+    module = types.ModuleType('smbus2')
+    module.SMBus = FakeSMBus
+    module.i2c_msg = types.SimpleNamespace(write=lambda address, data: FakeMessage(address, bytes(data)),
+                                           read=lambda address, length: FakeMessage(address, length=length, read=True))
+    monkeypatch.setitem(sys.modules, 'smbus2', module)
+    FakeSMBus.opened = []
+    return FakeSMBus.opened
+
+
+def test_one_handle_per_bus_shared_by_all_views(smbus):
+    manager = I2CBusManager()
+    manager.view(0x63).write(b"R")
+    smbus_handle = manager.bus(1).handle
+    smbus_handle.responses[0x64] = b"\x011200.0"
+    assert manager.view(0x64).read(7) == b"\x011200.0"
+    assert len(smbus) == 1 and manager.bus(1) is manager.bus(1)
+    assert manager.stats() == {1: 2}
+    manager.close()
+    assert smbus_handle.closed
+    # Reopened on the next transaction
+    manager.view(0x63).write(b"R")
+    assert len(smbus) == 2
+
+
+def test_multiplexer_switches_only_between_channels(smbus):
+    manager = I2CBusManager()
+    for channel in (3, 3, 5, 5, 3):
+        manager.view(0x36, mux=(0x70, channel)).write(b"\x0f\x10")
+    handle = manager.bus(1).handle
+    assert [call for call in handle.calls if call[0] == 'write_byte'] == [
+        ('write_byte', 0x70, 1 << 3), ('write_byte', 0x70, 1 << 5), ('write_byte', 0x70, 1 << 3)]
+    assert manager.mux_stats() == {(1, 0x70): 3}
+    # Switches are bus transactions too
+    assert manager.stats() == {1: 8}
+    with pytest.raises(ValueError):
+        manager.mux(0x70).channel(8)
+
+
+def test_failed_switch_is_retried_by_the_next_transaction(smbus):
+    manager = I2CBusManager()
+    view = manager.view(0x36, mux=(0x70, 2))
+    manager.bus(1).handle.fail_writes = 1
+    with pytest.raises(OSError):
+        view.write(b"\x0f\x10")
+    assert manager.mux(0x70).selected is None
+    view.write(b"\x0f\x10")
+    assert manager.mux(0x70).selected == 2 and manager.mux_stats() == {(1, 0x70): 1}
+
+
+def test_busio_adapter_combines_write_and_read(smbus):
+    manager = I2CBusManager()
+    adapter = _BusioI2C(manager.bus(1))
+    manager.bus(1).handle.responses[0x36] = b"\x02\x8a"
+    buffer = bytearray(2)
+    assert adapter.try_lock()
+    adapter.writeto_then_readfrom(0x36, b"\x0f\x10", buffer)
+    adapter.unlock()
+    assert buffer == b"\x02\x8a"
+    assert manager.bus(1).handle.calls == [('i2c_rdwr', [(0x36, False, b"\x0f\x10"), (0x36, True, b"\x02\x8a")])]
+    assert manager.stats() == {1: 1}
+
+
+def test_drivers_are_opened_on_the_shared_handle(smbus, monkeypatch):
+    class Seesaw:
+        def __init__(self, i2c_bus, addr):
+            self.i2c_bus, self.addr = i2c_bus, addr
+
+    class AtlasI2C:
+        def __init__(self, bus, device_file):
+            self.bus, self.file = bus, device_file
+
+    monkeypatch.setitem(sys.modules, 'adafruit_seesaw.seesaw', types.SimpleNamespace(Seesaw=Seesaw))
+    monkeypatch.setitem(sys.modules, 'atlas_i2c.atlas_i2c', types.SimpleNamespace(AtlasI2C=AtlasI2C))
+    manager = I2CBusManager()
+    first, second = manager.open_seesaw(0x36), manager.open_seesaw(0x36)
+    # A reconnect creates a new driver object on the same bus
+    assert first is not second and first.i2c_bus.bus is second.i2c_bus.bus
+    ezo = manager.open_ezo(0x63)
+    assert ezo.address == 0x63 and ezo.file.write(b"R") == 1
+    assert manager.bus(1).handle.calls == [('i2c_rdwr', [(0x63, False, b"R")])]
+    assert len(smbus) == 1
+
+
+def test_timed_bme680_splits_the_measurement(smbus, monkeypatch):
+    class BME680:
+        def __init__(self, address, i2c_device):
+            self.address, self.i2c_device, self.modes, self.fetches = address, i2c_device, [], 0
+
+        def set_power_mode(self, value, blocking=True):
+            self.modes.append((value, blocking))
+
+        def get_sensor_data(self):
+            # The real driver triggers a measurement before parsing the results
+            self.set_power_mode(driver.FORCED_MODE)
+            self.fetches += 1
+            return self.i2c_device.read_byte_data(self.address, 0x1d) == 0x61
+
+    driver = types.ModuleType('bme680')
+    driver.BME680, driver.FORCED_MODE = BME680, 1
+    monkeypatch.setitem(sys.modules, 'bme680', driver)
+    manager = I2CBusManager()
+    sensor = manager.open_bme680(0x76)
+    assert isinstance(sensor, _timed_bme680(driver))
+    sensor.start_measurement()
+    assert sensor.fetch_measurement() and sensor.get_sensor_data_timed(0.0)
+    # Only start_measurement() triggers; fetching parses the results through the locked shared handle
+    assert sensor.modes == [(1, False), (1, False)] and sensor.fetches == 2
+    assert manager.stats() == {1: 2}
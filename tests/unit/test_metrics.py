@@ -0,0 +1,76 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: metrics
+
+Histograms, multi-source collectors and the Prometheus, JSON and file exports of Metrics.
+"""
+
+
+# Standard library imports
+import json
+import os
+# Codebase imports (firmware)
+from backends import SimulatedBackend
+from i2c_bus import bus_manager
+from metrics import Histogram, Metrics, metrics
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram((0.01, 0.1, 1.0))
+    for value in (0.005, 0.05, 0.05, 0.5, 2.0):
+        histogram.observe(value)
+    assert histogram.cumulative() == [('0.01', 1), ('0.1', 3), ('1.0', 4), ('+Inf', 5)]
+    assert (histogram.quantile(0.5), histogram.quantile(0.99)) == (0.1, float('inf'))
+
+
+def test_collectors_of_several_sources_are_summed():
+    registry = Metrics()
+    registry.register_collector('growhub_test_total', "Test counter.", ('bus',), lambda: {('1',): 5, ('2',): 1},
+                                source='i2c_bus')
+    registry.register_collector('growhub_test_total', "Test counter.", ('bus',), lambda: {('1',): 2, ('sim',): 3},
+                                source='simulated')
+    # Registering a source again replaces its collector
+    registry.register_collector('growhub_test_total', "Test counter.", ('bus',), lambda: {('1',): 4, ('sim',): 3},
+                                source='simulated')
+    assert registry.snapshot()['collectors']['growhub_test_total'] == [
+        {'bus': '1', 'value': 9}, {'bus': '2', 'value': 1}, {'bus': 'sim', 'value': 3}]
+
+
+def test_prometheus_export():
+    registry = Metrics()
+    registry.record_read('soil', 'moisture', 0.004)
+    registry.record_error('soil', 'moisture', OSError("Remote I/O error"))
+    registry.register_collector('growhub_test_open', "Test gauge.", ('device',), lambda: {('soil@0x36',): 1},
+                                metric_type='gauge')
+    lines = registry.to_prometheus().splitlines()
+    assert 'growhub_sensor_read_seconds_bucket{sensor="soil",channel="moisture",le="0.0025"} 0' in lines
+    assert 'growhub_sensor_read_seconds_bucket{sensor="soil",channel="moisture",le="+Inf"} 1' in lines
+    assert 'growhub_sensor_read_seconds_count{sensor="soil",channel="moisture"} 1' in lines
+    assert 'growhub_sensor_errors_total{sensor="soil",channel="moisture",exception="OSError"} 1' in lines
+    assert lines[-3:] == ['# HELP growhub_test_open Test gauge.', '# TYPE growhub_test_open gauge',
+                          'growhub_test_open{device="soil@0x36"} 1']
+
+
+def test_json_and_file_export(tmp_path):
+    registry = Metrics()
+    registry.record_read('aquatic', 'ph', 0.9)
+    registry.record_read('aquatic', 'ph', 0.95)
+    read = json.loads(registry.to_json())['reads'][0]
+    assert (read['sensor'], read['channel'], read['count'], read['p50_seconds']) == ('aquatic', 'ph', 2, 1.0)
+    registry.write_files(str(tmp_path))
+    assert sorted(os.listdir(tmp_path)) == ['growhub.json', 'growhub.prom']
+    registry.reset()
+    assert registry.snapshot()['reads'] == []
+
+
+def test_bus_collectors_are_registered_once_per_source():
+    backends = [SimulatedBackend(transaction_delay=0.0) for _ in range(2)]
+    for backend in backends:
+        backend.open_seesaw(0x36).moisture_read()
+    bus_manager.bus(7).transaction(lambda: None)
+    lines = metrics.to_prometheus().splitlines()
+    assert lines.count('# TYPE growhub_i2c_transactions_total counter') == 1
+    samples = [line for line in lines if line.startswith('growhub_i2c_transactions_total{')]
+    assert 'growhub_i2c_transactions_total{bus="7"} 1' in samples
+    assert len([line for line in samples if 'bus="simulated"' in line]) == 1
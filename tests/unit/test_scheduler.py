@@ -0,0 +1,64 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: scheduler
+
+Deadband forwarding, adaptive intervals, heartbeats and policy checks of AdaptiveScheduler.
+"""
+
+
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from scheduler import AdaptiveScheduler
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+def test_steady_channels_back_off_and_are_not_forwarded_again(soil):
+    scheduler = AdaptiveScheduler([soil], policies={'soil.moisture': {'heartbeat': 1000.0},
+                                                    'soil.temperature': {'heartbeat': 1000.0}})
+    received = []
+    scheduler.add_listener(lambda timestamp, readings: received.append(readings))
+    assert scheduler.poll(now=0.0) == {'soil.moisture': 650.0, 'soil.temperature': 21.0}
+    assert scheduler.next_due() == 10.0 and scheduler.poll(now=5.0) == {}
+    assert scheduler.poll(now=10.0) == {}
+    stats = scheduler.stats()['soil.moisture']
+    assert (stats.samples, stats.forwarded) == (2, 1)
+    # A steady channel doubles its interval per sample
+    assert stats.interval == 20.0 and scheduler.next_due() == 30.0
+    assert received == [{'soil.moisture': 650.0, 'soil.temperature': 21.0}]
+
+
+def test_changes_beyond_the_deadband_are_forwarded(soil, backend):
+    scheduler = AdaptiveScheduler([soil], policies={'soil.moisture': {'deadband': 5.0}})
+    device = backend.devices[soil.address]
+    scheduler.poll(now=0.0)
+    device.moisture = 653.0
+    assert 'soil.moisture' not in scheduler.poll(now=10.0)
+    device.moisture = 700.0
+    assert scheduler.poll(now=30.0)['soil.moisture'] == 700.0
+
+
+def test_heartbeat_forwards_unchanged_readings(soil):
+    scheduler = AdaptiveScheduler([soil], policies={'soil.moisture': {'heartbeat': 8.0, 'max_interval': 60.0}})
+    scheduler.poll(now=0.0)
+    assert scheduler.poll(now=5.0) == {}
+    # The next sample is due at the heartbeat, not after the doubled interval
+    assert scheduler.next_due() == 8.0
+    assert scheduler.poll(now=8.0) == {'soil.moisture': 650.0}
+
+
+def test_failed_reads_are_retried_after_the_minimum_interval(soil, backend):
+    scheduler = AdaptiveScheduler([soil])
+    backend.devices[soil.address].offline = True
+    assert scheduler.poll(now=0.0) == {}
+    assert scheduler.stats()['soil.moisture'].errors == 1 and scheduler.next_due() == 5.0
+
+
+@pytest.mark.parametrize('policy', [{'deadband': -1.0}, {'min_interval': 10.0, 'max_interval': 5.0},
+                                    {'heartbeat': 0.0}, {'interval': 5.0}])
+def test_invalid_policies(soil, policy):
+    with pytest.raises(CommandArgumentError):
+        AdaptiveScheduler([soil], policies={'soil.moisture': policy})
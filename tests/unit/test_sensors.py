@@ -0,0 +1,198 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: sensors
+
+Listeners, atmospheric profiles and split reads, aquatic compensation and streaming, on the simulated bus.
+"""
+
+
+# Standard library imports
+import time
+# Third-party imports (venv)
+import pytest
+# Codebase imports (firmware)
+from backends import SimulatedBackend
+from sensors import ATMOSPHERIC_PROFILES, AtmosphericProfile, SensorAquatic, SensorAtmospheric, SensorBase
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+SensorReadError = APIClient.get_exception('SensorReadError')
+
+
+@pytest.fixture
+def aquatic():
+    """Connected aquatic sensor with shortened EZO conversions; streaming is stopped after the test."""
+    sensor = SensorAquatic(backend=SimulatedBackend(seed=1, transaction_delay=0.0, conversion_delay=0.005))
+    sensor.conversion_delay = {'ph': 0.01, 'ec': 0.01}
+    sensor.connect()
+    yield sensor
+    sensor.stop_streaming()
+
+
+def test_sensor_base_requires_the_bus_hooks():
+    with pytest.raises(TypeError):
+        SensorBase()
+
+
+def test_listeners_receive_every_read(soil):
+    received = []
+    soil.add_listener(lambda timestamp, readings: received.append(readings))
+    soil.read_all()
+    soil.read_temperature(force_refresh=True)
+    assert received == [{'soil.moisture': 650.0, 'soil.temperature': 21.0}, {'soil.temperature': 21.0}]
+
+
+def test_profile_durations_follow_the_bosch_timing():
+    durations = {name: profile.duration for name, profile in ATMOSPHERIC_PROFILES.items()}
+    assert durations == {'fast': 0.011, 'balanced': 0.033, 'precise': 0.1}
+    assert AtmosphericProfile('OS_NONE', 'OS_NONE', 'OS_2X', 'FILTER_SIZE_0').duration == 0.009
+
+
+@pytest.mark.parametrize('profile', ['turbo', AtmosphericProfile('OS_3X', 'OS_1X', 'OS_1X', 'FILTER_SIZE_0'),
+                                     AtmosphericProfile('OS_1X', 'OS_1X', 'OS_1X', 'OS_1X')])
+def test_invalid_profiles_are_rejected(profile, atmospheric):
+    with pytest.raises(CommandArgumentError):
+        SensorAtmospheric(profile=profile)
+    with pytest.raises(CommandArgumentError):
+        atmospheric.set_profile(profile)
+    assert atmospheric.profile == ATMOSPHERIC_PROFILES['fast']
+
+
+def test_set_profile_reconfigures_a_connected_sensor(atmospheric, backend):
+    device = backend.devices[atmospheric.address]
+    fast_duration = device.measurement_duration
+    atmospheric.set_profile('precise')
+    assert device.settings == {'temperature_oversample': 5, 'humidity_oversample': 5, 'pressure_oversample': 5,
+                               'filter': 3, 'gas': 0}
+    assert device.measurement_duration == pytest.approx(fast_duration * 100 / 11)
+    # A disconnected sensor applies its profile on the next setup()
+    sensor = SensorAtmospheric(backend=backend, address=0x77)
+    sensor.set_profile(AtmosphericProfile('OS_2X', 'OS_1X', 'OS_1X', 'FILTER_SIZE_1'))
+    sensor.connect()
+    sensor.setup()
+    assert backend.devices[0x77].settings['temperature_oversample'] == 2
+
+
+def test_split_atmospheric_read_serves_one_measurement(atmospheric, backend):
+    device = backend.devices[atmospheric.address]
+    transactions = device.transactions
+    atmospheric.start_read('temperature')
+    time.sleep(atmospheric.conversion_delay['temperature'])
+    values = [atmospheric.finish_read(data_type) for data_type in ('temperature', 'humidity', 'pressure')]
+    assert values == [23.5, 55.0, 1013.0] and device.transactions - transactions == 2
+    # Once collected, the measurement is not served again: a finish_read() without start_read() reads anew
+    device.temperature = 25.0
+    assert atmospheric.finish_read('temperature') == 25.0 and device.transactions - transactions == 4
+
+
+def test_failed_atmospheric_measurement_fails_the_whole_sweep(atmospheric, backend):
+    device = backend.devices[atmospheric.address]
+    atmospheric.start_read('temperature')
+    device.offline = True
+    transactions = device.transactions
+    errors = []
+    for data_type in ('temperature', 'humidity', 'pressure'):
+        with pytest.raises(SensorReadError) as error:
+            atmospheric.finish_read(data_type)
+        errors.append(error.value)
+    # One fetch attempt and one breaker failure, the same error for every field
+    assert device.transactions - transactions == 1
+    assert errors[0] is errors[1] is errors[2]
+    assert next(iter(atmospheric.breaker_status().values())).failures == 1
+
+
+def test_failed_atmospheric_trigger_fails_the_whole_sweep(atmospheric, backend):
+    device = backend.devices[atmospheric.address]
+    device.offline = True
+    transactions = device.transactions
+    with pytest.raises(SensorReadError) as error:
+        atmospheric.start_read('temperature')
+    # The other parameters join the failed trigger and raise its error
+    atmospheric.start_read('humidity')
+    atmospheric.start_read('pressure')
+    for data_type in ('humidity', 'pressure'):
+        with pytest.raises(SensorReadError) as other:
+            atmospheric.finish_read(data_type)
+        assert other.value is error.value
+    assert device.transactions - transactions == 1
+    assert next(iter(atmospheric.breaker_status().values())).failures == 1
+    # The next sweep triggers again
+    device.offline = False
+    atmospheric.start_read('temperature')
+    assert atmospheric.finish_read('temperature') == 23.5
+
+
+def record_commands(device) -> list:
+    """Returns the list of the commands written to a fake EZO circuit from now on."""
+    commands, write = [], device.write
+    device.write = lambda command: (commands.append(command), write(command))[1]
+    return commands
+
+
+def test_compensation_is_sent_with_the_read_when_due(aquatic):
+    device = aquatic.backend.devices[aquatic.ph_address]
+    commands = record_commands(device)
+    aquatic.update_temperature(21.04)
+    aquatic.read_ph(force_refresh=True)
+    assert commands == ['RT,21.0'] and device.temperature == 21.0
+    assert aquatic.compensation == {'ph': 21.0, 'ec': None}
+    # Below the 0.5 degree threshold the circuit keeps its temperature
+    aquatic.update_temperature(21.4)
+    aquatic.read_ph(force_refresh=True)
+    aquatic.update_temperature(21.5)
+    aquatic.read_ph(force_refresh=True)
+    assert commands == ['RT,21.0', 'R', 'RT,21.5'] and device.temperature == 21.5
+
+
+def test_stale_temperatures_are_not_sent(aquatic):
+    commands = record_commands(aquatic.backend.devices[aquatic.ph_address])
+    aquatic.update_temperature(30.0, time.time() - aquatic.compensation_max_age - 1)
+    aquatic.read_ph(force_refresh=True)
+    assert commands == ['R'] and aquatic.compensation == {'ph': None, 'ec': None}
+
+
+def test_compensation_is_held_only_after_a_successful_read(aquatic):
+    commands = record_commands(aquatic.backend.devices[aquatic.ph_address])
+    aquatic.update_temperature(21.0)
+    aquatic.start_read('ph')
+    # Read before the conversion is done: 'still processing'
+    with pytest.raises(SensorReadError):
+        aquatic.finish_read('ph')
+    assert aquatic.compensation['ph'] is None
+    aquatic.read_ph(force_refresh=True)
+    assert commands == ['RT,21.0', 'RT,21.0'] and aquatic.compensation['ph'] == 21.0
+    # A reconnected circuit may have been power cycled: the temperature is sent again
+    aquatic.connect()
+    assert aquatic.compensation == {'ph': None, 'ec': None}
+    aquatic.read_ph(force_refresh=True)
+    assert commands[-1] == 'RT,21.0'
+
+
+def test_streamed_readings_expire(aquatic):
+    aquatic.stream_max_age = 0.2
+    aquatic.start_streaming()
+    _, reading = next(aquatic.stream(timeout=2.0))
+    assert reading.ph == aquatic.read_ph() and aquatic.read_all() == reading
+    for device in aquatic.backend.devices.values():
+        device.offline = True
+    time.sleep(0.4)
+    with pytest.raises(SensorReadError) as error:
+        aquatic.read_all()
+    # The last streaming error is raised, not the open circuit breaker
+    assert 'Remote I/O error' in str(error.value)
+
+
+def test_streaming_waits_out_an_open_breaker(aquatic):
+    aquatic.start_streaming()
+    next(aquatic.stream(timeout=2.0))
+    device = aquatic.backend.devices[aquatic.ph_address]
+    device.offline = True
+    time.sleep(0.3)
+    transactions = device.transactions
+    status = aquatic.breaker_status()[f"aquatic@0x{aquatic.ph_address:02x}"]
+    assert status.state == 'open'
+    time.sleep(0.5)
+    # No calls against the open breaker until its reconnect probe is due
+    assert device.transactions == transactions
+    assert aquatic.breaker_status()[f"aquatic@0x{aquatic.ph_address:02x}"].rejected == 0
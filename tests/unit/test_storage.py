@@ -0,0 +1,85 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: storage
+
+Segment rollover at UTC midnight, memory-mapped range scans, reopening and crash recovery of ReadingLog.
+"""
+
+
+# Standard library imports
+import os
+import time
+# Third-party imports (venv)
+import numpy as np
+# Codebase imports (firmware)
+from storage import RECORD_DTYPE, ReadingLog
+
+
+# 2024-01-01T00:00:00Z
+MIDNIGHT = 1704067200.0
+
+
+def test_segments_roll_over_at_utc_midnight(tmp_path):
+    log = ReadingLog(str(tmp_path), fsync=False)
+    log.append(MIDNIGHT - 10, {'aquatic.ph': 6.1})
+    log.append(MIDNIGHT + 10, {'aquatic.ph': 6.2})
+    log.flush()
+    assert sorted(os.listdir(tmp_path)) == ['2023-12-31.dat', '2023-12-31.idx', '2024-01-01.dat', '2024-01-01.idx',
+                                            'channels.json']
+    timestamps, values = log.query('aquatic.ph', start=MIDNIGHT - 60, end=MIDNIGHT + 60)
+    assert timestamps.tolist() == [MIDNIGHT - 10, MIDNIGHT + 10]
+    assert values.tolist() == [6.1, 6.2]
+
+
+def test_scan_reads_only_the_requested_range_and_channels(tmp_path):
+    log = ReadingLog(str(tmp_path), fsync=False)
+    for block in range(3):
+        for second in range(10):
+            timestamp = MIDNIGHT + block * 100 + second
+            log.append(timestamp, {'aquatic.ph': float(timestamp), 'aquatic.ec': 1200.0})
+        log.flush()
+    blocks = list(log.scan(['aquatic.ph'], start=MIDNIGHT + 105, end=MIDNIGHT + 204))
+    # The first block lies outside the range and is not yielded
+    assert len(blocks) == 2
+    records = np.concatenate(blocks)
+    assert records.dtype == RECORD_DTYPE
+    assert records['timestamp'].min() == MIDNIGHT + 105 and records['timestamp'].max() == MIDNIGHT + 204
+    assert set(records['value'].tolist()) == set(records['timestamp'].tolist())
+    assert list(log.scan(['unknown'], start=0, end=MIDNIGHT + 1000)) == []
+
+
+def test_reopened_log_keeps_channels_and_records(tmp_path):
+    log = ReadingLog(str(tmp_path), fsync=False)
+    log.append(MIDNIGHT, {'soil.moisture': 650.0, 'soil.temperature': 21.0})
+    log.close()
+    reopened = ReadingLog(str(tmp_path), fsync=False)
+    assert reopened.channels == ('soil.moisture', 'soil.temperature')
+    assert reopened.query('soil.temperature', start=0, end=MIDNIGHT + 1)[1].tolist() == [21.0]
+
+
+def test_recovery_indexes_an_unindexed_tail_and_drops_a_torn_record(tmp_path):
+    log = ReadingLog(str(tmp_path), fsync=False)
+    log.append(MIDNIGHT, {'aquatic.ph': 6.0})
+    log.flush()
+    # A crash between the data and the index write, in the middle of the next record
+    tail = np.array([(MIDNIGHT + 1, 0, 6.5), (MIDNIGHT + 2, 0, 7.0)], dtype=RECORD_DTYPE).tobytes()
+    with open(os.path.join(tmp_path, '2024-01-01.dat'), 'ab') as file:
+        file.write(tail[:RECORD_DTYPE.itemsize + 5])
+    recovered = ReadingLog(str(tmp_path), fsync=False)
+    assert recovered.query('aquatic.ph', start=0, end=MIDNIGHT + 10)[1].tolist() == [6.0, 6.5]
+
+
+def test_background_flush_writes_full_batches(tmp_path):
+    log = ReadingLog(str(tmp_path), flush_interval=60.0, batch_size=4, fsync=False)
+    log.start()
+    try:
+        log.append(MIDNIGHT, {'aquatic.ph': 6.0, 'aquatic.ec': 1200.0})
+        log.append(MIDNIGHT + 1, {'aquatic.ph': 6.1, 'aquatic.ec': 1210.0})
+        for _ in range(200):
+            if os.path.exists(os.path.join(tmp_path, '2024-01-01.idx')):
+                break
+            time.sleep(0.01)
+        assert log.query('aquatic.ec', start=0, end=MIDNIGHT + 10)[1].tolist() == [1200.0, 1210.0]
+    finally:
+        log.close()
@@ -0,0 +1,82 @@
+# GrowHub | https://github.com/Filip-Vallo/GrowHub/ | /tests/unit/ | Python 3.9.19
+
+"""
+GrowHub tests: timeseries
+
+Ring buffer wraparound, windows, summaries and downsampling rollups of TimeSeriesBuffer.
+"""
+
+
+# Third-party imports (venv)
+import numpy as np
+import pytest
+# Codebase imports (firmware)
+from timeseries import TimeSeriesBuffer
+# Codebase imports (API)
+from api_client import APIClient
+CommandArgumentError = APIClient.get_exception('CommandArgumentError')
+
+
+def test_wraparound_keeps_the_latest_samples_in_order():
+    history = TimeSeriesBuffer(capacity=4)
+    for second in range(10):
+        history.append(float(second), {'soil.moisture': second * 10.0})
+    timestamps, values = history.window('soil.moisture', 100, now=9.0)
+    assert timestamps.tolist() == [6.0, 7.0, 8.0, 9.0]
+    assert values.tolist() == [60.0, 70.0, 80.0, 90.0]
+    assert history.latest('soil.moisture') == (9.0, 90.0)
+
+
+def test_window_is_copied_and_bounded():
+    history = TimeSeriesBuffer(capacity=8)
+    for second in range(5):
+        history.append(float(second), {'aquatic.ph': 6.0 + second})
+    timestamps, values = history.window('aquatic.ph', 2, now=4.0)
+    # (now - span, now]: the sample at exactly now - span is excluded
+    assert timestamps.tolist() == [3.0, 4.0]
+    history.append(5.0, {'aquatic.ph': 11.0})
+    assert values.tolist() == [9.0, 10.0]
+    assert history.window('unknown', 10, now=4.0)[0].size == 0
+
+
+def test_summary_over_window():
+    history = TimeSeriesBuffer(capacity=16)
+    for second, value in enumerate((1.0, 5.0, 3.0)):
+        history.append(float(second), {'atmospheric.temperature': value})
+    summary = history.summary('atmospheric.temperature', window=10, now=2.0)
+    assert (summary.minimum, summary.maximum, summary.mean, summary.count) == (1.0, 5.0, 3.0, 3)
+    empty = history.summary('atmospheric.temperature', window='1m', now=1000.0)
+    assert empty.count == 0 and np.isnan(empty.mean)
+
+
+def test_rollup_buckets_are_aligned_and_skip_empty_buckets():
+    history = TimeSeriesBuffer(capacity=64)
+    for second in (0, 1, 2, 10, 11, 30):
+        history.append(float(second), {'soil.temperature': float(second)})
+    rollup = history.rollup('soil.temperature', span=25, resolution=10, now=30.0)
+    assert rollup.timestamp.tolist() == [10.0, 30.0]
+    assert rollup.count.tolist() == [2, 1]
+    assert rollup.minimum.tolist() == [10.0, 30.0]
+    assert rollup.maximum.tolist() == [11.0, 30.0]
+    assert rollup.mean.tolist() == [10.5, 30.0]
+
+
+def test_rollup_after_wraparound():
+    history = TimeSeriesBuffer(capacity=5)
+    for second in range(12):
+        history.append(float(second), {'soil.moisture': float(second)})
+    rollup = history.rollup('soil.moisture', span=100, resolution=5, now=11.0)
+    assert rollup.timestamp.tolist() == [5.0, 10.0]
+    assert rollup.count.tolist() == [3, 2]
+    assert rollup.mean.tolist() == [8.0, 10.5]
+
+
+def test_invalid_arguments():
+    with pytest.raises(CommandArgumentError):
+        TimeSeriesBuffer(capacity=0)
+    history = TimeSeriesBuffer(capacity=4)
+    history.append(0.0, {'soil.moisture': 1.0})
+    with pytest.raises(CommandArgumentError):
+        history.rollup('soil.moisture', span=10, resolution=0, now=0.0)
+    with pytest.raises(CommandArgumentError):
+        history.summary('soil.moisture', window='1y')